@@ -7,14 +7,17 @@ Backstage templates. It uses the template_plugin module to handle template opera
 
 from fastapi import FastAPI, HTTPException, Query, Depends, Path, Body
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from typing import List, Optional
 import os
 import logging
 import sys
-from model import CloudProvider, TemplateType, TemplateList, Template, TemplateTask, TemplateTaskResponse
+from model import CloudProvider, TemplateType, TemplateList, Template, TemplateTask, TemplateTaskResponse, TemplateBatchRequest, TemplateBatchResponse
 # Import the template plugin
 from template_plugin import TemplatePlugin
 from template_plugin.config.config import load_config
+from template_plugin.errors.exceptions import TemplateValidationError, TemplateNotFoundError, ConnectionError
+from template_plugin.utils.archive_utils import ARCHIVE_FORMATS, content_disposition
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -51,6 +54,28 @@ if os.getenv("LOCAL_TEMPLATES_DIR"):
     config.local.templates_dir = os.getenv("LOCAL_TEMPLATES_DIR")
 if os.getenv("LOCAL_CATALOG_FILE"):
     config.local.catalog_file = os.getenv("LOCAL_CATALOG_FILE")
+if os.getenv("LOCAL_OUTPUT_DIR"):
+    config.local.output_dir = os.getenv("LOCAL_OUTPUT_DIR")
+if os.getenv("LOCAL_INDEX_DB_PATH"):
+    config.local.index_db_path = os.getenv("LOCAL_INDEX_DB_PATH")
+if os.getenv("LOCAL_PARSE_WORKERS"):
+    config.local.parse_workers = int(os.getenv("LOCAL_PARSE_WORKERS"))
+if os.getenv("LOCAL_LAZY_LOAD"):
+    config.local.lazy_load = os.getenv("LOCAL_LAZY_LOAD").lower() == "true"
+if os.getenv("LOCAL_YAML_CACHE_MAX_BYTES"):
+    config.local.yaml_cache_max_bytes = int(os.getenv("LOCAL_YAML_CACHE_MAX_BYTES"))
+if os.getenv("LOCAL_TEMPLATE_CACHE_MAX_ENTRIES"):
+    config.local.template_cache_max_entries = int(os.getenv("LOCAL_TEMPLATE_CACHE_MAX_ENTRIES"))
+if os.getenv("LOCAL_TEMPLATE_BYTECODE_CACHE_DIR"):
+    config.local.template_bytecode_cache_dir = os.getenv("LOCAL_TEMPLATE_BYTECODE_CACHE_DIR")
+if os.getenv("LOCAL_RENDER_WORKERS"):
+    config.local.render_workers = int(os.getenv("LOCAL_RENDER_WORKERS"))
+if os.getenv("LOCAL_SKELETON_HARDLINKS"):
+    config.local.skeleton_hardlinks = os.getenv("LOCAL_SKELETON_HARDLINKS").lower() == "true"
+if os.getenv("LOCAL_RENDER_PLAN_CACHE_SIZE"):
+    config.local.render_plan_cache_size = int(os.getenv("LOCAL_RENDER_PLAN_CACHE_SIZE"))
+if os.getenv("LOCAL_SNAPSHOT_FILE"):
+    config.local.snapshot_file = os.getenv("LOCAL_SNAPSHOT_FILE")
 if os.getenv("BACKSTAGE_ENABLED"):
     config.backstage_enabled = os.getenv("BACKSTAGE_ENABLED").lower() == "true"
 if os.getenv("LOCAL_ENABLED"):
@@ -63,6 +88,7 @@ logger.info(f"Starting Backstage Templates API with configuration:")
 logger.info(f"BACKSTAGE_BASE_URL: {config.backstage.base_url}")
 logger.info(f"LOCAL_TEMPLATES_DIR: {config.local.templates_dir}")
 logger.info(f"LOCAL_CATALOG_FILE: {config.local.catalog_file}")
+logger.info(f"LOCAL_SNAPSHOT_FILE: {config.local.snapshot_file}")
 logger.info(f"BACKSTAGE_ENABLED: {config.backstage_enabled}")
 logger.info(f"LOCAL_ENABLED: {config.local_enabled}")
 logger.info(f"DEFAULT_CLIENT: {config.default_client}")
@@ -75,6 +101,17 @@ def get_template_plugin():
     """Dependency to get the template plugin instance."""
     return template_plugin
 
+@app.on_event("shutdown")
+async def shutdown_template_plugin():
+    """Release pooled connections held by the template clients."""
+    logger.info("Shutting down template plugin")
+    await template_plugin.aclose()
+
+def _service_unavailable(e: ConnectionError) -> HTTPException:
+    """Map a Backstage connection failure or open circuit breaker to a 503 response."""
+    logger.error(f"Template source unavailable: {str(e)}")
+    return HTTPException(status_code=503, detail=f"Template source unavailable: {str(e)}")
+
 # Routes
 @app.get("/", tags=["Health"])
 async def health_check():
@@ -89,37 +126,87 @@ async def list_templates(
     tag: Optional[List[str]] = Query(None, description="Filter by tags (multiple allowed)"),
     owner: Optional[str] = Query(None, description="Filter by owner"),
     search: Optional[str] = Query(None, description="Search in name and description"),
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="Maximum number of templates to return"),
+    offset: Optional[int] = Query(None, ge=0, description="Number of templates to skip (ignored with a cursor)"),
+    cursor: Optional[str] = Query(None, description="Cursor of the page to fetch, as returned in next_cursor"),
+    sort: Optional[str] = Query(None, description="Sort by name, title, type or owner; prefix with '-' for descending order"),
     client_name: Optional[str] = Query(None, description="Name of the client to use"),
     plugin: TemplatePlugin = Depends(get_template_plugin)
 ):
     """
-    List all available templates with optional filtering.
+    List all available templates with optional filtering, sorting and pagination.
+    
+    When more templates match than fit in the page, next_cursor holds the cursor
+    of the following page; pass it back with the same filters and sort.
+    total_count is omitted when the client cannot count the matches without
+    fetching every page.
     """
-    logger.info(f"List templates called with filters: cloud_provider={cloud_provider}, template_type={template_type}, tag={tag}, owner={owner}, search={search}, client={client_name}")
+    logger.info(f"List templates called with filters: cloud_provider={cloud_provider}, template_type={template_type}, tag={tag}, owner={owner}, search={search}, limit={limit}, offset={offset}, sort={sort}, client={client_name}")
     
     try:
-        templates_data = plugin.list_templates(
+        templates_data = await plugin.alist_templates(
             cloud_provider=cloud_provider.value if cloud_provider else None,
             template_type=template_type.value if template_type else None,
             tags=tag,
             owner=owner,
             search=search,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            sort=sort,
             client_name=client_name
         )
         
         # Convert from plugin's data format to API response format
         templates_list = TemplateList(
             items=templates_data.get("items", []),
-            total_count=templates_data.get("total_count", 0)
+            total_count=templates_data.get("total_count"),
+            next_cursor=templates_data.get("next_cursor")
         )
         
-        logger.info(f"Returning {templates_list.total_count} templates after filtering")
+        logger.info(f"Returning {len(templates_list.items)} of {templates_list.total_count} templates after filtering")
         return templates_list
         
+    except TemplateValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except ConnectionError as e:
+        raise _service_unavailable(e)
     except Exception as e:
         logger.error(f"Error listing templates: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to list templates: {str(e)}")
 
+@app.post("/templates/batch", response_model=TemplateBatchResponse, tags=["Templates"])
+async def get_templates_batch(
+    request: TemplateBatchRequest = Body(..., description="Names of the templates to fetch"),
+    client_name: Optional[str] = Query(None, description="Name of the client to use"),
+    plugin: TemplatePlugin = Depends(get_template_plugin)
+):
+    """
+    Get several templates by name in a single request.
+    
+    Names that do not match a template are listed in not_found instead of failing the request.
+    At most 500 names are accepted per request.
+    """
+    logger.info(f"Batch get templates called for {len(request.names)} names")
+    
+    try:
+        templates_data = await plugin.aget_templates(
+            template_names=request.names,
+            client_name=client_name
+        )
+        
+        return TemplateBatchResponse(
+            items=templates_data.get("items", []),
+            total_count=templates_data.get("total_count", 0),
+            not_found=templates_data.get("not_found", [])
+        )
+        
+    except ConnectionError as e:
+        raise _service_unavailable(e)
+    except Exception as e:
+        logger.error(f"Error getting templates: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to get templates: {str(e)}")
+
 @app.get("/templates/{template_name}", response_model=Template, tags=["Templates"])
 async def get_template(
     template_name: str,
@@ -132,7 +219,7 @@ async def get_template(
     logger.info(f"Get template called for: {template_name}")
     
     try:
-        template_data = plugin.get_template(
+        template_data = await plugin.aget_template(
             template_name=template_name,
             client_name=client_name
         )
@@ -141,6 +228,8 @@ async def get_template(
         template = Template.parse_obj(template_data)
         return template
         
+    except ConnectionError as e:
+        raise _service_unavailable(e)
     except Exception as e:
         logger.error(f"Error getting template: {str(e)}")
         raise HTTPException(status_code=404, detail=f"Template '{template_name}' not found")
@@ -197,7 +286,7 @@ async def execute_template(
         logger.info(f"S3 download enabled")
     
     try:
-        task_response = plugin.execute_template(
+        task_response = await plugin.aexecute_template(
             template_name=template_name,
             parameters=task_request.parameters,
             dry_run=task_request.dry_run,
@@ -221,10 +310,56 @@ async def execute_template(
             
         return task_response
         
+    except ConnectionError as e:
+        raise _service_unavailable(e)
     except Exception as e:
         logger.error(f"Error executing template: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to execute template: {str(e)}")
 
+@app.post("/templates/{template_name}/archive", tags=["Templates"])
+async def render_template_archive(
+    template_name: str = Path(..., description="Name of the template to render"),
+    task_request: TemplateTask = Body(..., description="Template parameters"),
+    archive_format: str = Query("zip", alias="format", description="Archive format: zip, tar or tar.gz"),
+    client_name: Optional[str] = Query(None, description="Name of the client to use"),
+    plugin: TemplatePlugin = Depends(get_template_plugin)
+):
+    """
+    Render a template and download the result as an archive.
+    
+    The skeleton is rendered straight into the archive stream, without an
+    output directory, so the download starts before rendering finishes. A
+    rendering error after the download started ends it early.
+    """
+    logger.info(f"Rendering template archive: {template_name} with parameters: {task_request.parameters}, format: {archive_format}, client: {client_name}")
+    
+    if archive_format not in ARCHIVE_FORMATS:
+        raise HTTPException(status_code=400, detail=f"Unsupported archive format: {archive_format}")
+    
+    try:
+        chunks = await plugin.arender_template_archive(
+            template_name=template_name,
+            parameters=task_request.parameters,
+            archive_format=archive_format,
+            client_name=client_name
+        )
+    except TemplateNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except TemplateValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except ConnectionError as e:
+        raise _service_unavailable(e)
+    except Exception as e:
+        logger.error(f"Error rendering template archive: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to render template archive: {str(e)}")
+    
+    # The iterator is synchronous, so Starlette consumes it in its thread pool
+    return StreamingResponse(
+        chunks,
+        media_type=ARCHIVE_FORMATS[archive_format],
+        headers={"Content-Disposition": content_disposition(f"{template_name}.{archive_format}")}
+    )
+
 @app.get("/templates/{template_name}/parameters", tags=["Templates"])
 async def get_template_parameters(
     template_name: str,
@@ -240,13 +375,15 @@ async def get_template_parameters(
     logger.info(f"Getting parameters for template: {template_name}, client: {client_name}")
     
     try:
-        parameters_data = plugin.get_template_parameters(
+        parameters_data = await plugin.aget_template_parameters(
             template_name=template_name,
             client_name=client_name
         )
         
         return parameters_data
         
+    except ConnectionError as e:
+        raise _service_unavailable(e)
     except Exception as e:
         logger.error(f"Error getting template parameters: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to get template parameters: {str(e)}")
@@ -265,13 +402,15 @@ async def get_task_status(
     logger.info(f"Getting status for task: {task_id}, client: {client_name}")
     
     try:
-        task_status = plugin.get_task_status(
+        task_status = await plugin.aget_task_status(
             task_id=task_id,
             client_name=client_name
         )
         
         return task_status
         
+    except ConnectionError as e:
+        raise _service_unavailable(e)
     except Exception as e:
         logger.error(f"Error getting task status: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to get task status: {str(e)}")
@@ -1,5 +1,5 @@
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, validator
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 
@@ -58,8 +58,32 @@ class Template(BaseModel):
 
 
 class TemplateList(BaseModel):
+    items: List[Template]
+    total_count: Optional[int] = None
+    next_cursor: Optional[str] = None
+
+
+# Upper bound on names per batch request, matching the default catalog page size
+MAX_BATCH_NAMES = 500
+
+
+class TemplateBatchRequest(BaseModel):
+    """Request model for fetching several templates by name."""
+    names: List[str] = Field(..., min_length=1, max_length=MAX_BATCH_NAMES)
+
+    @validator('names')
+    def validate_names(cls, v):
+        """Enforce the batch bounds on pydantic versions that ignore them on lists."""
+        if not 1 <= len(v) <= MAX_BATCH_NAMES:
+            raise ValueError(f"names must contain between 1 and {MAX_BATCH_NAMES} entries")
+        return v
+
+
+class TemplateBatchResponse(BaseModel):
+    """Response model for a batch template fetch."""
     items: List[Template]
     total_count: int
+    not_found: List[str] = []
 
 
 class ErrorResponse(BaseModel):
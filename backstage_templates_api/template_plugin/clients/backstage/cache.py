@@ -0,0 +1,208 @@
+"""
+Backstage Response Cache
+
+This module provides an in-process cache for Backstage catalog responses.
+Entries carry the response ETag for conditional revalidation, can be served stale
+while a refresh runs in the background, and 404s are cached briefly as negative
+entries.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Set, Tuple
+
+
+class CacheEntry:
+    """A cached Backstage response."""
+
+    __slots__ = ("value", "etag", "fresh_until", "stale_until", "not_found")
+
+    def __init__(
+        self,
+        value: Optional[bytes],
+        etag: Optional[str],
+        fresh_until: float,
+        stale_until: float,
+        not_found: bool = False
+    ):
+        """
+        Initialize a cache entry.
+
+        Args:
+            value: Raw JSON response body, decoded on every read (None for negative entries)
+            etag: ETag returned with the response, if any
+            fresh_until: Monotonic time until which the entry is fresh
+            stale_until: Monotonic time until which the entry may be served stale
+            not_found: Whether this is a negative (404) entry
+        """
+        self.value = value
+        self.etag = etag
+        self.fresh_until = fresh_until
+        self.stale_until = stale_until
+        self.not_found = not_found
+
+    def is_fresh(self, now: float) -> bool:
+        """Check whether the entry can be served without revalidation."""
+        return now < self.fresh_until
+
+    def is_servable_stale(self, now: float) -> bool:
+        """Check whether the entry can be served while it is revalidated."""
+        return not self.not_found and now < self.stale_until
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU cache of Backstage responses.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of entries kept before evicting the least recently used
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+        self._refreshing: Set[Hashable] = set()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(path: str, params: Optional[Dict[str, Any]] = None) -> Tuple[str, Tuple[Tuple[str, Any], ...]]:
+        """
+        Build a cache key from a request path and query parameters.
+
+        Args:
+            path: API path
+            params: Query parameters
+
+        Returns:
+            Hashable cache key
+        """
+        items = []
+        for name, value in sorted((params or {}).items()):
+            if isinstance(value, (list, tuple)):
+                value = tuple(value)
+            items.append((name, value))
+        return path, tuple(items)
+
+    def get(self, key: Hashable) -> Optional[CacheEntry]:
+        """
+        Get an entry, dropping it if it can no longer be served at all.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The cache entry, or None if missing
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            # Expired entries with an ETag are kept so they can still be revalidated
+            if entry.etag is None and time.monotonic() >= max(entry.fresh_until, entry.stale_until):
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def put(
+        self,
+        key: Hashable,
+        value: Optional[bytes],
+        etag: Optional[str],
+        ttl: float,
+        stale_ttl: float
+    ) -> CacheEntry:
+        """
+        Store a response.
+
+        Args:
+            key: Cache key
+            value: Raw JSON response body
+            etag: ETag returned with the response, if any
+            ttl: Seconds the entry stays fresh
+            stale_ttl: Additional seconds the entry may be served stale
+
+        Returns:
+            The stored entry
+        """
+        now = time.monotonic()
+        entry = CacheEntry(value, etag, now + ttl, now + ttl + stale_ttl)
+        self._store(key, entry)
+        return entry
+
+    def put_not_found(self, key: Hashable, ttl: float) -> CacheEntry:
+        """
+        Store a negative (404) entry.
+
+        Args:
+            key: Cache key
+            ttl: Seconds the negative entry stays valid
+
+        Returns:
+            The stored entry
+        """
+        now = time.monotonic()
+        entry = CacheEntry(None, None, now + ttl, now + ttl, not_found=True)
+        self._store(key, entry)
+        return entry
+
+    def touch(self, key: Hashable, entry: CacheEntry, ttl: float, stale_ttl: float) -> CacheEntry:
+        """
+        Extend the lifetime of an entry after a successful revalidation (304).
+
+        Args:
+            key: Cache key
+            entry: Entry that was revalidated
+            ttl: Seconds the entry stays fresh
+            stale_ttl: Additional seconds the entry may be served stale
+
+        Returns:
+            The refreshed entry
+        """
+        return self.put(key, entry.value, entry.etag, ttl, stale_ttl)
+
+    def start_refresh(self, key: Hashable) -> bool:
+        """
+        Claim the background refresh of an entry.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            True if the caller should refresh the entry, False if a refresh is already running
+        """
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def finish_refresh(self, key: Hashable) -> None:
+        """
+        Release the background refresh claim of an entry.
+
+        Args:
+            key: Cache key
+        """
+        with self._lock:
+            self._refreshing.discard(key)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _store(self, key: Hashable, entry: CacheEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
@@ -5,10 +5,14 @@ This module provides the implementation of the BaseClient interface for Backstag
 It communicates with the Backstage API to perform template operations.
 """
 
+import asyncio
+import json
 import logging
+import threading
 import uuid
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, AsyncIterator, Iterator, Set, Tuple, Type
 import os
 import time
 import boto3
@@ -18,15 +22,27 @@ import httpx
 from template_plugin.models.template_models import TaskStatus            
 from template_plugin.clients.base_client import BaseClient
 from template_plugin.models.template_models import TemplateTask, TemplateTaskResponse
-from template_plugin.clients.backstage.models import BackstageTemplate, BackstageTaskResponse
+from template_plugin.clients.backstage.models import BackstageTemplate, BackstageTaskResponse, TEMPLATE_FIELDS, ORDER_FIELDS, CATALOG_CURSOR, LISTING_CURSOR
+from template_plugin.clients.backstage.mirror import CatalogMirror
+from template_plugin.clients.backstage.cache import ResponseCache, CacheEntry
 from template_plugin.errors.exceptions import (
     TemplateError,
     TemplateNotFoundError,
     TemplateExecutionError,
-    ConnectionError
+    TemplateValidationError,
+    ConnectionError,
+    CircuitOpenError
 )
 from template_plugin.config.config import BackstageClientConfig
 from template_plugin.s3 import S3Client, S3Downloader
+from template_plugin.utils.retry_utils import (
+    RetryPolicy,
+    CircuitBreaker,
+    RETRYABLE_STATUS_CODES,
+    parse_retry_after
+)
+from template_plugin.utils.concurrency_utils import SingleFlight, AsyncSingleFlight
+from template_plugin.utils.pagination_utils import parse_sort, sort_key, paginate_items, encode_cursor, decode_cursor
 
 logger = logging.getLogger("backstage-template-client")
 
@@ -35,6 +51,8 @@ class BackstageClient(BaseClient):
     Implementation of BaseClient for Backstage.
     
     This client communicates with the Backstage API to perform template operations.
+    With mirror_enabled, template reads are answered from a CatalogMirror kept in
+    sync in the background, falling back to the API until its first sync completes.
     """
     
     def __init__(self, config: BackstageClientConfig):
@@ -62,79 +80,1315 @@ class BackstageClient(BaseClient):
         # Pre-compute the UI base URL
         self.ui_base_url = self.base_url.replace("/api", "")
         
+        # Shared, lazily created HTTP clients (connection pools)
+        self._client: Optional[httpx.Client] = None
+        self._client_lock = threading.Lock()
+        self._async_client: Optional[httpx.AsyncClient] = None
+        
+        # Retry policy and per-endpoint circuit breakers
+        self._retry_policy = RetryPolicy(
+            max_retries=config.MAX_RETRIES,
+            backoff_base=config.retry_backoff_base,
+            backoff_max=config.retry_backoff_max
+        )
+        self._circuit_breakers: Dict[str, CircuitBreaker] = {}
+        self._circuit_breakers_lock = threading.Lock()
+        
+        # Coalescing of concurrent identical GET requests
+        self._singleflight = SingleFlight()
+        self._async_singleflight = AsyncSingleFlight()
+        
+        # Catalog response cache with background (stale-while-revalidate) refresh
+        self._cache = ResponseCache(max_entries=config.cache_max_entries)
+        self._refresh_executor: Optional[ThreadPoolExecutor] = None
+        self._refresh_tasks: Set[asyncio.Task] = set()
+        
+        # Optional background-synced mirror serving template reads
+        self._mirror: Optional[CatalogMirror] = None
+        if config.mirror_enabled:
+            self._mirror = CatalogMirror(self, refresh_interval=config.mirror_refresh_interval)
+            self._mirror.start()
+        
     def _get_client(self) -> httpx.Client:
         """
-        Get an HTTP client for communicating with the Backstage API.
+        Get the shared HTTP client for communicating with the Backstage API.
+        
+        The client is created lazily on first use and reused for every request so that
+        connections (and TLS sessions) are kept alive in a pool instead of being
+        re-established per call. ``httpx.Client`` is safe to share between threads.
         
         Returns:
             An HTTP client with the appropriate headers
         """
-        return httpx.Client(
-            base_url=self.base_url,
-            headers=self.config.auth_headers,
-            timeout=self.config.DEFAULT_TIMEOUT
-        )
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = self._create_client(httpx.Client)
+        return self._client
     
-    def _request(
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """
+        Get the shared asyncio HTTP client for communicating with the Backstage API.
+        
+        The async client is bound to the event loop it is first used on, which is the
+        application's loop when running under uvicorn.
+        
+        Returns:
+            An async HTTP client with the appropriate headers
+        """
+        if self._async_client is None:
+            self._async_client = self._create_client(httpx.AsyncClient)
+        return self._async_client
+    
+    def _create_client(self, client_class: Type[Any]) -> Any:
+        """
+        Create a pooled HTTP client from the connection settings in the config.
+        
+        Args:
+            client_class: ``httpx.Client`` or ``httpx.AsyncClient``
+            
+        Returns:
+            A new HTTP client
+        """
+        client_kwargs = {
+            "base_url": self.base_url,
+            "headers": self.config.auth_headers,
+            "timeout": self.config.DEFAULT_TIMEOUT,
+            "limits": httpx.Limits(
+                max_connections=self.config.max_connections,
+                max_keepalive_connections=self.config.max_keepalive_connections,
+                keepalive_expiry=self.config.keepalive_expiry
+            )
+        }
+        try:
+            return client_class(http2=self.config.http2, **client_kwargs)
+        except ImportError:
+            # HTTP/2 support needs the optional 'h2' package (httpx[http2])
+            logger.warning("HTTP/2 requested but the 'h2' package is not installed, falling back to HTTP/1.1")
+            return client_class(**client_kwargs)
+    
+    def close(self) -> None:
+        """
+        Close the shared HTTP client and release its pooled connections.
+        """
+        if self._mirror is not None:
+            self._mirror.stop(timeout=self.config.DEFAULT_TIMEOUT)
+        if self._refresh_executor is not None:
+            self._refresh_executor.shutdown(wait=False)
+            self._refresh_executor = None
+        with self._client_lock:
+            if self._client is not None:
+                logger.info("Closing Backstage HTTP connection pool")
+                self._client.close()
+                self._client = None
+    
+    async def aclose(self) -> None:
+        """
+        Close both the async and the sync HTTP clients.
+        """
+        if self._async_client is not None:
+            logger.info("Closing Backstage async HTTP connection pool")
+            await self._async_client.aclose()
+            self._async_client = None
+        self.close()
+    
+    def _get_circuit_breaker(self, method: str, path: str) -> CircuitBreaker:
+        """
+        Get the circuit breaker guarding an endpoint.
+        
+        Endpoints are grouped by method and the first three path segments, e.g.
+        "GET /catalog/entities/by-name" or "POST /scaffolder/v2/tasks".
+        
+        Args:
+            method: HTTP method
+            path: API path
+            
+        Returns:
+            Circuit breaker for the endpoint
+        """
+        segments = [segment for segment in path.split("?")[0].split("/") if segment][:3]
+        endpoint = f"{method.upper()} /{'/'.join(segments)}"
+        
+        with self._circuit_breakers_lock:
+            breaker = self._circuit_breakers.get(endpoint)
+            if breaker is None:
+                breaker = CircuitBreaker(
+                    name=endpoint,
+                    failure_threshold=self.config.circuit_breaker_threshold,
+                    reset_timeout=self.config.circuit_breaker_reset_timeout
+                )
+                self._circuit_breakers[endpoint] = breaker
+            return breaker
+    
+    def _get_retry_delay(
+        self,
+        method: str,
+        attempt: int,
+        idempotent: Optional[bool] = None,
+        response: Optional[httpx.Response] = None,
+        connect_error: bool = False
+    ) -> Optional[float]:
+        """
+        Get the delay before retrying a failed attempt.
+        
+        Args:
+            method: HTTP method
+            attempt: Number of retries already made
+            idempotent: Override for the method-based idempotency check
+            response: Response of the failed attempt, if one was received
+            connect_error: Whether the attempt failed while connecting
+            
+        Returns:
+            Delay in seconds, or None if the request must not be retried
+        """
+        if not self._retry_policy.should_retry(method, attempt, idempotent=idempotent, connect_error=connect_error):
+            return None
+        retry_after = parse_retry_after(response.headers.get("Retry-After")) if response is not None else None
+        return self._retry_policy.get_delay(attempt, retry_after)
+    
+    def _record_outcome(self, breaker: CircuitBreaker, response: httpx.Response) -> None:
+        """
+        Record the outcome of a request on its circuit breaker.
+        
+        Args:
+            breaker: Circuit breaker for the endpoint
+            response: Response received from Backstage
+        """
+        if response.status_code in RETRYABLE_STATUS_CODES or response.status_code >= 500:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+    
+    def _handle_response(self, response: httpx.Response, url: str) -> Any:
+        """
+        Validate a Backstage API response and decode its JSON body.
+        
+        Args:
+            response: HTTP response
+            url: Requested API path (for error messages)
+            
+        Returns:
+            Response data
+            
+        Raises:
+            TemplateNotFoundError: If the resource does not exist
+            TemplateError: If there is an API error
+        """
+        try:
+            if response.status_code == 404:
+                raise TemplateNotFoundError(f"Resource not found: {url}")
+            
+            response.raise_for_status()
+            return response.json()
+        except TemplateError:
+            raise
+        except httpx.HTTPStatusError as e:
+            logger.error(f"HTTP error {e.response.status_code}: {e.response.text}")
+            raise TemplateError(f"Backstage API error: {e.response.status_code} - {e.response.text}")
+        except Exception as e:
+            logger.error(f"Unexpected error: {str(e)}")
+            raise TemplateError(f"Unexpected error: {str(e)}")
+    
+    def _response_body(self, response: httpx.Response, url: str) -> bytes:
+        """
+        Validate a Backstage API response and return its raw JSON body.
+        
+        Response data shared between callers (coalesced requests and cache
+        entries) is kept as bytes and decoded by each caller with _decode_body,
+        so that no caller can mutate the data another one receives.
+        
+        Args:
+            response: HTTP response
+            url: Requested API path (for error messages)
+            
+        Returns:
+            Response body
+            
+        Raises:
+            TemplateNotFoundError: If the resource does not exist
+            TemplateError: If there is an API error
+        """
+        if response.status_code == 404 or response.is_error:
+            # Raises the matching error
+            self._handle_response(response, url)
+        return response.content
+    
+    def _decode_body(self, body: bytes, url: str) -> Any:
+        """
+        Decode a response body returned by _response_body into new objects.
+        
+        Args:
+            body: Response body
+            url: Requested API path (for error messages)
+            
+        Returns:
+            Response data
+            
+        Raises:
+            TemplateError: If the body is not valid JSON
+        """
+        try:
+            return json.loads(body)
+        except ValueError as e:
+            logger.error(f"Invalid JSON response from {url}: {str(e)}")
+            raise TemplateError(f"Unexpected error: {str(e)}")
+    
+    def _send(
         self, 
         method: str, 
         path: str, 
         params: Optional[Dict[str, Any]] = None,
-        json_data: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, Any]:
+        json_data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        idempotent: Optional[bool] = None
+    ) -> httpx.Response:
         """
-        Make a request to the Backstage API.
+        Send a request to the Backstage API and return the raw response.
+        
+        Idempotent requests failing with a transient error (connection reset, 429,
+        502, 503, 504) are retried up to MAX_RETRIES times with jittered exponential
+        backoff, honoring Retry-After. Every endpoint is guarded by a circuit breaker
+        that fails fast while Backstage keeps failing.
         
         Args:
             method: HTTP method
             path: API path
             params: Query parameters
             json_data: JSON request body
+            headers: Extra request headers
+            idempotent: Whether the request is safe to retry (defaults to GET/HEAD/OPTIONS)
             
         Returns:
-            Response data
+            The final HTTP response
             
         Raises:
+            CircuitOpenError: If the endpoint's circuit is open
             ConnectionError: If there is a connection error
-            TemplateError: If there is an API error
+            TemplateError: If there is an unexpected error
         """
         url = f"{path}"
-        logger.debug(f"Making {method} request to {url}")
+        breaker = self._get_circuit_breaker(method, path)
+        attempt = 0
         
-        try:
-            with self._get_client() as client:
+        while True:
+            if not breaker.allow_request():
+                raise CircuitOpenError(f"Backstage endpoint '{breaker.name}' is unavailable, failing fast")
+            
+            logger.debug(f"Making {method} request to {url} (attempt {attempt + 1})")
+            try:
+                client = self._get_client()
                 response = client.request(
                     method=method,
                     url=url,
                     params=params,
-                    json=json_data
+                    json=json_data,
+                    headers=headers
+                )
+            except httpx.RequestError as e:
+                breaker.record_failure()
+                delay = self._get_retry_delay(
+                    method, attempt, idempotent=idempotent,
+                    connect_error=isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout))
+                )
+                if delay is None:
+                    logger.error(f"Request error: {str(e)}")
+                    raise ConnectionError(f"Connection error: {str(e)}")
+                logger.warning(f"Request error on {method} {url}: {str(e)}, retrying in {delay:.2f}s")
+                time.sleep(delay)
+                attempt += 1
+                continue
+            except Exception as e:
+                breaker.record_failure()
+                logger.error(f"Unexpected error: {str(e)}")
+                raise TemplateError(f"Unexpected error: {str(e)}")
+            
+            self._record_outcome(breaker, response)
+            if response.status_code in RETRYABLE_STATUS_CODES:
+                delay = self._get_retry_delay(method, attempt, idempotent=idempotent, response=response)
+                if delay is not None:
+                    logger.warning(f"HTTP {response.status_code} on {method} {url}, retrying in {delay:.2f}s")
+                    time.sleep(delay)
+                    attempt += 1
+                    continue
+            
+            return response
+    
+    async def _asend(
+        self, 
+        method: str, 
+        path: str, 
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        idempotent: Optional[bool] = None
+    ) -> httpx.Response:
+        """
+        Send a request to the Backstage API without blocking the event loop.
+        
+        Applies the same retry and circuit breaker rules as _send.
+        
+        Args:
+            method: HTTP method
+            path: API path
+            params: Query parameters
+            json_data: JSON request body
+            headers: Extra request headers
+            idempotent: Whether the request is safe to retry (defaults to GET/HEAD/OPTIONS)
+            
+        Returns:
+            The final HTTP response
+            
+        Raises:
+            CircuitOpenError: If the endpoint's circuit is open
+            ConnectionError: If there is a connection error
+            TemplateError: If there is an unexpected error
+        """
+        url = f"{path}"
+        breaker = self._get_circuit_breaker(method, path)
+        attempt = 0
+        
+        while True:
+            if not breaker.allow_request():
+                raise CircuitOpenError(f"Backstage endpoint '{breaker.name}' is unavailable, failing fast")
+            
+            logger.debug(f"Making async {method} request to {url} (attempt {attempt + 1})")
+            try:
+                client = self._get_async_client()
+                response = await client.request(
+                    method=method,
+                    url=url,
+                    params=params,
+                    json=json_data,
+                    headers=headers
+                )
+            except httpx.RequestError as e:
+                breaker.record_failure()
+                delay = self._get_retry_delay(
+                    method, attempt, idempotent=idempotent,
+                    connect_error=isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout))
+                )
+                if delay is None:
+                    logger.error(f"Request error: {str(e)}")
+                    raise ConnectionError(f"Connection error: {str(e)}")
+                logger.warning(f"Request error on {method} {url}: {str(e)}, retrying in {delay:.2f}s")
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+            except Exception as e:
+                breaker.record_failure()
+                logger.error(f"Unexpected error: {str(e)}")
+                raise TemplateError(f"Unexpected error: {str(e)}")
+            
+            self._record_outcome(breaker, response)
+            if response.status_code in RETRYABLE_STATUS_CODES:
+                delay = self._get_retry_delay(method, attempt, idempotent=idempotent, response=response)
+                if delay is not None:
+                    logger.warning(f"HTTP {response.status_code} on {method} {url}, retrying in {delay:.2f}s")
+                    await asyncio.sleep(delay)
+                    attempt += 1
+                    continue
+            
+            return response
+    
+    def _request(
+        self, 
+        method: str, 
+        path: str, 
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        idempotent: Optional[bool] = None
+    ) -> Any:
+        """
+        Make a request to the Backstage API.
+        
+        Concurrent identical GET requests (same path and params) are coalesced
+        into a single upstream call whose result is shared.
+        
+        Args:
+            method: HTTP method
+            path: API path
+            params: Query parameters
+            json_data: JSON request body
+            idempotent: Whether the request is safe to retry (defaults to GET/HEAD/OPTIONS)
+            
+        Returns:
+            Response data
+            
+        Raises:
+            ConnectionError: If there is a connection error
+            TemplateError: If there is an API error
+        """
+        def fetch() -> bytes:
+            response = self._send(method, path, params=params, json_data=json_data, idempotent=idempotent)
+            return self._response_body(response, path)
+        
+        if method.upper() == "GET":
+            return self._decode_body(self._singleflight.do(self._cache.make_key(path, params), fetch), path)
+        return self._decode_body(fetch(), path)
+    
+    async def _arequest(
+        self, 
+        method: str, 
+        path: str, 
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        idempotent: Optional[bool] = None
+    ) -> Any:
+        """
+        Make a request to the Backstage API without blocking the event loop.
+        
+        Args:
+            method: HTTP method
+            path: API path
+            params: Query parameters
+            json_data: JSON request body
+            idempotent: Whether the request is safe to retry (defaults to GET/HEAD/OPTIONS)
+            
+        Returns:
+            Response data
+            
+        Raises:
+            ConnectionError: If there is a connection error
+            TemplateError: If there is an API error
+        """
+        async def fetch() -> bytes:
+            response = await self._asend(method, path, params=params, json_data=json_data, idempotent=idempotent)
+            return self._response_body(response, path)
+        
+        if method.upper() == "GET":
+            return self._decode_body(await self._async_singleflight.do(self._cache.make_key(path, params), fetch), path)
+        return self._decode_body(await fetch(), path)
+    
+    def _get_cache_ttl(self, operation: str) -> float:
+        """
+        Get the cache TTL configured for an operation.
+        
+        Args:
+            operation: Name of the cached client operation
+            
+        Returns:
+            TTL in seconds (0 disables caching for the operation)
+        """
+        return float(self.config.cache_ttl.get(operation, 0))
+    
+    def _conditional_headers(self, entry: Optional[CacheEntry]) -> Optional[Dict[str, str]]:
+        """
+        Build If-None-Match headers for revalidating a cache entry.
+        
+        Args:
+            entry: Cached entry, if any
+            
+        Returns:
+            Request headers, or None if the entry has no ETag
+        """
+        if entry is not None and entry.etag and not entry.not_found:
+            return {"If-None-Match": entry.etag}
+        return None
+    
+    def _store_response(self, operation: str, key: Any, entry: Optional[CacheEntry], response: httpx.Response, path: str) -> bytes:
+        """
+        Store a (re)validation response in the cache and return the response body.
+        
+        The cache holds raw bodies, which are decoded on every read (see
+        _response_body), so cached data cannot be mutated through a returned value.
+        
+        Args:
+            operation: Name of the cached client operation
+            key: Cache key
+            entry: Entry that was revalidated, if any
+            response: Response from Backstage
+            path: Requested API path
+            
+        Returns:
+            Response body
+            
+        Raises:
+            TemplateNotFoundError: If the resource does not exist (cached as a negative entry)
+            TemplateError: If there is an API error or the body is not valid JSON
+        """
+        ttl = self._get_cache_ttl(operation)
+        if response.status_code == 304 and entry is not None:
+            logger.debug(f"Cache revalidated for {path}")
+            return self._cache.touch(key, entry, ttl, self.config.cache_stale_ttl).value
+        if response.status_code == 404:
+            self._cache.put_not_found(key, self.config.cache_negative_ttl)
+        body = self._response_body(response, path)
+        # Only valid JSON is cached
+        self._decode_body(body, path)
+        self._cache.put(key, body, response.headers.get("ETag"), ttl, self.config.cache_stale_ttl)
+        return body
+    
+    def _revalidate(self, operation: str, key: Any, path: str, params: Optional[Dict[str, Any]], entry: Optional[CacheEntry]) -> Any:
+        """
+        Fetch (or conditionally revalidate) a cached resource.
+        
+        Returns:
+            Response body
+        """
+        response = self._send("GET", path, params=params, headers=self._conditional_headers(entry))
+        return self._store_response(operation, key, entry, response, path)
+    
+    async def _arevalidate(self, operation: str, key: Any, path: str, params: Optional[Dict[str, Any]], entry: Optional[CacheEntry]) -> Any:
+        """
+        Fetch (or conditionally revalidate) a cached resource without blocking the event loop.
+        
+        Returns:
+            Response body
+        """
+        response = await self._asend("GET", path, params=params, headers=self._conditional_headers(entry))
+        return self._store_response(operation, key, entry, response, path)
+    
+    def _background_refresh(self, operation: str, key: Any, path: str, params: Optional[Dict[str, Any]], entry: CacheEntry) -> None:
+        """
+        Revalidate a stale entry in the background, keeping it if the refresh fails.
+        """
+        try:
+            self._revalidate(operation, key, path, params, entry)
+        except TemplateNotFoundError:
+            logger.info(f"Cached resource no longer exists: {path}")
+        except Exception as e:
+            logger.warning(f"Background refresh of {path} failed, serving stale data: {str(e)}")
+        finally:
+            self._cache.finish_refresh(key)
+    
+    async def _abackground_refresh(self, operation: str, key: Any, path: str, params: Optional[Dict[str, Any]], entry: CacheEntry) -> None:
+        """
+        Revalidate a stale entry in a background task, keeping it if the refresh fails.
+        """
+        try:
+            await self._arevalidate(operation, key, path, params, entry)
+        except TemplateNotFoundError:
+            logger.info(f"Cached resource no longer exists: {path}")
+        except Exception as e:
+            logger.warning(f"Background refresh of {path} failed, serving stale data: {str(e)}")
+        finally:
+            self._cache.finish_refresh(key)
+    
+    def _cached_request(self, operation: str, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Make a cached GET request to the Backstage API.
+        
+        Fresh entries are served directly. Stale entries are served while a single
+        background refresh revalidates them with If-None-Match. 404s are cached for
+        cache_negative_ttl seconds. Concurrent misses for the same request share
+        one upstream call. Every call returns newly decoded data.
+        
+        Args:
+            operation: Name of the client operation (selects the TTL)
+            path: API path
+            params: Query parameters
+            
+        Returns:
+            Response data
+        """
+        if not self.config.cache_enabled or self._get_cache_ttl(operation) <= 0:
+            return self._request("GET", path, params=params)
+        
+        key = self._cache.make_key(path, params)
+        entry = self._cache.get(key)
+        now = time.monotonic()
+        if entry is not None:
+            if entry.is_fresh(now):
+                if entry.not_found:
+                    raise TemplateNotFoundError(f"Resource not found: {path}")
+                return self._decode_body(entry.value, path)
+            if entry.is_servable_stale(now):
+                if self._cache.start_refresh(key):
+                    self._get_refresh_executor().submit(self._background_refresh, operation, key, path, params, entry)
+                return self._decode_body(entry.value, path)
+        
+        body = self._singleflight.do(key, lambda: self._revalidate(operation, key, path, params, entry))
+        return self._decode_body(body, path)
+    
+    async def _acached_request(self, operation: str, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Make a cached GET request to the Backstage API without blocking the event loop.
+        
+        Args:
+            operation: Name of the client operation (selects the TTL)
+            path: API path
+            params: Query parameters
+            
+        Returns:
+            Response data
+        """
+        if not self.config.cache_enabled or self._get_cache_ttl(operation) <= 0:
+            return await self._arequest("GET", path, params=params)
+        
+        key = self._cache.make_key(path, params)
+        entry = self._cache.get(key)
+        now = time.monotonic()
+        if entry is not None:
+            if entry.is_fresh(now):
+                if entry.not_found:
+                    raise TemplateNotFoundError(f"Resource not found: {path}")
+                return self._decode_body(entry.value, path)
+            if entry.is_servable_stale(now):
+                if self._cache.start_refresh(key):
+                    task = asyncio.get_running_loop().create_task(
+                        self._abackground_refresh(operation, key, path, params, entry)
+                    )
+                    self._refresh_tasks.add(task)
+                    task.add_done_callback(self._refresh_tasks.discard)
+                return self._decode_body(entry.value, path)
+        
+        body = await self._async_singleflight.do(key, lambda: self._arevalidate(operation, key, path, params, entry))
+        return self._decode_body(body, path)
+    
+    def _get_refresh_executor(self) -> ThreadPoolExecutor:
+        """
+        Get the executor used for background cache refreshes.
+        
+        Returns:
+            Thread pool executor
+        """
+        if self._refresh_executor is None:
+            with self._client_lock:
+                if self._refresh_executor is None:
+                    self._refresh_executor = ThreadPoolExecutor(
+                        max_workers=2,
+                        thread_name_prefix="backstage-cache-refresh"
+                    )
+        return self._refresh_executor
+    
+    def _get_mirrored_template(self, template_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Look a template up in the catalog mirror.
+        
+        Args:
+            template_name: Name of the template
+            
+        Returns:
+            Template details, or None if mirror mode is off or the mirror is not ready yet
+            
+        Raises:
+            TemplateNotFoundError: If the mirror is ready and does not hold the template
+        """
+        if self._mirror is None or not self._mirror.ready:
+            return None
+        namespace, _, name = self._parse_template_ref(template_name)
+        template = self._mirror.get_template(namespace, name)
+        if template is None:
+            raise TemplateNotFoundError(f"Template not found: {template_name}")
+        return template
+    
+    def clear_cache(self) -> None:
+        """
+        Drop all cached Backstage responses.
+        """
+        self._cache.clear()
+    
+    def _build_list_params(
+        self,
+        cloud_provider: Optional[str] = None,
+        template_type: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        owner: Optional[str] = None,
+        search: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Build the by-query parameters for the first page of a template listing.
+        
+        Filters are translated into a single catalog filter expression, whose
+        conditions on different keys are ANDed by Backstage (e.g.
+        kind=Template,spec.owner=team-a), the search term becomes a full-text
+        filter, and only the fields needed by _map_backstage_template are
+        requested. Repeated conditions on one key are ORed, and so are several
+        filter parameters, so only one metadata.tags condition is sent; the
+        other required tags are checked by _matches_local_filters.
+        
+        Args:
+            cloud_provider: Filter by cloud provider (matched against metadata.tags)
+            template_type: Filter by template type
+            tags: Filter by tags (all must match)
+            owner: Filter by owner
+            search: Search in name, title and description
+            
+        Returns:
+            Query parameters
+        """
+        conditions = ["kind=Template"]
+        required_tags = list(tags or [])
+        if cloud_provider:
+            required_tags.append(cloud_provider)
+        if required_tags:
+            conditions.append(f"metadata.tags={required_tags[0]}")
+        if template_type:
+            conditions.append(f"spec.type={template_type}")
+        if owner:
+            conditions.append(f"spec.owner={owner}")
+        
+        params = {
+            "filter": ",".join(conditions),
+            "fields": ",".join(TEMPLATE_FIELDS),
+            "limit": self.config.catalog_page_size
+        }
+        if search:
+            params["fullTextFilterTerm"] = search
+            params["fullTextFilterFields"] = "metadata.name,metadata.description,spec.title"
+        return params
+    
+    def _matches_local_filters(
+        self,
+        template: Dict[str, Any],
+        cloud_provider: Optional[str] = None,
+        search: Optional[str] = None,
+        tags: Optional[List[str]] = None
+    ) -> bool:
+        """
+        Apply the filters the catalog API cannot evaluate to a mapped template.
+        
+        The cloud provider is re-checked because a template tagged with several
+        providers maps to the first one only, tags because the catalog query
+        only carries one of them (see _build_list_params), and the search term
+        because the catalog's full-text filter is looser than a substring match.
+        
+        Args:
+            template: Mapped template
+            cloud_provider: Filter by cloud provider
+            search: Search in name, title and description
+            tags: Filter by tags (all must match)
+            
+        Returns:
+            True if the template matches
+        """
+        metadata = template.get("metadata", {})
+        if cloud_provider and metadata.get("cloud_provider") != cloud_provider:
+            return False
+        if tags:
+            template_tags = metadata.get("tags") or []
+            if not all(tag in template_tags for tag in tags):
+                return False
+        if search:
+            search = search.lower()
+            return (search in (metadata.get("name") or "").lower() or
+                    search in (metadata.get("description") or "").lower() or
+                    search in (metadata.get("title") or "").lower())
+        return True
+    
+    def _next_page_params(self, params: Dict[str, Any], page: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Get the query parameters for the page following a by-query response.
+
+        The cursor encodes the original filter, so only the cursor, page size and
+        field projection are sent for subsequent pages.
+
+        Args:
+            params: Query parameters of the current page
+            page: by-query response of the current page
+
+        Returns:
+            Query parameters for the next page, or None on the last page
+        """
+        cursor = (page.get("pageInfo") or {}).get("nextCursor")
+        if not cursor:
+            return None
+        return {"cursor": cursor, "limit": params["limit"], "fields": params["fields"]}
+
+    def _build_page_params(
+        self,
+        cloud_provider: Optional[str] = None,
+        template_type: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        owner: Optional[str] = None,
+        search: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        cursor: Optional[str] = None,
+        sort: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Build the by-query parameters for a single page requested by the caller.
+
+        The page is cut by Backstage: the first page carries the filter, the
+        orderField and an optional offset, and later pages only send the catalog
+        cursor, which encodes the original filter and order.
+
+        Args:
+            cloud_provider: Filter by cloud provider
+            template_type: Filter by template type
+            tags: Filter by tags
+            owner: Filter by owner
+            search: Search in name, title and description
+            limit: Maximum number of templates to return
+            offset: Number of templates to skip (ignored if a cursor is given)
+            cursor: Catalog cursor returned as next_cursor by a previous call
+            sort: Sort specification (see parse_sort)
+
+        Returns:
+            Query parameters
+        """
+        field, descending = parse_sort(sort)
+        page_size = self.config.catalog_page_size if limit is None else limit
+        if cursor:
+            return {"cursor": cursor, "limit": page_size, "fields": ",".join(TEMPLATE_FIELDS)}
+
+        params = self._build_list_params(cloud_provider, template_type, tags, owner, search)
+        params["limit"] = page_size
+        if offset:
+            params["offset"] = offset
+        if field is not None:
+            params["orderField"] = f"{ORDER_FIELDS[field]},{'desc' if descending else 'asc'}"
+        return params
+
+    def _has_local_filters(
+        self,
+        cloud_provider: Optional[str] = None,
+        search: Optional[str] = None,
+        tags: Optional[List[str]] = None
+    ) -> bool:
+        """
+        Tell whether _matches_local_filters can drop templates the catalog matched.
+
+        Args:
+            cloud_provider: Filter by cloud provider
+            search: Search in name, title and description
+            tags: Filter by tags
+
+        Returns:
+            True if some filters are only evaluated locally
+        """
+        return bool(cloud_provider or search or len(tags or []) > 1)
+
+    def _start_catalog_page(
+        self,
+        limit: int,
+        offset: Optional[int] = None,
+        cursor_data: Optional[Dict[str, Any]] = None,
+        sort: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Get the catalog position a page of a catalog-cut listing starts at.
+
+        A position is a catalog cursor (None for the first catalog page, which
+        is requested with the filter and offset instead), the size of the
+        catalog page and the number of entities to skip at its start.
+
+        Args:
+            limit: Maximum number of templates to return
+            offset: Number of templates to skip (ignored if a cursor is given)
+            cursor_data: Decoded cursor returned as next_cursor by a previous call
+            sort: Sort specification (see parse_sort)
+
+        Returns:
+            Catalog position
+
+        Raises:
+            TemplateValidationError: If the cursor does not match the request
+        """
+        if cursor_data is None:
+            return {"cursor": None, "offset": offset or 0, "size": limit, "skip": 0}
+        position = {key: cursor_data.get(key) for key in ("cursor", "offset", "size", "skip")}
+        if (cursor_data.get("sort") != sort or
+                not all(isinstance(position[key], int) for key in ("offset", "size", "skip")) or
+                not isinstance(position["cursor"], (str, type(None)))):
+            raise TemplateValidationError("Pagination cursor does not match the request")
+        return position
+
+    def _collect_catalog_page(
+        self,
+        page: Dict[str, Any],
+        position: Dict[str, Any],
+        items: List[Dict[str, Any]],
+        limit: int,
+        cloud_provider: Optional[str] = None,
+        search: Optional[str] = None,
+        tags: Optional[List[str]] = None
+    ) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """
+        Add the matching templates of a by-query page to a listing page.
+
+        Templates rejected by _matches_local_filters do not count towards the
+        limit, so a listing page can span several catalog pages.
+
+        Args:
+            page: by-query response fetched at position
+            position: Catalog position of the page (see _start_catalog_page)
+            items: Templates of the listing page so far, extended in place
+            limit: Maximum number of templates in the listing page
+            cloud_provider: Filter by cloud provider
+            search: Search in name, title and description
+            tags: Filter by tags
+
+        Returns:
+            Tuple of (done, position): when done, the position the next listing
+            page starts at (None if the catalog is exhausted); otherwise the
+            position of the next catalog page to fetch
+        """
+        templates = [self._map_backstage_template(item) for item in page.get("items", [])]
+        matches = [
+            index for index in range(position["skip"], len(templates))
+            if self._matches_local_filters(templates[index], cloud_provider, search, tags)
+        ]
+        free = limit - len(items)
+        items.extend(templates[index] for index in matches[:free])
+        if len(matches) > free:
+            return True, dict(position, skip=matches[free])
+
+        next_cursor = (page.get("pageInfo") or {}).get("nextCursor")
+        next_position = {"cursor": next_cursor, "offset": 0, "size": limit, "skip": 0} if next_cursor else None
+        return len(items) >= limit or next_position is None, next_position
+
+    def _finish_catalog_page(
+        self,
+        items: List[Dict[str, Any]],
+        total_count: Optional[int],
+        position: Optional[Dict[str, Any]],
+        sort: Optional[str] = None,
+        from_start: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Build a catalog-cut listing page.
+
+        Args:
+            items: Templates of the page
+            total_count: Total number of matching templates, if known
+            position: Catalog position the next page starts at, or None on the last page
+            sort: Sort specification (see parse_sort)
+            from_start: Whether the page starts at the first matching template
+
+        Returns:
+            Dictionary with template items, total count and the cursor of the next page
+        """
+        if total_count is None and from_start and position is None:
+            # The page holds every match
+            total_count = len(items)
+        next_cursor = None
+        if position is not None:
+            next_cursor = encode_cursor(dict(position, origin=CATALOG_CURSOR, sort=sort))
+        return {"items": items, "total_count": total_count, "next_cursor": next_cursor}
+
+    def _list_catalog_page(
+        self,
+        cloud_provider: Optional[str] = None,
+        template_type: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        owner: Optional[str] = None,
+        search: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        cursor_data: Optional[Dict[str, Any]] = None,
+        sort: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Fetch one listing page cut by the catalog's native pagination and orderField.
+
+        The total count is the catalog's when every filter is pushed down to it.
+        When filters are re-applied locally, it is only known if the page holds
+        every match, and omitted (None) otherwise, since the matches cannot be
+        counted without fetching every page.
+
+        Args:
+            cloud_provider: Filter by cloud provider
+            template_type: Filter by template type
+            tags: Filter by tags
+            owner: Filter by owner
+            search: Search in name, title and description
+            limit: Maximum number of templates to return
+            offset: Number of templates to skip (ignored if a cursor is given)
+            cursor_data: Decoded cursor returned as next_cursor by a previous call
+            sort: Sort specification (see parse_sort)
+
+        Returns:
+            Dictionary with template items, total count and the cursor of the next page
+        """
+        if limit is None:
+            limit = self.config.catalog_page_size
+        position = self._start_catalog_page(limit, offset, cursor_data, sort)
+        exact_count = not self._has_local_filters(cloud_provider, search, tags)
+        items: List[Dict[str, Any]] = []
+        total_count = None
+        done = False
+        while not done:
+            params = self._build_page_params(
+                cloud_provider, template_type, tags, owner, search,
+                position["size"], position["offset"], position["cursor"], sort
+            )
+            page = self._cached_request(
+                operation="list_templates",
+                path="/catalog/entities/by-query",
+                params=params
+            )
+            if exact_count and total_count is None:
+                total_count = page.get("totalItems")
+            done, position = self._collect_catalog_page(
+                page, position, items, limit, cloud_provider, search, tags
+            )
+        from_start = cursor_data is None and not offset
+        return self._finish_catalog_page(items, total_count, position, sort, from_start)
+
+    async def _alist_catalog_page(
+        self,
+        cloud_provider: Optional[str] = None,
+        template_type: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        owner: Optional[str] = None,
+        search: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        cursor_data: Optional[Dict[str, Any]] = None,
+        sort: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Fetch one catalog-cut listing page using the async HTTP client.
+
+        Args:
+            cloud_provider: Filter by cloud provider
+            template_type: Filter by template type
+            tags: Filter by tags
+            owner: Filter by owner
+            search: Search in name, title and description
+            limit: Maximum number of templates to return
+            offset: Number of templates to skip (ignored if a cursor is given)
+            cursor_data: Decoded cursor returned as next_cursor by a previous call
+            sort: Sort specification (see parse_sort)
+
+        Returns:
+            Dictionary with template items, total count and the cursor of the next page
+        """
+        if limit is None:
+            limit = self.config.catalog_page_size
+        position = self._start_catalog_page(limit, offset, cursor_data, sort)
+        exact_count = not self._has_local_filters(cloud_provider, search, tags)
+        items: List[Dict[str, Any]] = []
+        total_count = None
+        done = False
+        while not done:
+            params = self._build_page_params(
+                cloud_provider, template_type, tags, owner, search,
+                position["size"], position["offset"], position["cursor"], sort
+            )
+            page = await self._acached_request(
+                operation="list_templates",
+                path="/catalog/entities/by-query",
+                params=params
+            )
+            if exact_count and total_count is None:
+                total_count = page.get("totalItems")
+            done, position = self._collect_catalog_page(
+                page, position, items, limit, cloud_provider, search, tags
+            )
+        from_start = cursor_data is None and not offset
+        return self._finish_catalog_page(items, total_count, position, sort, from_start)
+
+    def _use_catalog_pages(self, limit: Optional[int], cursor_data: Optional[Dict[str, Any]]) -> bool:
+        """
+        Decide whether a listing page is cut by the catalog or from a listing held in memory.
+
+        Cursors are served by the path that produced them, since the two kinds
+        are not interchangeable; otherwise the catalog cuts pages whenever a
+        limit bounds them and the mirror is not ready.
+
+        Args:
+            limit: Maximum number of templates to return
+            cursor_data: Decoded cursor returned as next_cursor by a previous call
+
+        Returns:
+            True to fetch the page with _list_catalog_page
+
+        Raises:
+            TemplateValidationError: If the cursor was not produced by this client
+        """
+        if cursor_data is not None:
+            origin = cursor_data.get("origin")
+            if origin not in (CATALOG_CURSOR, LISTING_CURSOR):
+                raise TemplateValidationError("Pagination cursor does not match the request")
+            return origin == CATALOG_CURSOR
+        return limit is not None and not (self._mirror is not None and self._mirror.ready)
+
+    def _finish_listing(
+        self,
+        items: List[Dict[str, Any]],
+        total_count: int,
+        offset: Optional[int] = None,
+        sort: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Build an unpaginated listing from the templates collected by iteration.
+
+        Without a sort, the templates before the offset are skipped while
+        collecting, so only the returned templates are held. With one, every
+        match is collected, sorted and then cut at the offset.
+
+        Args:
+            items: Collected templates
+            total_count: Number of matching templates, including skipped ones
+            offset: Number of templates to skip
+            sort: Sort specification (see parse_sort)
+
+        Returns:
+            Dictionary with template items, total count and no next cursor
+        """
+        field, descending = parse_sort(sort)
+        if field is not None:
+            items.sort(key=lambda template: sort_key(template, field), reverse=descending)
+            del items[:offset or 0]
+        return {"items": items, "total_count": total_count, "next_cursor": None}
+
+    def iter_templates(
+        self,
+        cloud_provider: Optional[str] = None,
+        template_type: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        owner: Optional[str] = None,
+        search: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over matching templates, fetching the catalog page by page.
+
+        Uses the cursor-based /catalog/entities/by-query API with a page size of
+        catalog_page_size, so only one page of entities is held at a time.
+
+        Args:
+            cloud_provider: Filter by cloud provider
+            template_type: Filter by template type
+            tags: Filter by tags
+            owner: Filter by owner
+            search: Search in name, title and description
+
+        Yields:
+            Mapped templates
+        """
+        if self._mirror is not None and self._mirror.ready:
+            yield from self._mirror.iter_templates(cloud_provider, template_type, tags, owner, search)
+            return
+
+        params = self._build_list_params(cloud_provider, template_type, tags, owner, search)
+        logger.info(f"Fetching templates with filter: {params['filter']}")
+
+        while params is not None:
+            page = self._cached_request(
+                operation="list_templates",
+                path="/catalog/entities/by-query",
+                params=params
+            )
+            for item in page.get("items", []):
+                template = self._map_backstage_template(item)
+                if self._matches_local_filters(template, cloud_provider, search, tags):
+                    yield template
+            params = self._next_page_params(params, page)
+
+    async def aiter_templates(
+        self,
+        cloud_provider: Optional[str] = None,
+        template_type: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        owner: Optional[str] = None,
+        search: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over matching templates page by page using the async HTTP client.
+
+        Args:
+            cloud_provider: Filter by cloud provider
+            template_type: Filter by template type
+            tags: Filter by tags
+            owner: Filter by owner
+            search: Search in name, title and description
+
+        Yields:
+            Mapped templates
+        """
+        if self._mirror is not None and self._mirror.ready:
+            for template in self._mirror.iter_templates(cloud_provider, template_type, tags, owner, search):
+                yield template
+            return
+
+        params = self._build_list_params(cloud_provider, template_type, tags, owner, search)
+        logger.info(f"Fetching templates with filter: {params['filter']}")
+
+        while params is not None:
+            page = await self._acached_request(
+                operation="list_templates",
+                path="/catalog/entities/by-query",
+                params=params
+            )
+            for item in page.get("items", []):
+                template = self._map_backstage_template(item)
+                if self._matches_local_filters(template, cloud_provider, search, tags):
+                    yield template
+            params = self._next_page_params(params, page)
+
+    def list_templates(
+        self,
+        cloud_provider: Optional[str] = None,
+        template_type: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        owner: Optional[str] = None,
+        search: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        cursor: Optional[str] = None,
+        sort: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        List templates with optional filtering, sorting and pagination.
+        
+        Without a limit every matching template is returned, streamed from the
+        catalog page by page so that only the returned templates are held. With
+        one, the page is cut by the catalog's native cursor pagination and
+        orderField, or from the mirror when it is ready. The total count of a
+        page is None when it cannot be known without fetching the whole catalog
+        (see _list_catalog_page).
+        
+        Args:
+            cloud_provider: Filter by cloud provider
+            template_type: Filter by template type
+            tags: Filter by tags
+            owner: Filter by owner
+            search: Search in name and description
+            limit: Maximum number of templates to return
+            offset: Number of templates to skip (ignored if a cursor is given)
+            cursor: Cursor returned as next_cursor by a previous call
+            sort: Sort field ("name", "title", "type" or "owner"), prefixed with "-" for descending order
+            
+        Returns:
+            Dictionary with template items, total count and the cursor of the next page
+        """
+        try:
+            cursor_data = decode_cursor(cursor) if cursor else None
+            if self._use_catalog_pages(limit, cursor_data):
+                return self._list_catalog_page(
+                    cloud_provider, template_type, tags, owner, search, limit, offset, cursor_data, sort
                 )
-                
-                if response.status_code == 404:
-                    raise TemplateNotFoundError(f"Resource not found: {url}")
-                
-                response.raise_for_status()
-                return response.json()
-        except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error {e.response.status_code}: {e.response.text}")
-            raise TemplateError(f"Backstage API error: {e.response.status_code} - {e.response.text}")
-        except httpx.RequestError as e:
-            logger.error(f"Request error: {str(e)}")
-            raise ConnectionError(f"Connection error: {str(e)}")
+            
+            templates = self.iter_templates(cloud_provider, template_type, tags, owner, search)
+            if limit is not None or cursor_data is not None:
+                return paginate_items(list(templates), limit, offset, cursor, sort, origin=LISTING_CURSOR)
+            
+            # Stream the catalog page by page, keeping only the templates returned
+            field, _ = parse_sort(sort)
+            skip = 0 if field is not None else offset or 0
+            items: List[Dict[str, Any]] = []
+            total_count = 0
+            for template in templates:
+                total_count += 1
+                if total_count > skip:
+                    items.append(template)
+            return self._finish_listing(items, total_count, offset, sort)
+        except TemplateValidationError:
+            raise
+        except ConnectionError:
+            # Includes CircuitOpenError, so callers can fail fast with a 503
+            raise
         except Exception as e:
-            logger.error(f"Unexpected error: {str(e)}")
-            raise TemplateError(f"Unexpected error: {str(e)}")
+            logger.error(f"Failed to list templates: {str(e)}")
+            raise TemplateError(f"Failed to list templates: {str(e)}")
     
-    def list_templates(
+    async def alist_templates(
         self,
         cloud_provider: Optional[str] = None,
         template_type: Optional[str] = None,
         tags: Optional[List[str]] = None,
         owner: Optional[str] = None,
-        search: Optional[str] = None
+        search: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        cursor: Optional[str] = None,
+        sort: Optional[str] = None
     ) -> Dict[str, Any]:
         """
-        List templates with optional filtering.
+        List templates with optional filtering, sorting and pagination using the async HTTP client.
         
         Args:
             cloud_provider: Filter by cloud provider
@@ -142,41 +1396,40 @@ class BackstageClient(BaseClient):
             tags: Filter by tags
             owner: Filter by owner
             search: Search in name and description
+            limit: Maximum number of templates to return
+            offset: Number of templates to skip (ignored if a cursor is given)
+            cursor: Cursor returned as next_cursor by a previous call
+            sort: Sort field ("name", "title", "type" or "owner"), prefixed with "-" for descending order
             
         Returns:
-            List of templates
+            Dictionary with template items, total count and the cursor of the next page
         """
-        params = {}
-        if cloud_provider:
-            params["cloud_provider"] = cloud_provider
-        if template_type:
-            params["template_type"] = template_type
-        if tags:
-            params["tag"] = tags
-        if owner:
-            params["owner"] = owner
-        if search:
-            params["search"] = search
-            
         try:
-            # Fetch templates from Backstage Catalog API
-            logger.info(f"Fetching templates with filters: {params}")
-            response = self._request(
-                method="GET",
-                path="/catalog/entities",
-                params={"filter": "kind=Template", **params}
-            )
+            cursor_data = decode_cursor(cursor) if cursor else None
+            if self._use_catalog_pages(limit, cursor_data):
+                return await self._alist_catalog_page(
+                    cloud_provider, template_type, tags, owner, search, limit, offset, cursor_data, sort
+                )
             
-            # Map Backstage response to TemplateList format
-            templates = []
-            for item in response:
-                template = self._map_backstage_template(item)
-                templates.append(template)
-                
-            return {
-                "items": templates,
-                "total_count": len(templates)
-            }
+            templates = self.aiter_templates(cloud_provider, template_type, tags, owner, search)
+            if limit is not None or cursor_data is not None:
+                items = [template async for template in templates]
+                return paginate_items(items, limit, offset, cursor, sort, origin=LISTING_CURSOR)
+            
+            field, _ = parse_sort(sort)
+            skip = 0 if field is not None else offset or 0
+            items = []
+            total_count = 0
+            async for template in templates:
+                total_count += 1
+                if total_count > skip:
+                    items.append(template)
+            return self._finish_listing(items, total_count, offset, sort)
+        except TemplateValidationError:
+            raise
+        except ConnectionError:
+            # Includes CircuitOpenError, so callers can fail fast with a 503
+            raise
         except Exception as e:
             logger.error(f"Failed to list templates: {str(e)}")
             raise TemplateError(f"Failed to list templates: {str(e)}")
@@ -237,18 +1490,209 @@ class BackstageClient(BaseClient):
             Template details
         """
         try:
+            template = self._get_mirrored_template(template_name)
+            if template is not None:
+                return template
+            
             logger.info(f"Fetching template: {template_name}")
-            response = self._request(
-                method="GET",
+            response = self._cached_request(
+                operation="get_template",
+                path=f"/catalog/entities/by-name/template/default/{template_name}"
+            )
+            return self._map_backstage_template(response)
+        except TemplateNotFoundError:
+            raise TemplateNotFoundError(f"Template not found: {template_name}")
+        except ConnectionError:
+            # Includes CircuitOpenError, so callers can fail fast with a 503
+            raise
+        except Exception as e:
+            logger.error(f"Failed to get template: {str(e)}")
+            raise TemplateError(f"Failed to get template: {str(e)}")
+    
+    async def aget_template(self, template_name: str) -> Dict[str, Any]:
+        """
+        Get a specific template by name using the async HTTP client.
+        
+        Args:
+            template_name: Name of the template
+            
+        Returns:
+            Template details
+        """
+        try:
+            template = self._get_mirrored_template(template_name)
+            if template is not None:
+                return template
+            
+            logger.info(f"Fetching template: {template_name}")
+            response = await self._acached_request(
+                operation="get_template",
                 path=f"/catalog/entities/by-name/template/default/{template_name}"
             )
             return self._map_backstage_template(response)
         except TemplateNotFoundError:
             raise TemplateNotFoundError(f"Template not found: {template_name}")
+        except ConnectionError:
+            # Includes CircuitOpenError, so callers can fail fast with a 503
+            raise
         except Exception as e:
             logger.error(f"Failed to get template: {str(e)}")
             raise TemplateError(f"Failed to get template: {str(e)}")
     
+    def _build_by_refs_requests(self, template_names: List[str]) -> List[Tuple[List[str], Dict[str, Any]]]:
+        """
+        Build the by-refs request bodies for a batch of template names.
+        
+        Duplicate names are requested once, and the refs are split into chunks of
+        catalog_page_size to keep each request body bounded.
+        
+        Args:
+            template_names: Names of the templates to retrieve
+            
+        Returns:
+            List of (names in the chunk, request body) tuples
+        """
+        unique_names = list(dict.fromkeys(template_names))
+        chunk_size = max(1, self.config.catalog_page_size)
+        
+        requests = []
+        for start in range(0, len(unique_names), chunk_size):
+            chunk = unique_names[start:start + chunk_size]
+            entity_refs = []
+            for template_name in chunk:
+                namespace, kind, name = self._parse_template_ref(template_name)
+                entity_refs.append(f"{kind}:{namespace}/{name}")
+            requests.append((chunk, {"entityRefs": entity_refs, "fields": TEMPLATE_FIELDS}))
+        return requests
+    
+    def _map_templates_batch(self, template_names: List[str], found: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Assemble the batch response in request order.
+        
+        Args:
+            template_names: Requested template names
+            found: Mapped templates keyed by requested name
+            
+        Returns:
+            Dictionary with template items, total count and names not found
+        """
+        templates = []
+        not_found = []
+        for template_name in dict.fromkeys(template_names):
+            if template_name in found:
+                templates.append(found[template_name])
+            else:
+                not_found.append(template_name)
+        
+        return {
+            "items": templates,
+            "total_count": len(templates),
+            "not_found": not_found
+        }
+    
+    def _get_mirrored_templates(self, template_names: List[str]) -> Dict[str, Any]:
+        """
+        Look several templates up in the (ready) catalog mirror.
+        
+        Args:
+            template_names: Names of the templates to retrieve
+            
+        Returns:
+            Dictionary with template items, total count and names not found
+        """
+        found = {}
+        for template_name in template_names:
+            namespace, _, name = self._parse_template_ref(template_name)
+            template = self._mirror.get_template(namespace, name)
+            if template is not None:
+                found[template_name] = template
+        return self._map_templates_batch(template_names, found)
+    
+    def get_templates(self, template_names: List[str]) -> Dict[str, Any]:
+        """
+        Get several templates by name with the catalog by-refs API.
+        
+        Args:
+            template_names: Names of the templates to retrieve
+            
+        Returns:
+            Dictionary with template items, total count and names not found
+        """
+        try:
+            if self._mirror is not None and self._mirror.ready:
+                return self._get_mirrored_templates(template_names)
+            
+            logger.info(f"Fetching {len(template_names)} templates by ref")
+            found = {}
+            for chunk, body in self._build_by_refs_requests(template_names):
+                # by-refs is a read despite being a POST, so it is safe to retry
+                response = self._request("POST", "/catalog/entities/by-refs", json_data=body, idempotent=True)
+                for template_name, item in zip(chunk, response.get("items", [])):
+                    if item is not None:
+                        found[template_name] = self._map_backstage_template(item)
+            return self._map_templates_batch(template_names, found)
+        except ConnectionError:
+            # Includes CircuitOpenError, so callers can fail fast with a 503
+            raise
+        except Exception as e:
+            logger.error(f"Failed to get templates: {str(e)}")
+            raise TemplateError(f"Failed to get templates: {str(e)}")
+    
+    async def aget_templates(self, template_names: List[str]) -> Dict[str, Any]:
+        """
+        Get several templates by name with the catalog by-refs API using the async HTTP client.
+        
+        Args:
+            template_names: Names of the templates to retrieve
+            
+        Returns:
+            Dictionary with template items, total count and names not found
+        """
+        try:
+            if self._mirror is not None and self._mirror.ready:
+                return self._get_mirrored_templates(template_names)
+            
+            logger.info(f"Fetching {len(template_names)} templates by ref")
+            found = {}
+            for chunk, body in self._build_by_refs_requests(template_names):
+                response = await self._arequest("POST", "/catalog/entities/by-refs", json_data=body, idempotent=True)
+                for template_name, item in zip(chunk, response.get("items", [])):
+                    if item is not None:
+                        found[template_name] = self._map_backstage_template(item)
+            return self._map_templates_batch(template_names, found)
+        except ConnectionError:
+            # Includes CircuitOpenError, so callers can fail fast with a 503
+            raise
+        except Exception as e:
+            logger.error(f"Failed to get templates: {str(e)}")
+            raise TemplateError(f"Failed to get templates: {str(e)}")
+    
+    def _parse_template_ref(self, template_name: str) -> Tuple[str, str, str]:
+        """
+        Split a template name into namespace, kind and name.
+        
+        The expected format is namespace:kind:name or namespace:name, with
+        "default" and "template" used for missing parts.
+        
+        Args:
+            template_name: Name of the template
+            
+        Returns:
+            Tuple of (namespace, kind, name)
+        """
+        namespace = "default"
+        kind = "template"
+        name = template_name
+        
+        if ":" in template_name:
+            parts = template_name.split(":")
+            if len(parts) == 3:
+                namespace, kind, name = parts
+            elif len(parts) == 2:
+                namespace, name = parts
+        
+        return namespace, kind, name
+    
     def get_template_parameters(self, template_name: str) -> Dict[str, Any]:
         """
         Get parameter schema for a specific template.
@@ -268,23 +1712,12 @@ class BackstageClient(BaseClient):
                 
             # If no parameters in template metadata, try the parameter schema endpoint
             # The expected format is /api/scaffolder/v2/templates/:namespace/:kind/:name
-            # Default namespace and kind if not specified in the template name
-            namespace = "default"
-            kind = "template"
-            name = template_name
-            
-            # Check if template_name includes namespace and kind (format: namespace:kind:name)
-            if ":" in template_name:
-                parts = template_name.split(":")
-                if len(parts) == 3:
-                    namespace, kind, name = parts
-                elif len(parts) == 2:
-                    namespace, name = parts
+            namespace, kind, name = self._parse_template_ref(template_name)
             
             logger.info(f"Fetching parameter schema for template: {namespace}/{kind}/{name}")
             
-            response = self._request(
-                method="GET",
+            response = self._cached_request(
+                operation="get_template_parameters",
                 path=f"/scaffolder/v2/templates/{namespace}/{kind}/{name}"
             )
             
@@ -295,6 +1728,46 @@ class BackstageClient(BaseClient):
             
         except TemplateNotFoundError:
             raise TemplateNotFoundError(f"Template parameters not found: {template_name}")
+        except ConnectionError:
+            # Includes CircuitOpenError, so callers can fail fast with a 503
+            raise
+        except Exception as e:
+            logger.error(f"Failed to get template parameters: {str(e)}")
+            raise TemplateError(f"Failed to get template parameters: {str(e)}")
+    
+    async def aget_template_parameters(self, template_name: str) -> Dict[str, Any]:
+        """
+        Get parameter schema for a specific template using the async HTTP client.
+        
+        Args:
+            template_name: Name of the template
+            
+        Returns:
+            Template parameter schema
+        """
+        try:
+            template = await self.aget_template(template_name)
+            if template and template.get("spec", {}).get("parameters"):
+                logger.info(f"Using parameters from template metadata for: {template_name}")
+                return {"parameters": template["spec"]["parameters"]}
+            
+            namespace, kind, name = self._parse_template_ref(template_name)
+            logger.info(f"Fetching parameter schema for template: {namespace}/{kind}/{name}")
+            
+            response = await self._acached_request(
+                operation="get_template_parameters",
+                path=f"/scaffolder/v2/templates/{namespace}/{kind}/{name}"
+            )
+            
+            if "parameters" in response:
+                return {"parameters": response["parameters"]}
+            return response
+            
+        except TemplateNotFoundError:
+            raise TemplateNotFoundError(f"Template parameters not found: {template_name}")
+        except ConnectionError:
+            # Includes CircuitOpenError, so callers can fail fast with a 503
+            raise
         except Exception as e:
             logger.error(f"Failed to get template parameters: {str(e)}")
             raise TemplateError(f"Failed to get template parameters: {str(e)}")
@@ -414,6 +1887,117 @@ class BackstageClient(BaseClient):
         completion_url = f"{self.ui_base_url}/create/tasks/{task_id}/completion"
         return log_url, completion_url
     
+    def _build_task_payload(self, task: TemplateTask) -> Dict[str, Any]:
+        """
+        Build the scaffolder task payload for a template execution.
+        
+        Args:
+            task: Template task with parameters
+            
+        Returns:
+            Request payload for the scaffolder tasks API
+        """
+        return {
+            "templateRef": f"template:default/{task.template_name}",
+            "values": task.parameters,
+            "secrets": {},
+            "isDryRun": task.dry_run
+        }
+    
+    def _build_task_response(
+        self,
+        task: TemplateTask,
+        response: Dict[str, Any],
+        s3_bucket: Optional[str] = None,
+        s3_key: Optional[str] = None,
+        local_path: Optional[str] = None,
+        aws_access_key: Optional[str] = None,
+        aws_secret_key: Optional[str] = None,
+        aws_region: Optional[str] = None,
+        poll_interval: Optional[int] = None,
+        timeout: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Build the task response for a created scaffolder task.
+        
+        If S3 download is configured this blocks until the task completes and the
+        result has been downloaded and extracted.
+        
+        Args:
+            task: Template task with parameters
+            response: Response of the scaffolder task creation request
+            s3_bucket: S3 bucket containing the result (optional, overrides config)
+            s3_key: Key/path of the zip file in S3 (optional)
+            local_path: Path where the file should be downloaded locally (optional)
+            aws_access_key: AWS access key ID (optional, overrides config)
+            aws_secret_key: AWS secret access key (optional, overrides config)
+            aws_region: AWS region (optional, overrides config)
+            poll_interval: How often to check task status (seconds)
+            timeout: Maximum time to wait for completion (seconds)
+            
+        Returns:
+            Task response
+        """
+        # Get task_id from response
+        task_id = response.get("id", str(uuid.uuid4()))
+        
+        # Get log and completion URLs
+        log_url, completion_url = self._get_task_urls(task_id)
+                  
+        task_response = TemplateTaskResponse(
+            task_id=task_id,
+            template_name=task.template_name,
+            status=TaskStatus.PENDING,
+            created_at=datetime.now().isoformat(),
+            log_url=log_url,
+            completion_url=completion_url
+        )
+        
+        # Initialize S3 downloader if needed
+        init_success, s3_downloader, configured_local_path, error = self._initialize_s3_downloader(
+            task_id=task_id,
+            task=task,
+            s3_bucket=s3_bucket,
+            s3_key=s3_key,
+            local_path=local_path,
+            aws_access_key=aws_access_key,
+            aws_secret_key=aws_secret_key,
+            aws_region=aws_region,
+            poll_interval=poll_interval,
+            timeout=timeout
+        )
+        
+        # If initialization was successful, download and extract
+        if init_success and s3_downloader:
+            try:
+                success, output_path, error = s3_downloader.download_and_extract()
+                
+                if success and output_path:
+                    task_response.output_path = output_path
+                    task_response.status = TaskStatus.COMPLETED
+                else:
+                    task_response.error = error or "Unknown error during download"
+            except Exception as e:
+                logger.error(f"Error during S3 download: {str(e)}")
+                task_response.error = f"Error during S3 download: {str(e)}"
+                # Continue with the original task response even if download fails
+        elif error:
+            logger.warning(f"S3 downloader initialization failed: {error}")
+            # Only set error if it's not already set
+            if not task_response.error:
+                task_response.error = error
+        
+        return {
+            "task_id": task_response.task_id,
+            "template_name": task_response.template_name,
+            "status": task_response.status,
+            "created_at": task_response.created_at,
+            "log_url": task_response.log_url,
+            "completion_url": task_response.completion_url,
+            "output_path": task_response.output_path,
+            "error": task_response.error
+        }
+    
     def execute_template(
         self, 
         task: TemplateTask,
@@ -446,39 +2030,76 @@ class BackstageClient(BaseClient):
         try:
             logger.info(f"Executing template: {task.template_name}")
             
-            # Prepare payload for Backstage
-            payload = {
-                "templateRef": f"template:default/{task.template_name}",
-                "values": task.parameters,
-                "secrets": {},
-                "isDryRun": task.dry_run
-            }
-            
             response = self._request(
                 method="POST",
                 path="/scaffolder/v2/tasks",
-                json_data=payload
+                json_data=self._build_task_payload(task)
+            )
+            
+            return self._build_task_response(
+                task=task,
+                response=response,
+                s3_bucket=s3_bucket,
+                s3_key=s3_key,
+                local_path=local_path,
+                aws_access_key=aws_access_key,
+                aws_secret_key=aws_secret_key,
+                aws_region=aws_region,
+                poll_interval=poll_interval,
+                timeout=timeout
             )
+        except ConnectionError:
+            # Includes CircuitOpenError, so callers can fail fast with a 503
+            raise
+        except Exception as e:
+            logger.error(f"Failed to execute template: {str(e)}")
+            raise TemplateExecutionError(f"Failed to execute template: {str(e)}")
+    
+    async def aexecute_template(
+        self, 
+        task: TemplateTask,
+        s3_bucket: Optional[str] = os.getenv("BACKSTAGE_S3_BUCKET"),
+        s3_key: Optional[str] = None,
+        local_path: Optional[str] = None,
+        aws_access_key: Optional[str] = os.getenv("BACKSTAGE_AWS_ACCESS_KEY"),
+        aws_secret_key: Optional[str] = os.getenv("BACKSTAGE_AWS_SECRET_KEY"),
+        aws_region: str = os.getenv("BACKSTAGE_AWS_REGION"),
+        poll_interval: int = 5,
+        timeout: int = 300
+    ) -> TemplateTaskResponse:
+        """
+        Execute a template using the async HTTP client.
+        
+        The task is created without blocking the event loop. Waiting for completion
+        and the S3 download (boto3, polling) run in the executor.
+        
+        Args:
+            task: Template task with parameters
+            s3_bucket: S3 bucket containing the result (optional, overrides config)
+            s3_key: Key/path of the zip file in S3 (optional)
+            local_path: Path where the file should be downloaded locally (optional)
+            aws_access_key: AWS access key ID (optional, overrides config)
+            aws_secret_key: AWS secret access key (optional, overrides config)
+            aws_region: AWS region (default: us-east-1, overrides config)
+            poll_interval: How often to check task status (seconds)
+            timeout: Maximum time to wait for completion (seconds)
+            
+        Returns:
+            Task response
+        """
+        try:
+            logger.info(f"Executing template: {task.template_name}")
             
-            # Get task_id from response
-            task_id = response.get("id", str(uuid.uuid4()))
-            
-            # Get log and completion URLs
-            log_url, completion_url = self._get_task_urls(task_id)
-                      
-            task_response = TemplateTaskResponse(
-                task_id=task_id,
-                template_name=task.template_name,
-                status=TaskStatus.PENDING,
-                created_at=datetime.now().isoformat(),
-                log_url=log_url,
-                completion_url=completion_url
+            response = await self._arequest(
+                method="POST",
+                path="/scaffolder/v2/tasks",
+                json_data=self._build_task_payload(task)
             )
             
-            # Initialize S3 downloader if needed
-            init_success, s3_downloader, configured_local_path, error = self._initialize_s3_downloader(
-                task_id=task_id,
+            return await self._run_in_executor(
+                self._build_task_response,
                 task=task,
+                response=response,
                 s3_bucket=s3_bucket,
                 s3_key=s3_key,
                 local_path=local_path,
@@ -488,37 +2109,9 @@ class BackstageClient(BaseClient):
                 poll_interval=poll_interval,
                 timeout=timeout
             )
-            
-            # If initialization was successful, download and extract
-            if init_success and s3_downloader:
-                try:
-                    success, output_path, error = s3_downloader.download_and_extract()
-                    
-                    if success and output_path:
-                        task_response.output_path = output_path
-                        task_response.status = TaskStatus.COMPLETED
-                    else:
-                        task_response.error = error or "Unknown error during download"
-                except Exception as e:
-                    logger.error(f"Error during S3 download: {str(e)}")
-                    task_response.error = f"Error during S3 download: {str(e)}"
-                    # Continue with the original task response even if download fails
-            elif error:
-                logger.warning(f"S3 downloader initialization failed: {error}")
-                # Only set error if it's not already set
-                if not task_response.error:
-                    task_response.error = error
-            
-            return {
-                "task_id": task_response.task_id,
-                "template_name": task_response.template_name,
-                "status": task_response.status,
-                "created_at": task_response.created_at,
-                "log_url": task_response.log_url,
-                "completion_url": task_response.completion_url,
-                "output_path": task_response.output_path,
-                "error": task_response.error
-            }
+        except ConnectionError:
+            # Includes CircuitOpenError, so callers can fail fast with a 503
+            raise
         except Exception as e:
             logger.error(f"Failed to execute template: {str(e)}")
             raise TemplateExecutionError(f"Failed to execute template: {str(e)}")
@@ -541,6 +2134,34 @@ class BackstageClient(BaseClient):
             )
         except TemplateNotFoundError:
             raise TemplateNotFoundError(f"Task not found: {task_id}")
+        except ConnectionError:
+            # Includes CircuitOpenError, so callers can fail fast with a 503
+            raise
+        except Exception as e:
+            logger.error(f"Failed to get task status: {str(e)}")
+            raise TemplateError(f"Failed to get task status: {str(e)}")
+    
+    async def aget_task_status(self, task_id: str) -> Dict[str, Any]:
+        """
+        Get status of a task using the async HTTP client.
+        
+        Args:
+            task_id: ID of the task
+            
+        Returns:
+            Task status
+        """
+        try:
+            logger.info(f"Fetching task status: {task_id}")
+            return await self._arequest(
+                method="GET",
+                path=f"/scaffolder/v2/tasks/{task_id}"
+            )
+        except TemplateNotFoundError:
+            raise TemplateNotFoundError(f"Task not found: {task_id}")
+        except ConnectionError:
+            # Includes CircuitOpenError, so callers can fail fast with a 503
+            raise
         except Exception as e:
             logger.error(f"Failed to get task status: {str(e)}")
-            raise TemplateError(f"Failed to get task status: {str(e)}") 
\ No newline at end of file
+            raise TemplateError(f"Failed to get task status: {str(e)}")
\ No newline at end of file
@@ -0,0 +1,247 @@
+"""
+Backstage Catalog Mirror
+
+This module provides an in-process mirror of the Backstage template catalog.
+A background thread lists all Template entities with only their name and etag,
+fetches the entities whose etag changed through the by-refs API, and swaps in
+the new snapshot, so that reads never wait on Backstage.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from template_plugin.clients.backstage.models import TEMPLATE_FIELDS
+from template_plugin.models.template_record import TemplateRecord
+
+logger = logging.getLogger("backstage-catalog-mirror")
+
+# Fields requested when listing the catalog to detect changes
+SYNC_FIELDS = ["metadata.name", "metadata.namespace", "metadata.etag"]
+
+
+class MirrorEntry:
+    """A mirrored template, held as a compact TemplateRecord, with the entity etag it was built from."""
+
+    __slots__ = ("etag", "record")
+
+    def __init__(self, etag: Optional[str], record: TemplateRecord):
+        """
+        Initialize a mirror entry.
+
+        Args:
+            etag: Entity etag from the catalog
+            record: Mapped template
+        """
+        self.etag = etag
+        self.record = record
+
+
+class CatalogMirror:
+    """
+    Background-synced mirror of the Backstage template catalog.
+
+    The mirrored entries are replaced as a whole after each sync, so readers
+    always see a consistent snapshot without taking a lock. Until the first
+    sync succeeds the mirror is not ready and callers should go to Backstage.
+    """
+
+    def __init__(self, client: Any, refresh_interval: float = 60.0):
+        """
+        Initialize the mirror.
+
+        Args:
+            client: BackstageClient used to talk to the catalog
+            refresh_interval: Seconds between two syncs
+        """
+        self.client = client
+        self.refresh_interval = refresh_interval
+        self._entries: Dict[Tuple[str, str], MirrorEntry] = {}
+        self._tag_pool: Dict[Tuple, Tuple] = {}
+        self._ready = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._last_sync: Optional[float] = None
+
+    @property
+    def ready(self) -> bool:
+        """Check whether the mirror holds a complete snapshot."""
+        return self._ready.is_set()
+
+    @property
+    def last_sync(self) -> Optional[float]:
+        """Get the wall-clock time of the last successful sync."""
+        return self._last_sync
+
+    def start(self) -> None:
+        """Start the background sync thread."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="backstage-catalog-mirror", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop the background sync thread.
+
+        Args:
+            timeout: Seconds to wait for the thread to finish
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for the first sync to complete.
+
+        Args:
+            timeout: Seconds to wait
+
+        Returns:
+            True if the mirror is ready
+        """
+        return self._ready.wait(timeout)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.sync()
+            except Exception as e:
+                logger.error(f"Catalog mirror sync failed: {str(e)}")
+            self._stop.wait(self.refresh_interval)
+
+    def _list_etags(self) -> Dict[Tuple[str, str], Optional[str]]:
+        """
+        List the etag of every Template entity in the catalog.
+
+        Returns:
+            Dictionary of etags keyed by (namespace, name), in catalog order
+        """
+        params: Optional[Dict[str, Any]] = {
+            "filter": "kind=Template",
+            "fields": ",".join(SYNC_FIELDS),
+            "limit": self.client.config.catalog_page_size
+        }
+        etags = {}
+        while params is not None:
+            page = self.client._request("GET", "/catalog/entities/by-query", params=params)
+            for item in page.get("items", []):
+                metadata = item.get("metadata", {})
+                key = (metadata.get("namespace") or "default", metadata.get("name", ""))
+                etags[key] = metadata.get("etag")
+            params = self.client._next_page_params(params, page)
+        return etags
+
+    def _fetch_templates(self, keys: List[Tuple[str, str]]) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        """
+        Fetch and map the given Template entities with the by-refs API.
+
+        Args:
+            keys: (namespace, name) keys of the entities to fetch
+
+        Returns:
+            Mapped templates keyed by (namespace, name); deleted entities are omitted
+        """
+        chunk_size = max(1, self.client.config.catalog_page_size)
+        templates = {}
+        for start in range(0, len(keys), chunk_size):
+            chunk = keys[start:start + chunk_size]
+            body = {
+                "entityRefs": [f"template:{namespace}/{name}" for namespace, name in chunk],
+                "fields": TEMPLATE_FIELDS
+            }
+            response = self.client._request("POST", "/catalog/entities/by-refs", json_data=body, idempotent=True)
+            for key, item in zip(chunk, response.get("items", [])):
+                if item is not None:
+                    templates[key] = self.client._map_backstage_template(item)
+        return templates
+
+    def sync(self) -> None:
+        """
+        Bring the mirror up to date with the catalog.
+
+        Only entities that are new or whose etag changed are fetched; entities
+        missing from the listing are dropped.
+        """
+        started = time.monotonic()
+        etags = self._list_etags()
+        current = self._entries
+
+        changed = [
+            key for key, etag in etags.items()
+            if key not in current or etag is None or current[key].etag != etag
+        ]
+        fetched = self._fetch_templates(changed) if changed else {}
+
+        entries = {}
+        for key, etag in etags.items():
+            if key in fetched:
+                entries[key] = MirrorEntry(etag, TemplateRecord(fetched[key], self._tag_pool))
+            elif key in current and etag is not None and current[key].etag == etag:
+                entries[key] = current[key]
+
+        removed = sum(1 for key in current if key not in entries)
+        self._entries = entries
+        self._last_sync = time.time()
+        self._ready.set()
+        logger.info(
+            f"Catalog mirror synced {len(entries)} templates "
+            f"({len(fetched)} fetched, {removed} removed) in {time.monotonic() - started:.2f}s"
+        )
+
+    def iter_templates(
+        self,
+        cloud_provider: Optional[str] = None,
+        template_type: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        owner: Optional[str] = None,
+        search: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over mirrored templates matching the filters.
+
+        Args:
+            cloud_provider: Filter by cloud provider
+            template_type: Filter by template type
+            tags: Filter by tags (all must match)
+            owner: Filter by owner
+            search: Search in name, title and description
+
+        Yields:
+            Mapped templates
+        """
+        # Filters run on the records' slots; only matching templates are materialized
+        for entry in self._entries.values():
+            record = entry.record
+            if template_type and record.type != template_type:
+                continue
+            if owner and record.owner != owner:
+                continue
+            if tags and not all(tag in (record.tags or ()) for tag in tags):
+                continue
+            if (cloud_provider or search) and not self.client._matches_local_filters(
+                record.to_dict(full=False), cloud_provider, search
+            ):
+                continue
+            yield record.to_dict()
+
+    def get_template(self, namespace: str, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a mirrored template.
+
+        Args:
+            namespace: Entity namespace
+            name: Template name
+
+        Returns:
+            Mapped template, or None if it is not in the catalog
+        """
+        entry = self._entries.get((namespace, name))
+        return entry.record.to_dict() if entry is not None else None
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -9,6 +9,37 @@ from typing import Dict, List, Optional, Any
 from datetime import datetime
 
 
+# Entity fields read by BackstageClient._map_backstage_template, requested through
+# the catalog "fields" projection so listings don't transfer full entities
+TEMPLATE_FIELDS = [
+    "apiVersion",
+    "kind",
+    "metadata.name",
+    "metadata.description",
+    "metadata.tags",
+    "metadata.annotations",
+    "spec.title",
+    "spec.owner",
+    "spec.type",
+    "spec.templater",
+    "spec.parameters",
+    "spec.output"
+]
+
+# Catalog entity fields behind the sortable template fields, for the by-query orderField
+ORDER_FIELDS = {
+    "name": "metadata.name",
+    "title": "spec.title",
+    "type": "spec.type",
+    "owner": "spec.owner"
+}
+
+# Origins of listing cursors: pages cut by the catalog, and pages cut from a
+# listing held in memory (the mirror, or the whole catalog fetched page by page)
+CATALOG_CURSOR = "catalog"
+LISTING_CURSOR = "listing"
+
+
 class BackstageTemplate(BaseModel):
     """Representation of a template in Backstage."""
     metadata: Dict[str, Any]
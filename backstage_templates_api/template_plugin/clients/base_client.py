@@ -5,17 +5,23 @@ This module defines the abstract base class for all template clients.
 Each client implementation must provide the functionality defined here.
 """
 
+import asyncio
+import functools
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any, Callable
 
 from template_plugin.models.template_models import TemplateTaskResponse, TemplateParameterSchema, TemplateTask
+from template_plugin.errors.exceptions import TemplateNotFoundError, TemplateValidationError
 
 
 class BaseClient(ABC):
     """
     Base abstract class that defines the interface for template clients.
     
-    Any concrete implementation must implement all methods defined here.
+    Any concrete implementation must implement all abstract methods defined here.
+    The ``a``-prefixed coroutine variants default to running the synchronous
+    implementation in the event loop's thread pool executor, so they never block
+    the loop. Clients with a native asyncio transport should override them.
     """
     
     @abstractmethod
@@ -26,6 +32,10 @@ class BaseClient(ABC):
         tags: Optional[List[str]] = None,
         owner: Optional[str] = None,
         search: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        cursor: Optional[str] = None,
+        sort: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         List available templates with optional filtering.
@@ -36,9 +46,13 @@ class BaseClient(ABC):
             tags: Filter by tags
             owner: Filter by owner
             search: Search text across template metadata
+            limit: Maximum number of templates to return
+            offset: Number of templates to skip (ignored if a cursor is given)
+            cursor: Cursor returned as next_cursor by a previous call
+            sort: Sort field ("name", "title", "type" or "owner"), prefixed with "-" for descending order
             
         Returns:
-            Dictionary with template items and total count
+            Dictionary with template items, total count and the cursor of the next page
         """
         pass
     
@@ -55,6 +69,34 @@ class BaseClient(ABC):
         """
         pass
     
+    def get_templates(self, template_names: List[str]) -> Dict[str, Any]:
+        """
+        Get several templates by name in one call.
+        
+        This default looks the templates up one by one; clients with a bulk API
+        or an index should override it.
+        
+        Args:
+            template_names: Names of the templates to retrieve
+            
+        Returns:
+            Dictionary with the found template items (in request order), their
+            count and the names that were not found
+        """
+        templates = []
+        not_found = []
+        for template_name in dict.fromkeys(template_names):
+            try:
+                templates.append(self.get_template(template_name))
+            except TemplateNotFoundError:
+                not_found.append(template_name)
+        
+        return {
+            "items": templates,
+            "total_count": len(templates),
+            "not_found": not_found
+        }
+    
     @abstractmethod
     def get_template_parameters(self, template_name: str) -> Dict[str, Any]:
         """
@@ -111,4 +153,162 @@ class BaseClient(ABC):
         Returns:
             TemplateTaskResponse with current status and outputs if available
         """
-        pass
\ No newline at end of file
+        pass
+
+    def render_archive(self, task: TemplateTask, archive_format: str = "zip") -> Iterator[bytes]:
+        """
+        Render a template straight into a streamed archive.
+        
+        Only clients that render templates themselves support this; the default
+        implementation raises.
+        
+        Args:
+            task: TemplateTask object with template name and parameters
+            archive_format: Archive format (zip, tar or tar.gz)
+            
+        Returns:
+            Iterator over the archive bytes, rendering the template as it is consumed
+            
+        Raises:
+            TemplateValidationError: If the client cannot render templates into archives
+        """
+        raise TemplateValidationError(f"{type(self).__name__} does not support rendering templates into archives")
+
+    def close(self) -> None:
+        """
+        Release any resources held by the client (connections, file handles).
+
+        Clients without long-lived resources can rely on this no-op default.
+        """
+        pass
+
+    async def _run_in_executor(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Run a blocking client method in the default executor of the running loop.
+        
+        Args:
+            func: Blocking callable to run
+            *args: Positional arguments for the callable
+            **kwargs: Keyword arguments for the callable
+            
+        Returns:
+            The callable's return value
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+
+    async def alist_templates(
+        self,
+        cloud_provider: Optional[str] = None,
+        template_type: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        owner: Optional[str] = None,
+        search: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        cursor: Optional[str] = None,
+        sort: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Async variant of list_templates.
+        
+        Returns:
+            Dictionary with template items, total count and the cursor of the next page
+        """
+        return await self._run_in_executor(
+            self.list_templates,
+            cloud_provider=cloud_provider,
+            template_type=template_type,
+            tags=tags,
+            owner=owner,
+            search=search,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            sort=sort
+        )
+
+    async def aget_template(self, template_name: str) -> Dict[str, Any]:
+        """
+        Async variant of get_template.
+        
+        Returns:
+            Template data dictionary
+        """
+        return await self._run_in_executor(self.get_template, template_name)
+
+    async def aget_templates(self, template_names: List[str]) -> Dict[str, Any]:
+        """
+        Async variant of get_templates.
+        
+        Returns:
+            Dictionary with template items, total count and names not found
+        """
+        return await self._run_in_executor(self.get_templates, template_names)
+
+    async def aget_template_parameters(self, template_name: str) -> Dict[str, Any]:
+        """
+        Async variant of get_template_parameters.
+        
+        Returns:
+            Template parameter schema
+        """
+        return await self._run_in_executor(self.get_template_parameters, template_name)
+
+    async def aexecute_template(
+        self,
+        task: TemplateTask,
+        s3_bucket: Optional[str] = None,
+        s3_key: Optional[str] = None,
+        local_path: Optional[str] = None,
+        aws_access_key: Optional[str] = None,
+        aws_secret_key: Optional[str] = None,
+        aws_region: str = "us-east-1",
+        poll_interval: int = 5,
+        timeout: int = 300
+    ) -> TemplateTaskResponse:
+        """
+        Async variant of execute_template.
+        
+        Returns:
+            TemplateTaskResponse with task ID and status
+        """
+        return await self._run_in_executor(
+            self.execute_template,
+            task=task,
+            s3_bucket=s3_bucket,
+            s3_key=s3_key,
+            local_path=local_path,
+            aws_access_key=aws_access_key,
+            aws_secret_key=aws_secret_key,
+            aws_region=aws_region,
+            poll_interval=poll_interval,
+            timeout=timeout
+        )
+
+    async def arender_archive(self, task: TemplateTask, archive_format: str = "zip") -> Iterator[bytes]:
+        """
+        Async variant of render_archive.
+        
+        The template lookup runs in the executor; the returned iterator renders
+        the template as it is consumed and should be iterated off the event loop.
+        
+        Returns:
+            Iterator over the archive bytes
+        """
+        return await self._run_in_executor(self.render_archive, task, archive_format)
+
+    async def aget_task_status(self, task_id: str) -> Dict[str, Any]:
+        """
+        Async variant of get_task_status.
+        
+        Returns:
+            Task status
+        """
+        return await self._run_in_executor(self.get_task_status, task_id)
+
+    async def aclose(self) -> None:
+        """
+        Async variant of close.
+        """
+        self.close()
\ No newline at end of file
@@ -9,21 +9,29 @@ import logging
 import os
 import uuid
 import yaml
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any
 import boto3
 import time
 import re
 import shutil
 
 from template_plugin.clients.base_client import BaseClient
+from template_plugin.clients.local.index import TemplateIndex
+from template_plugin.clients.local.models import LocalTemplate
+from template_plugin.clients.local.render_plans import RenderPlanCache
+from template_plugin.clients.local.sqlite_index import SQLiteTemplateStore
 from template_plugin.models.template_models import TemplateTask, TemplateTaskResponse, TaskStatus
-from template_plugin.utils.file_utils import read_yaml_file
-from template_plugin.utils.template_utils import process_template_files
+from template_plugin.utils.archive_utils import stream_archive
+from template_plugin.utils.file_utils import read_yaml_file, read_yaml_partial, configure_yaml_cache
+from template_plugin.utils.pagination_utils import paginate_items
+from template_plugin.utils.template_utils import process_template_files, configure_template_cache
 from template_plugin.errors.exceptions import (
     TemplateError,
     TemplateNotFoundError,
     TemplateExecutionError,
+    TemplateValidationError,
     FileAccessError
 )
 from template_plugin.config.config import LocalClientConfig
@@ -31,12 +39,24 @@ from template_plugin.s3 import S3Client
 
 logger = logging.getLogger("local-template-client")
 
+# Spec fields kept in template summaries when lazy loading (the listing filters and sort fields)
+SUMMARY_SPEC_FIELDS = ("owner", "type")
+
+# Parts of template.yaml files read by _load_template_summary
+SUMMARY_KEYS = {
+    "apiVersion": None,
+    "kind": None,
+    "metadata": None,
+    "spec": SUMMARY_SPEC_FIELDS
+}
+
 class LocalClient(BaseClient):
     """
     Implementation of BaseClient for local file-based templates.
     
     This client reads templates from local files and provides template operations
-    without relying on external services.
+    without relying on external services. Its async methods use the executor-backed
+    defaults from BaseClient, since file access and YAML parsing are blocking.
     """
     
     def __init__(self, config: LocalClientConfig):
@@ -52,6 +72,43 @@ class LocalClient(BaseClient):
         if not os.path.exists(self.templates_dir):
             logger.warning(f"Templates directory does not exist: {self.templates_dir}")
             os.makedirs(self.templates_dir, exist_ok=True)
+        self.output_dir = os.path.abspath(config.output_dir)
+        configure_yaml_cache(config.yaml_cache_max_bytes)
+        configure_template_cache(config.template_cache_max_entries, config.template_bytecode_cache_dir)
+        
+        # Optional on-disk store of parsed templates, shared across restarts and workers
+        self._store: Optional[SQLiteTemplateStore] = None
+        if config.index_db_path:
+            self._store = SQLiteTemplateStore(config.index_db_path)
+        
+        # Name -> template index, revalidated through file and directory mtimes
+        self._index = TemplateIndex(
+            templates_dir=self.templates_dir,
+            catalog_file=self.catalog_file,
+            load_template=self._load_template_summary if config.lazy_load else self._load_template_from_file,
+            catalog_paths=self._get_catalog_template_paths,
+            revalidate_interval=config.index_revalidate_interval,
+            exclude_dirs=[self.output_dir],
+            store=self._store,
+            parse_workers=config.parse_workers,
+            partial=config.lazy_load,
+            snapshot_file=config.snapshot_file
+        )
+        
+        # Skeleton directory -> compiled render plan, revalidated like the index
+        self._render_plans = RenderPlanCache(
+            max_entries=config.render_plan_cache_size,
+            revalidate_interval=config.index_revalidate_interval
+        )
+        
+        # Threads copying and rendering skeleton files, shared by all executions
+        self._render_executor: Optional[ThreadPoolExecutor] = None
+        render_workers = config.render_workers or os.cpu_count() or 1
+        if render_workers > 1:
+            self._render_executor = ThreadPoolExecutor(
+                max_workers=render_workers,
+                thread_name_prefix="template-render"
+            )
     
     def list_templates(
         self,
@@ -59,130 +116,146 @@ class LocalClient(BaseClient):
         template_type: Optional[str] = None,
         tags: Optional[List[str]] = None,
         owner: Optional[str] = None,
-        search: Optional[str] = None
+        search: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        cursor: Optional[str] = None,
+        sort: Optional[str] = None
     ) -> Dict[str, Any]:
         """
-        List templates with optional filtering.
+        List templates with optional filtering, sorting and pagination.
         
         Args:
             cloud_provider: Filter by cloud provider
             template_type: Filter by template type
             tags: Filter by tags
             owner: Filter by owner
-            search: Search in name and description
+            search: Search in name, title, description and tags (results are ranked)
+            limit: Maximum number of templates to return
+            offset: Number of templates to skip (ignored if a cursor is given)
+            cursor: Cursor returned as next_cursor by a previous call
+            sort: Sort field ("name", "title", "type" or "owner"), prefixed with "-" for descending order
             
         Returns:
-            List of templates
+            Dictionary with template items, total count and the cursor of the next page
         """
         try:
             logger.info(f"Listing templates from {self.templates_dir}")
             
-            # If catalog file exists, use it to get template metadata
-            if self.catalog_file and os.path.exists(self.catalog_file):
-                templates = self._load_templates_from_catalog()
-            else:
-                # Otherwise, scan the templates directory
-                templates = self._scan_templates_directory()
-            
-            # Apply filters
-            filtered_templates = templates
-            
-            if cloud_provider:
-                filtered_templates = [
-                    t for t in filtered_templates 
-                    if t.get("metadata", {}).get("cloud_provider") == cloud_provider
-                ]
-            
-            if template_type:
-                filtered_templates = [
-                    t for t in filtered_templates 
-                    if t.get("spec", {}).get("type") == template_type
-                ]
-            
-            if tags:
-                filtered_templates = [
-                    t for t in filtered_templates 
-                    if all(tag in t.get("metadata", {}).get("tags", []) for tag in tags)
+            if search:
+                # Ranked full-text search over the in-memory index, restricted by the facet filters
+                templates = [
+                    template.yaml_data for template in
+                    self._index.search_templates(search, cloud_provider, template_type, tags, owner)
                 ]
+                return paginate_items(templates, limit, offset, cursor, sort)
             
-            if owner:
-                filtered_templates = [
-                    t for t in filtered_templates 
-                    if t.get("spec", {}).get("owner") == owner
-                ]
+            paginated = limit is not None or offset or cursor or sort
+            if self._store is not None and not paginated and self._index.refresh_store():
+                # The store is up to date with the index, so run the filters as indexed SQL queries
+                templates = self._store.query_templates(cloud_provider, template_type, tags, owner)
+                return {
+                    "items": templates,
+                    "total_count": len(templates),
+                    "next_cursor": None
+                }
             
-            if search:
-                search = search.lower()
-                filtered_templates = [
-                    t for t in filtered_templates 
-                    if (search in t.get("metadata", {}).get("name", "").lower() or
-                        search in t.get("metadata", {}).get("description", "").lower() or
-                        search in t.get("metadata", {}).get("title", "").lower())
-                ]
+            # Facet filters are answered by the index's bitsets, in listing order
+            # (catalog templates if the catalog file exists, otherwise scanned templates),
+            # and pages are cut from its precomputed sort orders
+            page = self._index.page_templates(
+                cloud_provider, template_type, tags, owner,
+                limit=limit, offset=offset, cursor=cursor, sort=sort
+            )
             
             return {
-                "items": filtered_templates,
-                "total_count": len(filtered_templates)
+                "items": [template.yaml_data for template in page["items"]],
+                "total_count": page["total_count"],
+                "next_cursor": page["next_cursor"]
             }
+        except TemplateValidationError:
+            raise
         except Exception as e:
             logger.error(f"Failed to list templates: {str(e)}")
             raise TemplateError(f"Failed to list templates: {str(e)}")
     
-    def _load_templates_from_catalog(self) -> List[Dict[str, Any]]:
+    def write_snapshot(self, path: str) -> None:
         """
-        Load templates from catalog file.
+        Rebuild the template index and write it to a snapshot file.
+        
+        Workers configured with snapshot_file map the snapshot instead of
+        scanning and parsing the templates at startup.
+        
+        Args:
+            path: Snapshot file path
+        """
+        try:
+            logger.info(f"Writing template snapshot to {path}")
+            self._index.write_snapshot(path)
+        except Exception as e:
+            logger.error(f"Failed to write template snapshot: {str(e)}")
+            raise TemplateError(f"Failed to write template snapshot: {str(e)}")
+    
+    def _get_catalog_template_paths(self) -> List[str]:
+        """
+        Get the template file paths listed in the catalog file.
         
         Returns:
-            List of templates
+            List of template file paths
         """
         try:
             catalog_data = read_yaml_file(self.catalog_file)
-            templates = []
+            template_paths = []
             
             if catalog_data.get('kind') == 'Location' and 'spec' in catalog_data and 'targets' in catalog_data['spec']:
-                template_paths = catalog_data['spec']['targets']
-                logger.info(f"Found {len(template_paths)} template paths in catalog file")
+                targets = catalog_data['spec']['targets']
+                logger.info(f"Found {len(targets)} template paths in catalog file")
                 
-                for path in template_paths:
+                for path in targets:
                     if path.endswith('template.yaml'):
-                        full_path = os.path.join(os.path.dirname(self.catalog_file), path)
-                        try:
-                            template = self._load_template_from_file(full_path)
-                            templates.append(template)
-                        except Exception as e:
-                            logger.error(f"Error loading template {path}: {str(e)}")
+                        template_paths.append(os.path.join(os.path.dirname(self.catalog_file), path))
             else:
                 logger.warning(f"Catalog file doesn't have the expected structure")
                 
-            return templates
+            return template_paths
         except Exception as e:
             logger.error(f"Error loading catalog: {str(e)}")
             return []
     
-    def _scan_templates_directory(self) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _add_cloud_provider(file_path: str, template_data: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Scan templates directory for template.yaml files.
+        Set metadata.cloud_provider from the template's file path.
         
+        Args:
+            file_path: Path to the template file
+            template_data: Template data
+            
         Returns:
-            List of templates
+            Template data
         """
-        templates = []
-        
-        for dirpath, dirnames, filenames in os.walk(self.templates_dir):
-            if "template.yaml" in filenames:
-                template_path = os.path.join(dirpath, "template.yaml")
-                try:
-                    template = self._load_template_from_file(template_path)
-                    templates.append(template)
-                except Exception as e:
-                    logger.error(f"Error loading template {template_path}: {str(e)}")
-        
-        return templates
+        # Extract cloud provider from file path or tags
+        cloud_provider = None
+        if "/aws/" in file_path:
+            cloud_provider = "aws"
+        elif "/azure/" in file_path:
+            cloud_provider = "azure"
+        elif "/gcp/" in file_path:
+            cloud_provider = "gcp"
+            
+        # Enhance metadata with cloud provider
+        if 'metadata' in template_data:
+            template_data['metadata']['cloud_provider'] = cloud_provider
+            
+        return template_data
     
-    def _load_template_from_file(self, file_path: str) -> Dict[str, Any]:
+    @staticmethod
+    def _load_template_from_file(file_path: str) -> Dict[str, Any]:
         """
         Load a template from a file.
         
+        This is a static method so that it can be sent to parse worker processes.
+        
         Args:
             file_path: Path to the template file
             
@@ -192,25 +265,50 @@ class LocalClient(BaseClient):
         try:
             logger.info(f"Loading template from file: {file_path}")
             template_data = read_yaml_file(file_path)
+            return LocalClient._add_cloud_provider(file_path, template_data)
+        except Exception as e:
+            logger.error(f"Failed to load template: {str(e)}")
+            raise TemplateError(f"Failed to load template: {str(e)}")
+    
+    @staticmethod
+    def _load_template_summary(file_path: str) -> Dict[str, Any]:
+        """
+        Load the listing fields of a template from a file (lazy loading mode).
+        
+        Only apiVersion, kind, metadata and the SUMMARY_SPEC_FIELDS of spec are
+        parsed; parameter schemas and steps are left unparsed.
+        
+        Args:
+            file_path: Path to the template file
             
-            # Extract cloud provider from file path or tags
-            cloud_provider = None
-            if "/aws/" in file_path:
-                cloud_provider = "aws"
-            elif "/azure/" in file_path:
-                cloud_provider = "azure"
-            elif "/gcp/" in file_path:
-                cloud_provider = "gcp"
-                
-            # Enhance metadata with cloud provider
-            if 'metadata' in template_data:
-                template_data['metadata']['cloud_provider'] = cloud_provider
-                
-            return template_data
+        Returns:
+            Template summary
+        """
+        try:
+            logger.info(f"Loading template summary from file: {file_path}")
+            template_data = read_yaml_partial(file_path, SUMMARY_KEYS)
+            return LocalClient._add_cloud_provider(file_path, template_data)
         except Exception as e:
             logger.error(f"Failed to load template: {str(e)}")
             raise TemplateError(f"Failed to load template: {str(e)}")
     
+    def _get_template_data(self, template: LocalTemplate) -> Dict[str, Any]:
+        """
+        Get the full document of an indexed template.
+        
+        In lazy loading mode the index only holds summaries, so the document is
+        read from the file, through the size-bounded parsed YAML cache.
+        
+        Args:
+            template: Indexed template
+            
+        Returns:
+            Template data
+        """
+        if self.config.lazy_load:
+            return self._load_template_from_file(template.path)
+        return template.yaml_data
+    
     def get_template(self, template_name: str) -> Dict[str, Any]:
         """
         Get a specific template by name.
@@ -224,29 +322,47 @@ class LocalClient(BaseClient):
         try:
             logger.info(f"Finding template: {template_name}")
             
-            # If catalog file exists, try to find the template there first
-            if self.catalog_file and os.path.exists(self.catalog_file):
-                templates = self._load_templates_from_catalog()
-                for template in templates:
-                    if template.get("metadata", {}).get("name") == template_name:
-                        return template
-            
-            # Otherwise, try to find the template by scanning the directory
-            for dirpath, dirnames, filenames in os.walk(self.templates_dir):
-                if "template.yaml" in filenames:
-                    template_path = os.path.join(dirpath, "template.yaml")
-                    template = self._load_template_from_file(template_path)
-                    if template.get("metadata", {}).get("name") == template_name:
-                        return template
-            
-            # Template not found
-            raise TemplateNotFoundError(f"Template not found: {template_name}")
+            # Catalog templates take precedence over scanned ones
+            template = self._index.get(template_name)
+            if template is None:
+                raise TemplateNotFoundError(f"Template not found: {template_name}")
+            return self._get_template_data(template)
         except TemplateNotFoundError:
             raise
         except Exception as e:
             logger.error(f"Failed to get template: {str(e)}")
             raise TemplateError(f"Failed to get template: {str(e)}")
     
+    def get_templates(self, template_names: List[str]) -> Dict[str, Any]:
+        """
+        Get several templates by name from the template index.
+        
+        Args:
+            template_names: Names of the templates to retrieve
+            
+        Returns:
+            Dictionary with template items, total count and names not found
+        """
+        try:
+            logger.info(f"Finding {len(template_names)} templates")
+            templates = []
+            not_found = []
+            for template_name in dict.fromkeys(template_names):
+                template = self._index.get(template_name)
+                if template is not None:
+                    templates.append(self._get_template_data(template))
+                else:
+                    not_found.append(template_name)
+            
+            return {
+                "items": templates,
+                "total_count": len(templates),
+                "not_found": not_found
+            }
+        except Exception as e:
+            logger.error(f"Failed to get templates: {str(e)}")
+            raise TemplateError(f"Failed to get templates: {str(e)}")
+    
     def get_template_parameters(self, template_name: str) -> Dict[str, Any]:
         """
         Get parameter schema for a specific template.
@@ -259,9 +375,16 @@ class LocalClient(BaseClient):
         """
         try:
             logger.info(f"Getting parameters for template: {template_name}")
-            template = self.get_template(template_name)
-            if template and template.get("spec", {}).get("parameters"):
-                return {"parameters": template["spec"]["parameters"]}
+            template = self._index.get(template_name)
+            if template is None:
+                raise TemplateNotFoundError(f"Template not found: {template_name}")
+            if self.config.lazy_load:
+                parameters = self._get_template_data(template).get("spec", {}).get("parameters")
+            else:
+                # Only the parameters blob is decoded, not the rest of the document
+                parameters = template.record.parameters
+            if parameters:
+                return {"parameters": parameters}
             else:
                 raise TemplateNotFoundError(f"Template parameters not found: {template_name}")
         except TemplateNotFoundError:
@@ -305,32 +428,21 @@ class LocalClient(BaseClient):
         try:
             logger.info(f"Executing template: {task.template_name} (dry run: {task.dry_run})")
             
-            # Get the template
-            template = self.get_template(task.template_name)
-            
-            # Get the template directory
-            template_dir = None
-            for dirpath, dirnames, filenames in os.walk(self.templates_dir):
-                if "template.yaml" in filenames:
-                    temp_template_path = os.path.join(dirpath, "template.yaml")
-                    temp_template = read_yaml_file(temp_template_path)
-                    if temp_template.get("metadata", {}).get("name") == task.template_name:
-                        template_dir = dirpath
-                        break
-            
-            if not template_dir:
+            # Get the template and its directory from the index
+            template = self._index.get(task.template_name)
+            if template is None:
                 raise TemplateNotFoundError(f"Template directory not found for: {task.template_name}")
             
             # Find skeleton directory
-            skeleton_dir = os.path.join(template_dir, "skeleton")
+            skeleton_dir = template.skeleton_dir
             if not os.path.exists(skeleton_dir):
                 raise FileAccessError(f"Skeleton directory not found: {skeleton_dir}")
             
             # Generate a task ID
             task_id = str(uuid.uuid4())
             
-            # For local execution, create an output directory
-            output_dir = os.path.join(self.templates_dir, f"output_{task_id}")
+            # For local execution, create an output directory under the output root
+            output_dir = os.path.join(self.output_dir, f"output_{task_id}")
             os.makedirs(output_dir, exist_ok=True)
             
             if not task.dry_run:
@@ -338,7 +450,10 @@ class LocalClient(BaseClient):
                 process_template_files(
                     source_dir=skeleton_dir,
                     target_dir=output_dir,
-                    values=task.parameters
+                    values=task.parameters,
+                    plan=self._render_plans.get(skeleton_dir),
+                    executor=self._render_executor,
+                    hardlink=self.config.skeleton_hardlinks
                 )
                 status = TaskStatus.COMPLETED
             else:
@@ -392,6 +507,66 @@ class LocalClient(BaseClient):
             logger.error(f"Failed to execute template: {str(e)}")
             raise TemplateExecutionError(f"Failed to execute template: {str(e)}")
     
+    def render_archive(self, task: TemplateTask, archive_format: str = "zip") -> Iterator[bytes]:
+        """
+        Render a template straight into a streamed archive.
+        
+        Files are rendered from the cached render plan of the skeleton as the
+        archive is consumed, without an output directory, so the first bytes
+        are available before the whole template is rendered.
+        
+        Args:
+            task: Template task with template name and parameters
+            archive_format: Archive format (zip, tar or tar.gz)
+            
+        Returns:
+            Iterator over the archive bytes. A rendering error raised while it
+            is consumed ends the archive early.
+            
+        Raises:
+            TemplateNotFoundError: If the template is not found
+            TemplateValidationError: If the archive format is not supported
+            TemplateExecutionError: If the skeleton cannot be loaded
+        """
+        try:
+            logger.info(f"Rendering template archive: {task.template_name} ({archive_format})")
+            
+            template = self._index.get(task.template_name)
+            if template is None:
+                raise TemplateNotFoundError(f"Template not found: {task.template_name}")
+            
+            skeleton_dir = template.skeleton_dir
+            if not os.path.exists(skeleton_dir):
+                raise FileAccessError(f"Skeleton directory not found: {skeleton_dir}")
+            
+            plan = self._render_plans.get(skeleton_dir)
+            chunks = stream_archive(plan.directories, plan.iter_members(task.parameters), archive_format)
+            return self._log_archive_errors(task.template_name, chunks)
+        except (TemplateNotFoundError, TemplateValidationError):
+            raise
+        except Exception as e:
+            logger.error(f"Failed to render template archive: {str(e)}")
+            raise TemplateExecutionError(f"Failed to render template archive: {str(e)}")
+    
+    @staticmethod
+    def _log_archive_errors(template_name: str, chunks: Iterator[bytes]) -> Iterator[bytes]:
+        try:
+            yield from chunks
+        except Exception as e:
+            logger.error(f"Failed to stream archive of template {template_name}: {str(e)}")
+            raise
+    
+    def close(self) -> None:
+        """
+        Close the persistent template store, if any, and the parse processes and render threads.
+        """
+        self._index.close()
+        if self._store is not None:
+            self._store.close()
+        if self._render_executor is not None:
+            self._render_executor.shutdown(wait=True)
+            self._render_executor = None
+    
     def get_task_status(self, task_id: str) -> Dict[str, Any]:
         """
         Get status of a task.
@@ -407,8 +582,10 @@ class LocalClient(BaseClient):
         try:
             logger.info(f"Getting status for task: {task_id}")
             
-            # Check if output directory exists
-            output_dir = os.path.join(self.templates_dir, f"output_{task_id}")
+            # Check if output directory exists, including the legacy location inside templates_dir
+            output_dir = os.path.join(self.output_dir, f"output_{task_id}")
+            if not os.path.exists(output_dir):
+                output_dir = os.path.join(self.templates_dir, f"output_{task_id}")
             
             if os.path.exists(output_dir):
                 # Check if log file has any errors
@@ -0,0 +1,157 @@
+"""
+Template Facet Index
+
+This module provides inverted indexes from facet values (cloud provider, type,
+owner and tags) to bitsets of template positions, so that list filters are
+answered by intersecting bitsets instead of scanning every template.
+"""
+
+import re
+from typing import Any, Dict, Hashable, List, Optional, Sequence
+
+_SET_BIT = re.compile("1")
+
+
+def positions_to_mask(positions: Sequence[int], size: int) -> int:
+    """
+    Build a bitset from bit positions.
+
+    Args:
+        positions: Positions of the bits to set
+        size: Number of bits of the bitset
+
+    Returns:
+        Bitset
+    """
+    data = bytearray((size + 7) // 8)
+    for position in positions:
+        data[position >> 3] |= 1 << (position & 7)
+    return int.from_bytes(bytes(data), "little")
+
+
+def iter_bits(mask: int) -> List[int]:
+    """
+    Get the positions of the set bits of a bitset, in increasing order.
+
+    Args:
+        mask: Bitset
+
+    Returns:
+        Positions of the set bits
+    """
+    # Scanning the reversed binary string runs in C, unlike shifting the int bit by bit
+    return [match.start() for match in _SET_BIT.finditer(bin(mask)[:1:-1])]
+
+
+class FacetIndex:
+    """
+    Bitset index over a fixed, ordered list of templates.
+
+    Bit i of a bitset is set when the i-th template has the facet value, so
+    intersections keep the listing order for free. Python ints are used as
+    bitsets: intersecting two facets of a 50k-template listing is a single
+    AND over ~6 KB.
+    """
+
+    FACETS = ("cloud_provider", "type", "owner", "tag")
+
+    def __init__(self, templates: Sequence[Dict[str, Any]]):
+        """
+        Build the index.
+
+        Args:
+            templates: Template data, in listing order
+        """
+        self.size = len(templates)
+        self.all = (1 << self.size) - 1
+
+        positions: Dict[str, Dict[Hashable, List[int]]] = {facet: {} for facet in self.FACETS}
+        for position, template in enumerate(templates):
+            metadata = template.get("metadata") or {}
+            spec = template.get("spec") or {}
+            self._add(positions["cloud_provider"], metadata.get("cloud_provider"), position)
+            self._add(positions["type"], spec.get("type"), position)
+            self._add(positions["owner"], spec.get("owner"), position)
+            tags = metadata.get("tags")
+            if isinstance(tags, (list, tuple)):
+                for tag in tags:
+                    self._add(positions["tag"], tag, position)
+
+        # Posting lists are built first and converted once, as OR-ing bits one by one
+        # into large ints would be quadratic
+        self._postings: Dict[str, Dict[Hashable, int]] = {
+            facet: {value: positions_to_mask(value_positions, self.size) for value, value_positions in values.items()}
+            for facet, values in positions.items()
+        }
+
+    @staticmethod
+    def _add(postings: Dict[Hashable, List[int]], value: Any, position: int) -> None:
+        if value is None:
+            return
+        try:
+            value_positions = postings.setdefault(value, [])
+        except TypeError:
+            # Unhashable values can never equal a filter value
+            return
+        if not value_positions or value_positions[-1] != position:
+            value_positions.append(position)
+
+    def match(
+        self,
+        cloud_provider: Optional[str] = None,
+        template_type: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        owner: Optional[str] = None
+    ) -> List[int]:
+        """
+        Get the positions of the templates matching all the given filters.
+
+        Args:
+            cloud_provider: Filter by cloud provider
+            template_type: Filter by template type
+            tags: Filter by tags (all must match)
+            owner: Filter by owner
+
+        Returns:
+            Matching positions, in listing order
+        """
+        if not (cloud_provider or template_type or owner or tags):
+            return list(range(self.size))
+
+        mask = self.all
+        if cloud_provider:
+            mask &= self.mask("cloud_provider", cloud_provider)
+        if template_type:
+            mask &= self.mask("type", template_type)
+        if owner:
+            mask &= self.mask("owner", owner)
+        for tag in tags or []:
+            if not mask:
+                break
+            mask &= self.mask("tag", tag)
+        return iter_bits(mask)
+
+    def mask(self, facet: str, value: Hashable) -> int:
+        """
+        Get the bitset of the templates having a facet value.
+
+        Args:
+            facet: One of FACETS
+            value: Facet value
+
+        Returns:
+            Bitset (0 if no template has the value)
+        """
+        return self._postings[facet].get(value, 0)
+
+    def values(self, facet: str) -> Dict[Hashable, int]:
+        """
+        Get the number of templates per value of a facet.
+
+        Args:
+            facet: One of FACETS
+
+        Returns:
+            Dictionary of template counts keyed by facet value
+        """
+        return {value: bin(self.mask(facet, value)).count("1") for value in self._postings[facet]}
@@ -0,0 +1,604 @@
+"""
+Local Template Index
+
+This module provides an in-memory index of the local templates, keyed by name.
+The index is built once and revalidated through directory and file mtimes, so
+lookups don't re-walk the templates directory or re-parse template.yaml files
+that have not changed.
+"""
+
+import bisect
+import functools
+import hashlib
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from template_plugin.clients.local.facets import FacetIndex
+from template_plugin.clients.local.models import LocalTemplate
+from template_plugin.clients.local.search import SearchIndex
+from template_plugin.clients.local.snapshot import SnapshotState, load_snapshot, write_snapshot
+from template_plugin.clients.local.sqlite_index import SQLiteTemplateStore
+from template_plugin.utils.file_utils import walk_template_dirs
+from template_plugin.utils.pagination_utils import parse_sort, sort_key, encode_cursor, decode_cursor
+from template_plugin.errors.exceptions import TemplateValidationError
+
+logger = logging.getLogger("local-template-index")
+
+# (st_mtime_ns, st_size) of a file, or None if it does not exist
+FileStat = Optional[Tuple[int, int]]
+
+# Parse workers are started by a fork server (or spawned where there is none):
+# forking the multithreaded server process could copy locks held by other threads
+PARSE_START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+
+def _stat_file(path: str) -> FileStat:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _parse_file(load_template: Callable[[str], Dict], path: str) -> Tuple[Optional[Dict], Optional[str]]:
+    """Parse a template file, returning the error instead of raising (runs in pool workers)."""
+    try:
+        return load_template(path), None
+    except Exception as e:
+        return None, str(e)
+
+
+class _IndexState:
+    """Immutable snapshot of the index, swapped as a whole on rebuild."""
+
+    __slots__ = ("by_name", "listing", "facets", "dir_mtimes", "file_stats", "_search", "_sort_orders")
+
+    def __init__(
+        self,
+        by_name: Dict[str, LocalTemplate],
+        listing: List[LocalTemplate],
+        facets: FacetIndex,
+        dir_mtimes: Dict[str, int],
+        file_stats: Dict[str, FileStat]
+    ):
+        self.by_name = by_name
+        self.listing = listing
+        self.facets = facets
+        self._search: Optional[SearchIndex] = None
+        self._sort_orders: Dict[str, Tuple[List[int], List[Tuple], List[Tuple]]] = {}
+        self.dir_mtimes = dir_mtimes
+        self.file_stats = file_stats
+
+    @property
+    def search(self) -> SearchIndex:
+        """Full-text index of the listing, built on first use."""
+        if self._search is None:
+            self._search = SearchIndex([template.summary for template in self.listing])
+        return self._search
+
+    def sort_order(self, field: str) -> Tuple[List[int], List[Tuple], List[Tuple]]:
+        """
+        Get the listing sorted on a field, computed once per snapshot.
+
+        Keys are the field's sort key followed by the position, so they are unique.
+
+        Returns:
+            Tuple of (positions in ascending key order, keys in ascending order, key of each position)
+        """
+        order = self._sort_orders.get(field)
+        if order is None:
+            keys_by_position = [
+                sort_key(template.summary, field) + (position,)
+                for position, template in enumerate(self.listing)
+            ]
+            positions = sorted(range(len(keys_by_position)), key=keys_by_position.__getitem__)
+            order = (positions, [keys_by_position[position] for position in positions], keys_by_position)
+            self._sort_orders[field] = order
+        return order
+
+
+class TemplateIndex:
+    """
+    Name-to-template index over a templates directory and an optional catalog file.
+
+    Lookups follow LocalClient's precedence rules: templates listed in the
+    catalog file win over scanned ones, and the first template found for a name
+    wins. Listings return the catalog templates when a catalog file exists, and
+    the scanned templates otherwise.
+
+    The index is revalidated at most once per revalidate_interval by comparing
+    the mtimes of the walked directories (which change when entries are added,
+    removed or renamed) and the mtime and size of the template and catalog files.
+    On a change the tree is walked again, but only modified files are re-parsed.
+    Skeleton and task output subtrees are pruned from the walk (see
+    walk_template_dirs), so neither affects the cost of a revalidation.
+    """
+
+    def __init__(
+        self,
+        templates_dir: str,
+        catalog_file: Optional[str],
+        load_template: Callable[[str], Dict],
+        catalog_paths: Callable[[], List[str]],
+        revalidate_interval: float = 1.0,
+        exclude_dirs: Optional[List[str]] = None,
+        store: Optional[SQLiteTemplateStore] = None,
+        parse_workers: int = 1,
+        partial: bool = False,
+        snapshot_file: Optional[str] = None
+    ):
+        """
+        Initialize the index.
+
+        Args:
+            templates_dir: Directory scanned for template.yaml files
+            catalog_file: Catalog file listing template files, if any
+            load_template: Function loading a template from a template.yaml path
+            catalog_paths: Function returning the template file paths listed in the catalog
+            revalidate_interval: Minimum seconds between two revalidations
+            exclude_dirs: Directories under templates_dir that are never scanned
+            store: Persistent store used to skip parsing files unchanged since a previous run
+            parse_workers: Processes used to parse changed files (1 parses in-process, 0 uses one per CPU);
+                load_template must be picklable to use more than one. The processes are kept
+                for the lifetime of the index and stopped by close()
+            partial: Whether load_template returns only the listing fields of templates;
+                stored entries are only reused when loaded the same way
+            snapshot_file: Snapshot file (see write_snapshot) mapped instead of building the
+                index on first use; it is revalidated like a built index, and on a change
+                only the templates whose files changed since the snapshot are parsed
+        """
+        self.templates_dir = templates_dir
+        self.catalog_file = catalog_file
+        self.load_template = load_template
+        self.catalog_paths = catalog_paths
+        self.revalidate_interval = revalidate_interval
+        self.exclude_dirs = list(exclude_dirs or [])
+        self.store = store
+        self.parse_workers = parse_workers
+        self.partial = partial
+        self.snapshot_file = snapshot_file
+        self._state: Optional[Any] = None
+        self._snapshot: Optional[SnapshotState] = None
+        self._parsed: Dict[str, Tuple[FileStat, Optional[LocalTemplate]]] = {}
+        self._tag_pool: Dict[Tuple, Tuple] = {}
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+        self._parse_executor: Optional[ProcessPoolExecutor] = None
+
+    def get(self, template_name: str) -> Optional[LocalTemplate]:
+        """
+        Look a template up by name.
+
+        Args:
+            template_name: Name of the template
+
+        Returns:
+            The indexed template, or None if there is no template with that name
+        """
+        return self.refresh().by_name.get(template_name)
+
+    def list_templates(self) -> List[LocalTemplate]:
+        """
+        Get the templates to list, in discovery order.
+
+        Returns:
+            Catalog templates if a catalog file exists, otherwise scanned templates
+        """
+        return list(self.refresh().listing)
+
+    def filter_templates(
+        self,
+        cloud_provider: Optional[str] = None,
+        template_type: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        owner: Optional[str] = None
+    ) -> List[LocalTemplate]:
+        """
+        Get the listed templates matching the facet filters, in listing order.
+
+        Args:
+            cloud_provider: Filter by cloud provider
+            template_type: Filter by template type
+            tags: Filter by tags (all must match)
+            owner: Filter by owner
+
+        Returns:
+            Matching templates
+        """
+        state = self.refresh()
+        listing = state.listing
+        return [listing[position] for position in state.facets.match(cloud_provider, template_type, tags, owner)]
+
+    def page_templates(
+        self,
+        cloud_provider: Optional[str] = None,
+        template_type: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        owner: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        cursor: Optional[str] = None,
+        sort: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Get a page of the listed templates matching the facet filters.
+
+        Pages are cut with keyset cursors from the snapshot's precomputed sort
+        orders, so deep pages cost no more than the first one. In the default
+        (listing) order the cursor key is the listing position.
+
+        Args:
+            cloud_provider: Filter by cloud provider
+            template_type: Filter by template type
+            tags: Filter by tags (all must match)
+            owner: Filter by owner
+            limit: Maximum number of templates to return
+            offset: Number of templates to skip (ignored if a cursor is given)
+            cursor: Cursor returned as next_cursor by a previous call
+            sort: Sort specification, e.g. "name" or "-owner"
+
+        Returns:
+            Dictionary with the page's templates, the total count and the next cursor
+
+        Raises:
+            TemplateValidationError: If the sort field or the cursor is invalid
+        """
+        field, descending = parse_sort(sort)
+        after = None
+        if cursor:
+            data = decode_cursor(cursor)
+            if data.get("sort") != sort or not isinstance(data.get("key"), list):
+                raise TemplateValidationError("Pagination cursor does not match the request")
+            after = tuple(data["key"])
+
+        state = self.refresh()
+        matches = state.facets.match(cloud_provider, template_type, tags, owner)
+        filtered = len(matches) < len(state.listing)
+
+        if field is None:
+            # Listing order: the matches are already sorted by position
+            ordered, keys = matches, None
+        else:
+            positions, sorted_keys, keys_by_position = state.sort_order(field)
+            if not filtered:
+                ordered, keys = positions, sorted_keys
+            elif len(matches) * 16 < len(positions):
+                # Few matches: sorting them is cheaper than scanning the full order
+                ordered = sorted(matches, key=keys_by_position.__getitem__)
+                keys = [keys_by_position[position] for position in ordered]
+            else:
+                match_set = set(matches)
+                ordered = [position for position in positions if position in match_set]
+                keys = [keys_by_position[position] for position in ordered]
+
+        # ordered/keys are ascending; descending pages are cut from the end
+        total = len(ordered)
+        start = 0
+        if after is not None:
+            try:
+                if keys is None:
+                    start = bisect.bisect_right(ordered, after[0])
+                elif descending:
+                    start = total - bisect.bisect_left(keys, after)
+                else:
+                    start = bisect.bisect_right(keys, after)
+            except (TypeError, IndexError):
+                raise TemplateValidationError("Invalid pagination cursor")
+        elif offset:
+            start = offset
+        start = min(start, total)
+        end = total if limit is None else min(total, start + limit)
+        page = ordered[total - end:total - start][::-1] if descending else ordered[start:end]
+
+        next_cursor = None
+        if end < total and page:
+            last = page[-1]
+            last_key = [last] if field is None else list(keys_by_position[last])
+            next_cursor = encode_cursor({"sort": sort, "key": last_key})
+
+        listing = state.listing
+        return {
+            "items": [listing[position] for position in page],
+            "total_count": total,
+            "next_cursor": next_cursor
+        }
+
+    def search_templates(
+        self,
+        search: str,
+        cloud_provider: Optional[str] = None,
+        template_type: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        owner: Optional[str] = None
+    ) -> List[LocalTemplate]:
+        """
+        Search the listed templates matching the facet filters, best match first.
+
+        Args:
+            search: Search query (matched against name, title, description and tags)
+            cloud_provider: Filter by cloud provider
+            template_type: Filter by template type
+            tags: Filter by tags (all must match)
+            owner: Filter by owner
+
+        Returns:
+            Matching templates, ranked
+        """
+        state = self.refresh()
+        positions = None
+        if cloud_provider or template_type or tags or owner:
+            positions = state.facets.match(cloud_provider, template_type, tags, owner)
+            if not positions:
+                return []
+        listing = state.listing
+        return [listing[position] for position, _ in state.search.search(search, positions)]
+
+    def invalidate(self) -> None:
+        """Force a revalidation on the next access."""
+        with self._lock:
+            self._checked_at = 0.0
+
+    def refresh(self, force: bool = False) -> _IndexState:
+        """
+        Revalidate the index if needed and return the current snapshot.
+
+        Args:
+            force: Rebuild the index even if nothing changed
+
+        Returns:
+            Current index snapshot
+        """
+        with self._lock:
+            now = time.monotonic()
+            state = self._state
+            if state is not None and not force:
+                if now - self._checked_at < self.revalidate_interval:
+                    return state
+                self._checked_at = now
+                if not self._is_stale(state):
+                    return state
+
+            self._checked_at = now
+            if state is None and not force and self.snapshot_file:
+                self._snapshot = load_snapshot(self.snapshot_file, self.templates_dir, self.catalog_file, self.partial)
+                if self._snapshot is not None:
+                    logger.info(f"Loaded {len(self._snapshot.records)} templates from snapshot {self.snapshot_file}")
+                    self._state = self._snapshot
+                    return self._state
+
+            self._state = self._build()
+            # Templates are now held by the built index, so the snapshot can be unmapped
+            self._snapshot = None
+            return self._state
+
+    def close(self) -> None:
+        """Stop the parse worker processes, if any were started."""
+        with self._lock:
+            if self._parse_executor is not None:
+                self._parse_executor.shutdown(wait=True)
+                self._parse_executor = None
+
+    def refresh_store(self) -> bool:
+        """
+        Revalidate the index and tell whether the persistent store mirrors it.
+
+        The store is synced by every build. While the index is served from a
+        snapshot, nothing has been built yet and the store's listing may be
+        missing or stale.
+
+        Returns:
+            True if a store is configured and can answer listing queries
+        """
+        state = self.refresh()
+        return self.store is not None and not isinstance(state, SnapshotState)
+
+    def write_snapshot(self, path: str) -> None:
+        """
+        Rebuild the index from the template files and write it to a snapshot file.
+
+        Args:
+            path: Snapshot file path
+        """
+        state = self.refresh(force=True)
+        write_snapshot(state, path, self.templates_dir, self.catalog_file, self.partial)
+
+    def _is_stale(self, state: _IndexState) -> bool:
+        for dirpath, mtime_ns in state.dir_mtimes.items():
+            try:
+                if os.stat(dirpath).st_mtime_ns != mtime_ns:
+                    return True
+            except OSError:
+                return True
+        for path, file_stat in state.file_stats.items():
+            if _stat_file(path) != file_stat:
+                return True
+        return False
+
+    def _load_stored(self, path: str, file_stat: Tuple[int, int]) -> Tuple[Optional[Dict], Optional[str]]:
+        """
+        Look a template file up in the persistent store.
+
+        A stored parse is reused when the file's mtime and size are unchanged, or
+        when its content hash is (e.g. the file was only touched or checked out again).
+
+        Returns:
+            Tuple of (stored template data or None, content hash of the file if it was read)
+        """
+        if self.store is None:
+            return None, None
+
+        stored = self.store.get(path)
+        if stored is not None and stored.partial != self.partial:
+            stored = None
+        if stored is not None and (stored.mtime_ns, stored.size) == file_stat:
+            return stored.template, None
+
+        with open(path, "rb") as f:
+            content_hash = hashlib.sha256(f.read()).hexdigest()
+        if stored is not None and stored.content_hash == content_hash:
+            self.store.touch(path, *file_stat)
+            return stored.template, content_hash
+        return None, content_hash
+
+    def _store_snapshot_template(self, path: str, file_stat: Tuple[int, int], template: LocalTemplate) -> None:
+        """
+        Write a template reused from the snapshot to the persistent store, unless it already holds it.
+
+        Without this, the store would lack rows for every file unchanged since
+        the snapshot was written, and its listing queries would skip them.
+        """
+        if self.store is None:
+            return
+        try:
+            stored = self.store.get(path)
+            if stored is not None and stored.partial == self.partial and (stored.mtime_ns, stored.size) == file_stat:
+                return
+            with open(path, "rb") as f:
+                content_hash = hashlib.sha256(f.read()).hexdigest()
+            self.store.put(path, file_stat[0], file_stat[1], content_hash, template.yaml_data, partial=self.partial)
+        except Exception as e:
+            logger.warning(f"Could not store snapshot entry for {path}: {str(e)}")
+
+    def _parse_files(self, paths: List[str]) -> List[Tuple[Optional[Dict], Optional[str]]]:
+        """
+        Parse template files, in a process pool when parse_workers allows it.
+
+        Returns:
+            (template data, error message) for each path, in the order of paths
+        """
+        workers = self.parse_workers or os.cpu_count() or 1
+        parse = functools.partial(_parse_file, self.load_template)
+        if workers > 1 and len(paths) > 1:
+            if self._parse_executor is None:
+                self._parse_executor = ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context(PARSE_START_METHOD)
+                )
+            try:
+                chunksize = max(1, len(paths) // (min(workers, len(paths)) * 4))
+                return list(self._parse_executor.map(parse, paths, chunksize=chunksize))
+            except Exception as e:
+                if isinstance(e, BrokenProcessPool):
+                    # Start a new pool on the next rebuild
+                    self._parse_executor.shutdown(wait=False)
+                    self._parse_executor = None
+                logger.warning(f"Parallel template parsing failed, parsing sequentially: {str(e)}")
+        return [parse(path) for path in paths]
+
+    def _load_all(self, paths: List[str], file_stats: Dict[str, FileStat]) -> Dict[str, Optional[LocalTemplate]]:
+        """
+        Load template files, reusing previous parses of unchanged files.
+
+        Files that fail to load are logged and skipped until they change.
+
+        Args:
+            paths: Template file paths
+            file_stats: Dictionary the stats of the files are recorded in
+
+        Returns:
+            Loaded template (or None if it could not be loaded) for each path
+        """
+        parsed: Dict[str, Tuple[FileStat, Optional[LocalTemplate]]] = {}
+        pending: List[Tuple[str, Tuple[int, int], Optional[str]]] = []
+
+        for path in dict.fromkeys(paths):
+            file_stat = _stat_file(path)
+            file_stats[path] = file_stat
+
+            cached = self._parsed.get(path)
+            if cached is not None and cached[0] == file_stat:
+                parsed[path] = cached
+                continue
+            if file_stat is None:
+                parsed[path] = (None, None)
+                continue
+            if self._snapshot is not None:
+                template = self._snapshot.find_template(path, file_stat)
+                if template is not None:
+                    self._store_snapshot_template(path, file_stat, template)
+                    parsed[path] = (file_stat, template)
+                    continue
+
+            try:
+                template_data, content_hash = self._load_stored(path, file_stat)
+                if template_data is not None:
+                    parsed[path] = (file_stat, LocalTemplate(path, template_data, self._tag_pool))
+                    continue
+            except Exception as e:
+                logger.warning(f"Ignoring stored index entry for {path}: {str(e)}")
+                content_hash = None
+            pending.append((path, file_stat, content_hash))
+
+        if pending:
+            results = self._parse_files([path for path, _, _ in pending])
+            for (path, file_stat, content_hash), (template_data, error) in zip(pending, results):
+                template = None
+                if error is None:
+                    try:
+                        template = LocalTemplate(path, template_data, self._tag_pool)
+                        if self.store is not None and content_hash is not None:
+                            self.store.put(
+                                path, file_stat[0], file_stat[1], content_hash, template_data, partial=self.partial
+                            )
+                    except Exception as e:
+                        error = str(e)
+                if error is not None:
+                    logger.error(f"Error loading template {path}: {error}")
+                parsed[path] = (file_stat, template)
+
+        # Only files that are still part of the index are kept
+        self._parsed = parsed
+        return {path: template for path, (_, template) in parsed.items()}
+
+    def _build(self) -> _IndexState:
+        started = time.monotonic()
+        dir_mtimes: Dict[str, int] = {}
+        file_stats: Dict[str, FileStat] = {}
+
+        catalog_paths: List[str] = []
+        use_catalog = False
+        if self.catalog_file:
+            file_stats[self.catalog_file] = _stat_file(self.catalog_file)
+            use_catalog = file_stats[self.catalog_file] is not None
+        if use_catalog:
+            catalog_paths = list(self.catalog_paths())
+
+        scanned_paths: List[str] = []
+        for dirpath, mtime_ns, is_template_dir in walk_template_dirs(self.templates_dir, exclude=self.exclude_dirs):
+            dir_mtimes[dirpath] = mtime_ns
+            if is_template_dir:
+                scanned_paths.append(os.path.join(dirpath, "template.yaml"))
+
+        # Parsing may run out of order, but results are assembled in discovery order
+        loaded = self._load_all(catalog_paths + scanned_paths, file_stats)
+        catalog_templates = [loaded[path] for path in catalog_paths if loaded[path] is not None]
+        scanned_templates = [loaded[path] for path in scanned_paths if loaded[path] is not None]
+
+        by_name: Dict[str, LocalTemplate] = {}
+        for template in catalog_templates + scanned_templates:
+            by_name.setdefault(template.name, template)
+
+        listing = catalog_templates if use_catalog else scanned_templates
+        if self.store is not None:
+            self.store.sync_index(
+                listed_paths=[template.path for template in listing],
+                known_paths=[path for path, (_, template) in self._parsed.items() if template is not None]
+            )
+
+        logger.info(
+            f"Indexed {len(by_name)} templates from {self.templates_dir} "
+            f"in {time.monotonic() - started:.2f}s"
+        )
+        return _IndexState(
+            by_name=by_name,
+            listing=listing,
+            facets=FacetIndex([template.summary for template in listing]),
+            dir_mtimes=dir_mtimes,
+            file_stats=file_stats
+        )
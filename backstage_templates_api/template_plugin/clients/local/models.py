@@ -5,20 +5,74 @@ This module defines models specific to the local file-based client implementatio
 """
 
 from pydantic import BaseModel, Field
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 import os
 from datetime import datetime
 
+from template_plugin.models.template_record import TemplateRecord
 
-class LocalTemplate(BaseModel):
-    """Representation of a local template."""
-    path: str
-    yaml_data: Dict[str, Any]
+
+class LocalTemplate:
+    """
+    Representation of a local template.
+    
+    Templates are cached by the template index for the lifetime of the client,
+    so the document is held as a compact TemplateRecord, which answers filters,
+    sorting and search. yaml_data materializes the full document on first
+    access and keeps it, since listings return it for every template on every
+    request.
+    """
+    
+    __slots__ = ("path", "record", "_yaml_data")
+    
+    def __init__(self, path: str, yaml_data: Dict[str, Any], tag_pool: Optional[Dict[Tuple, Tuple]] = None):
+        """
+        Initialize a local template.
+        
+        Args:
+            path: Path of the template.yaml file
+            yaml_data: Parsed template document
+            tag_pool: Dictionary used to share identical tag tuples between templates
+        """
+        self.path = path
+        self.record = TemplateRecord(yaml_data, tag_pool)
+        self._yaml_data: Optional[Dict[str, Any]] = None
+    
+    @classmethod
+    def from_record(cls, path: str, record: TemplateRecord) -> "LocalTemplate":
+        """
+        Create a local template from an existing record (e.g. read from a snapshot).
+        
+        Args:
+            path: Path of the template.yaml file
+            record: Template record
+            
+        Returns:
+            Local template
+        """
+        template = cls.__new__(cls)
+        template.path = path
+        template.record = record
+        template._yaml_data = None
+        return template
+    
+    @property
+    def yaml_data(self) -> Dict[str, Any]:
+        """Get the template document, shared by all callers, which must not modify it."""
+        yaml_data = self._yaml_data
+        if yaml_data is None:
+            yaml_data = self._yaml_data = self.record.to_dict()
+        return yaml_data
+    
+    @property
+    def summary(self) -> Dict[str, Any]:
+        """Get the template document without spec.parameters and other blob fields."""
+        return self.record.to_dict(full=False)
     
     @property
     def name(self) -> str:
         """Get the template name."""
-        return self.yaml_data.get("metadata", {}).get("name", "")
+        return self.record.name or ""
     
     @property
     def skeleton_dir(self) -> str:
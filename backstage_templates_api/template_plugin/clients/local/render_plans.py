@@ -0,0 +1,94 @@
+"""
+Local Render Plan Cache
+
+This module caches the compiled render plans of template skeletons, so that
+repeated executions of a template replay its plan instead of walking,
+classifying and compiling the skeleton directory again.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Tuple
+
+from template_plugin.utils.concurrency_utils import SingleFlight
+from template_plugin.utils.template_utils import RenderPlan, compile_render_plan
+
+logger = logging.getLogger("local-render-plans")
+
+
+class RenderPlanCache:
+    """
+    Bounded cache of render plans keyed by skeleton directory.
+
+    A cached plan is revalidated against the skeleton mtimes at most once per
+    revalidate_interval, and recompiled when the skeleton changed. Concurrent
+    misses of one skeleton share a single compilation.
+    """
+
+    def __init__(self, max_entries: int = 128, revalidate_interval: float = 1.0):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached plans (0 disables the cache)
+            revalidate_interval: Minimum seconds between two mtime checks of a cached plan
+        """
+        self.max_entries = max_entries
+        self.revalidate_interval = revalidate_interval
+        # skeleton_dir -> (plan, monotonic time of its last check)
+        self._plans: "OrderedDict[str, Tuple[RenderPlan, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._compiles = SingleFlight()
+
+    def get(self, skeleton_dir: str) -> RenderPlan:
+        """
+        Get the current render plan of a skeleton directory.
+
+        Args:
+            skeleton_dir: Skeleton directory
+
+        Returns:
+            Render plan
+
+        Raises:
+            TemplateProcessingError: If the plan cannot be compiled
+        """
+        now = time.monotonic()
+        with self._lock:
+            cached = self._plans.get(skeleton_dir)
+            if cached is not None:
+                self._plans.move_to_end(skeleton_dir)
+        if cached is not None:
+            plan, checked_at = cached
+            if now - checked_at < self.revalidate_interval:
+                return plan
+            if plan.is_current():
+                with self._lock:
+                    if skeleton_dir in self._plans:
+                        self._plans[skeleton_dir] = (plan, now)
+                return plan
+            logger.info(f"Skeleton changed, recompiling render plan: {skeleton_dir}")
+
+        return self._compiles.do(skeleton_dir, lambda: self._compile(skeleton_dir))
+
+    def invalidate(self) -> None:
+        """Drop all cached plans."""
+        with self._lock:
+            self._plans.clear()
+
+    def _compile(self, skeleton_dir: str) -> RenderPlan:
+        started = time.monotonic()
+        plan = compile_render_plan(skeleton_dir)
+        logger.debug(
+            f"Compiled render plan of {skeleton_dir} ({len(plan.files)} files) "
+            f"in {time.monotonic() - started:.3f}s"
+        )
+        if self.max_entries > 0:
+            with self._lock:
+                self._plans[skeleton_dir] = (plan, started)
+                self._plans.move_to_end(skeleton_dir)
+                while len(self._plans) > self.max_entries:
+                    self._plans.popitem(last=False)
+        return plan
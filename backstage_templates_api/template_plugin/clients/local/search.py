@@ -0,0 +1,246 @@
+"""
+Template Search Index
+
+This module provides a ranked full-text index over template name, title,
+description and tags. Query tokens are matched exactly, by prefix, inside
+longer words (through a trigram index) and with typos (bounded edit
+distance), and matches are ranked with BM25.
+"""
+
+import bisect
+import math
+import re
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+_TOKEN = re.compile(r"[^\W_]+")
+
+# Weight of a token occurrence per field
+FIELD_WEIGHTS = {
+    "name": 3.0,
+    "title": 2.0,
+    "tags": 2.0,
+    "description": 1.0
+}
+
+# Score factor per kind of term match
+EXACT_MATCH = 1.0
+PREFIX_MATCH = 0.8
+INFIX_MATCH = 0.6
+FUZZY_MATCH = 0.5
+
+# Maximum number of indexed terms a query token is expanded to by prefix
+MAX_PREFIX_EXPANSIONS = 64
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+def tokenize(text: Any) -> List[str]:
+    """
+    Split text into lowercase word tokens.
+
+    Args:
+        text: Text to tokenize (non-strings are converted)
+
+    Returns:
+        List of tokens
+    """
+    if text is None:
+        return []
+    return _TOKEN.findall(str(text).lower())
+
+
+def trigrams(term: str) -> Set[str]:
+    """
+    Get the trigrams of a term.
+
+    Args:
+        term: Term
+
+    Returns:
+        Set of trigrams (empty for terms shorter than three characters)
+    """
+    return {term[i:i + 3] for i in range(len(term) - 2)}
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """
+    Compute the Levenshtein distance between two strings, giving up above a limit.
+
+    Args:
+        a: First string
+        b: Second string
+        limit: Maximum distance of interest
+
+    Returns:
+        The distance, or limit + 1 if it exceeds the limit
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != char_b)
+            ))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+def max_typos(term: str) -> int:
+    """Get the number of typos tolerated for a query term."""
+    if len(term) < 4:
+        return 0
+    if len(term) < 8:
+        return 1
+    return 2
+
+
+class SearchIndex:
+    """
+    BM25-ranked inverted index over a fixed, ordered list of templates.
+
+    Documents are identified by their position in the list. Each query token
+    is expanded to the indexed terms it matches (the term itself, terms it is
+    a prefix of, terms containing it, and terms within max_typos edits), and a
+    document must match every query token. A document's score is the sum, over
+    query tokens, of its best BM25 score among the token's expansions, scaled
+    by the kind of match.
+    """
+
+    def __init__(self, templates: Sequence[Dict[str, Any]]):
+        """
+        Build the index.
+
+        Args:
+            templates: Template data, in listing order
+        """
+        self.size = len(templates)
+        self._postings: Dict[str, Dict[int, float]] = {}
+        self._lengths: List[float] = []
+
+        for position, template in enumerate(templates):
+            metadata = template.get("metadata") or {}
+            tags = metadata.get("tags")
+            fields = {
+                "name": metadata.get("name"),
+                "title": metadata.get("title"),
+                "description": metadata.get("description"),
+                "tags": " ".join(str(tag) for tag in tags) if isinstance(tags, (list, tuple)) else tags
+            }
+            length = 0.0
+            for field, text in fields.items():
+                weight = FIELD_WEIGHTS[field]
+                for token in tokenize(text):
+                    postings = self._postings.setdefault(token, {})
+                    postings[position] = postings.get(position, 0.0) + weight
+                    length += weight
+            self._lengths.append(length)
+
+        self._average_length = (sum(self._lengths) / self.size) if self.size else 0.0
+        self._terms = sorted(self._postings)
+        self._trigrams: Dict[str, List[str]] = {}
+        for term in self._terms:
+            for trigram in trigrams(term):
+                self._trigrams.setdefault(trigram, []).append(term)
+
+    def _idf(self, term: str) -> float:
+        document_frequency = len(self._postings[term])
+        return math.log(1 + (self.size - document_frequency + 0.5) / (document_frequency + 0.5))
+
+    def _expand(self, token: str) -> Dict[str, float]:
+        """
+        Get the indexed terms matching a query token, with their match factor.
+        """
+        expansions: Dict[str, float] = {}
+        if token in self._postings:
+            expansions[token] = EXACT_MATCH
+
+        # Prefix matches: the terms sorted right after the token
+        start = bisect.bisect_left(self._terms, token)
+        for term in self._terms[start:start + MAX_PREFIX_EXPANSIONS]:
+            if not term.startswith(token):
+                break
+            expansions.setdefault(term, PREFIX_MATCH)
+
+        token_trigrams = trigrams(token)
+        if not token_trigrams:
+            return expansions
+
+        # Infix matches: terms holding every trigram of the token, then verified
+        candidates: Optional[Set[str]] = None
+        for trigram in sorted(token_trigrams, key=lambda t: len(self._trigrams.get(t, ()))):
+            terms = set(self._trigrams.get(trigram, ()))
+            candidates = terms if candidates is None else candidates & terms
+            if not candidates:
+                break
+        for term in candidates or ():
+            if token in term:
+                expansions.setdefault(term, INFIX_MATCH)
+
+        # Typo-tolerant matches: terms sharing trigrams with the token, within max_typos edits
+        limit = max_typos(token)
+        if limit:
+            shared: Dict[str, int] = {}
+            for trigram in token_trigrams:
+                for term in self._trigrams.get(trigram, ()):
+                    shared[term] = shared.get(term, 0) + 1
+            # Each edit destroys at most three trigrams
+            min_shared = max(1, len(token_trigrams) - 3 * limit)
+            for term, count in shared.items():
+                if count >= min_shared and term not in expansions and edit_distance(token, term, limit) <= limit:
+                    expansions[term] = FUZZY_MATCH
+
+        return expansions
+
+    def _score_token(self, token: str) -> Dict[int, float]:
+        scores: Dict[int, float] = {}
+        for term, factor in self._expand(token).items():
+            idf = self._idf(term)
+            for position, frequency in self._postings[term].items():
+                length_norm = 1 - BM25_B + BM25_B * (self._lengths[position] / self._average_length)
+                score = factor * idf * frequency * (BM25_K1 + 1) / (frequency + BM25_K1 * length_norm)
+                if score > scores.get(position, 0.0):
+                    scores[position] = score
+        return scores
+
+    def search(self, query: str, positions: Optional[Iterable[int]] = None) -> List[Tuple[int, float]]:
+        """
+        Rank the documents matching a query.
+
+        Args:
+            query: Search query
+            positions: Restrict the results to these document positions
+
+        Returns:
+            (position, score) tuples, best match first (ties in listing order)
+        """
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens:
+            return []
+
+        allowed = set(positions) if positions is not None else None
+        totals: Optional[Dict[int, float]] = None
+        # Rarest tokens first, so the candidate set shrinks as fast as possible
+        for token_scores in sorted((self._score_token(token) for token in tokens), key=len):
+            if totals is None:
+                totals = {
+                    position: score for position, score in token_scores.items()
+                    if allowed is None or position in allowed
+                }
+            else:
+                totals = {
+                    position: total + token_scores[position]
+                    for position, total in totals.items()
+                    if position in token_scores
+                }
+            if not totals:
+                return []
+
+        return sorted(totals.items(), key=lambda item: (-item[1], item[0]))
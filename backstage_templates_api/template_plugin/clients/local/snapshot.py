@@ -0,0 +1,449 @@
+"""
+Local Template Snapshot
+
+This module provides a packed, memory-mappable snapshot of the local template
+index: the template records, the name table, the facet bitsets, the sort
+orders and the file stats used to revalidate it. LocalClient maps a snapshot
+read-only when snapshot_file is set, so worker processes start without
+scanning or parsing templates and share the snapshot's pages through the OS
+page cache. Snapshots are built with:
+
+    python -m template_plugin.clients.local.snapshot --output /path/to/templates.snapshot
+
+e.g. at container image build time.
+"""
+
+import argparse
+import logging
+import mmap
+import os
+import pickle
+import struct
+import sys
+import time
+from array import array
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Sequence, Tuple
+
+from template_plugin.clients.local.facets import FacetIndex
+from template_plugin.clients.local.models import LocalTemplate
+from template_plugin.clients.local.search import SearchIndex
+from template_plugin.utils.pagination_utils import SORT_FIELDS, sort_key
+
+logger = logging.getLogger("local-template-snapshot")
+
+MAGIC = b"TPLSNAP1"
+SNAPSHOT_VERSION = 1
+
+# Magic and header length, followed by the pickled header and the data region
+_PREFIX = struct.Struct("<8sQ")
+
+
+class _DataWriter:
+    """Accumulates the data region, keeping every section 8-byte aligned."""
+
+    def __init__(self):
+        self.chunks: List[bytes] = []
+        self.size = 0
+
+    def add(self, data: bytes) -> Tuple[int, int]:
+        padding = -self.size % 8
+        if padding:
+            self.chunks.append(b"\0" * padding)
+            self.size += padding
+        offset = self.size
+        self.chunks.append(data)
+        self.size += len(data)
+        return offset, len(data)
+
+    def add_array(self, typecode: str, values: Sequence[int]) -> Tuple[int, int]:
+        return self.add(array(typecode, values).tobytes())
+
+    def add_strings(self, strings: Sequence[str]) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+        """Add UTF-8 strings as a blob and an offsets array of len(strings) + 1 entries."""
+        encoded = [string.encode("utf-8") for string in strings]
+        offsets = [0]
+        for data in encoded:
+            offsets.append(offsets[-1] + len(data))
+        return self.add(b"".join(encoded)), self.add_array("Q", offsets)
+
+
+class _MappedStrings:
+    """Read-only sequence of strings stored by _DataWriter.add_strings."""
+
+    def __init__(self, data: memoryview, offsets: memoryview):
+        self._data = data
+        self._offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def raw(self, index: int) -> bytes:
+        return bytes(self._data[self._offsets[index]:self._offsets[index + 1]])
+
+    def __getitem__(self, index: int) -> str:
+        return self.raw(index).decode("utf-8")
+
+
+class _MappedStats:
+    """
+    Read-only view of a path -> stat table, iterated by TemplateIndex._is_stale.
+
+    Each entry holds (mtime_ns, size, record index); file stats use a size of -1
+    for missing files, and directory mtimes ignore the other columns.
+    """
+
+    def __init__(self, paths: _MappedStrings, values: memoryview, files: bool):
+        self._paths = paths
+        self._values = values
+        self._files = files
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        values = self._values
+        for index in range(len(self._paths)):
+            mtime_ns, size = values[3 * index], values[3 * index + 1]
+            if not self._files:
+                yield self._paths[index], mtime_ns
+            else:
+                yield self._paths[index], (mtime_ns, size) if size >= 0 else None
+
+    def records(self) -> Iterator[Tuple[str, Tuple[int, int], int]]:
+        """Yield (path, stat, record index) for the files stored with a record."""
+        values = self._values
+        for index in range(len(self._paths)):
+            record_index = values[3 * index + 2]
+            if record_index >= 0:
+                yield self._paths[index], (values[3 * index], values[3 * index + 1]), record_index
+
+
+class _MappedTemplates:
+    """Read-only sequence of templates decoded from the snapshot on access."""
+
+    def __init__(self, data: memoryview, offsets: memoryview, count: int):
+        self._data = data
+        self._offsets = offsets
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> LocalTemplate:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("template index out of range")
+        path, record = pickle.loads(self._data[self._offsets[index]:self._offsets[index + 1]])
+        return LocalTemplate.from_record(path, record)
+
+    def __iter__(self) -> Iterator[LocalTemplate]:
+        for index in range(self._count):
+            yield self[index]
+
+
+class _MappedNames:
+    """Name -> template lookup by binary search over the snapshot's sorted name table."""
+
+    def __init__(self, names: _MappedStrings, indexes: memoryview, templates: _MappedTemplates):
+        self._names = names
+        self._indexes = indexes
+        self._templates = templates
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def get(self, name: Any, default: Optional[LocalTemplate] = None) -> Optional[LocalTemplate]:
+        key = str(name).encode("utf-8")
+        low, high = 0, len(self._names)
+        while low < high:
+            middle = (low + high) // 2
+            if self._names.raw(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < len(self._names) and self._names.raw(low) == key:
+            return self._templates[self._indexes[low]]
+        return default
+
+
+class _MappedFacetIndex(FacetIndex):
+    """FacetIndex whose bitsets are read from the snapshot on each query."""
+
+    def __init__(self, data: memoryview, postings: Dict[str, Dict[Hashable, Tuple[int, int]]], size: int):
+        self.size = size
+        self.all = (1 << size) - 1
+        self._data = data
+        self._postings = postings
+
+    def mask(self, facet: str, value: Hashable) -> int:
+        location = self._postings[facet].get(value)
+        if location is None:
+            return 0
+        offset, length = location
+        return int.from_bytes(self._data[offset:offset + length], "little")
+
+
+class _SortKeys:
+    """Sequence of the sort keys of positions, computed on access (for bisect)."""
+
+    def __init__(self, listing: _MappedTemplates, field: str, positions: Optional[memoryview] = None):
+        self._listing = listing
+        self._field = field
+        self._positions = positions
+
+    def __len__(self) -> int:
+        return len(self._listing) if self._positions is None else len(self._positions)
+
+    def __getitem__(self, index: int) -> Tuple:
+        position = index if self._positions is None else self._positions[index]
+        return sort_key(self._listing[position].summary, self._field) + (position,)
+
+
+class SnapshotState:
+    """
+    Index snapshot backed by a mapped snapshot file.
+
+    It provides the same interface as the in-memory index snapshot, but
+    decodes templates, names and bitsets from the mapping on access, so a
+    worker's private memory holds only the small header.
+    """
+
+    def __init__(self, path: str, mapping: mmap.mmap, header: Dict[str, Any], data_offset: int):
+        self.path = path
+        self.header = header
+        self._mapping = mapping
+        data = memoryview(mapping)[data_offset:]
+
+        def section(name: str, typecode: Optional[str] = None) -> memoryview:
+            offset, length = header["sections"][name]
+            view = data[offset:offset + length]
+            return view.cast(typecode) if typecode else view
+
+        def strings(name: str) -> _MappedStrings:
+            return _MappedStrings(section(f"{name}_data"), section(f"{name}_offsets", "Q"))
+
+        self.records = _MappedTemplates(section("records"), section("record_offsets", "Q"), header["record_count"])
+        self.listing = _MappedTemplates(section("records"), section("record_offsets", "Q"), header["listing_count"])
+        self.by_name = _MappedNames(strings("names"), section("name_indexes", "q"), self.records)
+        self.facets = _MappedFacetIndex(data, header["facets"], header["listing_count"])
+        self.dir_mtimes = _MappedStats(strings("dirs"), section("dir_stats", "q"), files=False)
+        self.file_stats = _MappedStats(strings("files"), section("file_stats", "q"), files=True)
+        self._orders = {field: section(f"order_{field}", "I") for field in header["sort_fields"]}
+        self._search: Optional[SearchIndex] = None
+        self._record_indexes: Optional[Dict[str, Tuple[Tuple[int, int], int]]] = None
+
+    @property
+    def search(self) -> SearchIndex:
+        """Full-text index of the listing, built on first use (in private memory)."""
+        if self._search is None:
+            self._search = SearchIndex([template.summary for template in self.listing])
+        return self._search
+
+    def sort_order(self, field: str) -> Tuple[Sequence[int], Sequence[Tuple], Sequence[Tuple]]:
+        """
+        Get the listing sorted on a field, from the order precomputed in the snapshot.
+
+        Returns:
+            Tuple of (positions in ascending key order, keys in ascending order, key of each position)
+        """
+        positions = self._orders[field]
+        return positions, _SortKeys(self.listing, field, positions), _SortKeys(self.listing, field)
+
+    def find_template(self, path: str, file_stat: Tuple[int, int]) -> Optional[LocalTemplate]:
+        """
+        Get the template parsed from a file, if the file is unchanged since the snapshot was built.
+
+        Args:
+            path: Template file path
+            file_stat: Current (mtime_ns, size) of the file
+
+        Returns:
+            The stored template, or None
+        """
+        if self._record_indexes is None:
+            self._record_indexes = {
+                record_path: (record_stat, record_index)
+                for record_path, record_stat, record_index in self.file_stats.records()
+            }
+        entry = self._record_indexes.get(path)
+        if entry is None or entry[0] != file_stat:
+            return None
+        return self.records[entry[1]]
+
+
+def write_snapshot(state: Any, path: str, templates_dir: str, catalog_file: Optional[str], partial: bool) -> None:
+    """
+    Write an index snapshot to a file, atomically.
+
+    Args:
+        state: Index snapshot to write (from TemplateIndex.refresh)
+        path: Snapshot file path
+        templates_dir: Templates directory the index was built from
+        catalog_file: Catalog file the index was built from
+        partial: Whether the index holds only the listing fields of templates
+    """
+    listing = list(state.listing)
+    records = list(listing)
+    record_indexes = {id(template): index for index, template in enumerate(records)}
+    for template in state.by_name.values():
+        if id(template) not in record_indexes:
+            record_indexes[id(template)] = len(records)
+            records.append(template)
+
+    writer = _DataWriter()
+    sections: Dict[str, Tuple[int, int]] = {}
+
+    blobs = [pickle.dumps((template.path, template.record), protocol=pickle.HIGHEST_PROTOCOL) for template in records]
+    offsets = [0]
+    for blob in blobs:
+        offsets.append(offsets[-1] + len(blob))
+    sections["records"] = writer.add(b"".join(blobs))
+    sections["record_offsets"] = writer.add_array("Q", offsets)
+
+    names = sorted(
+        {str(name).encode("utf-8"): record_indexes[id(template)] for name, template in reversed(list(state.by_name.items()))}.items()
+    )
+    sections["names_data"], sections["names_offsets"] = writer.add_strings([name.decode("utf-8") for name, _ in names])
+    sections["name_indexes"] = writer.add_array("q", [index for _, index in names])
+
+    facets: Dict[str, Dict[Hashable, Tuple[int, int]]] = {}
+    mask_length = (len(listing) + 7) // 8
+    for facet in FacetIndex.FACETS:
+        facets[facet] = {}
+        for value in state.facets.values(facet):
+            facets[facet][value] = writer.add(state.facets.mask(facet, value).to_bytes(mask_length, "little"))
+
+    for field in SORT_FIELDS:
+        sections[f"order_{field}"] = writer.add_array("I", list(state.sort_order(field)[0]))
+
+    template_paths = {template.path: record_indexes[id(template)] for template in reversed(records)}
+    dir_items = list(state.dir_mtimes.items())
+    sections["dirs_data"], sections["dirs_offsets"] = writer.add_strings([dirpath for dirpath, _ in dir_items])
+    sections["dir_stats"] = writer.add_array("q", [value for _, mtime_ns in dir_items for value in (mtime_ns, 0, -1)])
+    file_items = list(state.file_stats.items())
+    sections["files_data"], sections["files_offsets"] = writer.add_strings([file_path for file_path, _ in file_items])
+    sections["file_stats"] = writer.add_array("q", [
+        value for file_path, file_stat in file_items
+        for value in ((file_stat[0], file_stat[1]) if file_stat is not None else (0, -1)) + (template_paths.get(file_path, -1),)
+    ])
+
+    header = pickle.dumps({
+        "version": SNAPSHOT_VERSION,
+        "byteorder": sys.byteorder,
+        "templates_dir": os.path.abspath(templates_dir),
+        "catalog_file": os.path.abspath(catalog_file) if catalog_file else None,
+        "partial": partial,
+        "created_at": time.time(),
+        "record_count": len(records),
+        "listing_count": len(listing),
+        "sort_fields": list(SORT_FIELDS),
+        "facets": facets,
+        "sections": sections
+    }, protocol=pickle.HIGHEST_PROTOCOL)
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(_PREFIX.pack(MAGIC, len(header)))
+        f.write(header)
+        f.write(b"\0" * (-(_PREFIX.size + len(header)) % 8))
+        for chunk in writer.chunks:
+            f.write(chunk)
+    os.replace(temp_path, path)
+    logger.info(f"Wrote template snapshot with {len(records)} templates to {path}")
+
+
+def load_snapshot(path: str, templates_dir: str, catalog_file: Optional[str], partial: bool) -> Optional[SnapshotState]:
+    """
+    Map a snapshot file, if it exists and matches the index configuration.
+
+    Args:
+        path: Snapshot file path
+        templates_dir: Templates directory of the index
+        catalog_file: Catalog file of the index
+        partial: Whether the index holds only the listing fields of templates
+
+    Returns:
+        The mapped snapshot, or None if it is missing, unreadable or was built differently
+    """
+    try:
+        with open(path, "rb") as f:
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError) as e:
+        logger.info(f"Not using template snapshot {path}: {str(e)}")
+        return None
+
+    try:
+        magic, header_length = _PREFIX.unpack_from(mapping, 0)
+        if magic != MAGIC:
+            raise ValueError("not a template snapshot")
+        header = pickle.loads(mapping[_PREFIX.size:_PREFIX.size + header_length])
+        expected = {
+            "version": SNAPSHOT_VERSION,
+            "byteorder": sys.byteorder,
+            "templates_dir": os.path.abspath(templates_dir),
+            "catalog_file": os.path.abspath(catalog_file) if catalog_file else None,
+            "partial": partial
+        }
+        for key, value in expected.items():
+            if header.get(key) != value:
+                raise ValueError(f"built with {key}={header.get(key)!r}, expected {value!r}")
+        data_offset = _PREFIX.size + header_length
+        data_offset += -data_offset % 8
+        return SnapshotState(path, mapping, header, data_offset)
+    except Exception as e:
+        logger.warning(f"Not using template snapshot {path}: {str(e)}")
+        mapping.close()
+        return None
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Build a template snapshot.
+
+    Settings default to the LOCAL_* environment variables read by the API, so
+    the snapshot matches the configuration of the workers that map it.
+
+    Args:
+        argv: Command line arguments
+
+    Returns:
+        Exit code
+    """
+    from template_plugin.clients.local.client import LocalClient
+    from template_plugin.config.config import LocalClientConfig
+
+    parser = argparse.ArgumentParser(description="Build a memory-mappable snapshot of the local templates.")
+    parser.add_argument("--output", default=os.getenv("LOCAL_SNAPSHOT_FILE"),
+                        help="Snapshot file to write (default: LOCAL_SNAPSHOT_FILE)")
+    parser.add_argument("--templates-dir", default=os.getenv("LOCAL_TEMPLATES_DIR"),
+                        help="Templates directory (default: LOCAL_TEMPLATES_DIR)")
+    parser.add_argument("--catalog-file", default=os.getenv("LOCAL_CATALOG_FILE"),
+                        help="Catalog file (default: LOCAL_CATALOG_FILE)")
+    parser.add_argument("--lazy-load", action="store_true",
+                        default=(os.getenv("LOCAL_LAZY_LOAD") or "").lower() == "true",
+                        help="Store template summaries, for workers with LOCAL_LAZY_LOAD=true")
+    parser.add_argument("--parse-workers", type=int, default=int(os.getenv("LOCAL_PARSE_WORKERS") or 0),
+                        help="Processes used to parse templates (default: LOCAL_PARSE_WORKERS, or one per CPU)")
+    args = parser.parse_args(argv)
+    if not args.output:
+        parser.error("--output or LOCAL_SNAPSHOT_FILE is required")
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    config = LocalClientConfig(lazy_load=args.lazy_load, parse_workers=args.parse_workers)
+    if args.templates_dir:
+        config.templates_dir = args.templates_dir
+    if args.catalog_file:
+        config.catalog_file = args.catalog_file
+
+    client = LocalClient(config)
+    try:
+        client.write_snapshot(args.output)
+    finally:
+        client.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
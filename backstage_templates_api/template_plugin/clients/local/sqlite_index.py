@@ -0,0 +1,253 @@
+"""
+SQLite Template Store
+
+This module provides an on-disk SQLite store for parsed local templates, keyed by
+path. It lets LocalClient skip YAML parsing for unchanged files across restarts
+and answers list filters with indexed SQL queries.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger("local-template-store")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS templates (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    content_hash TEXT NOT NULL,
+    name TEXT,
+    title TEXT,
+    description TEXT,
+    owner TEXT,
+    type TEXT,
+    cloud_provider TEXT,
+    position INTEGER,
+    partial INTEGER NOT NULL DEFAULT 0,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS template_tags (
+    path TEXT NOT NULL REFERENCES templates(path) ON DELETE CASCADE,
+    tag TEXT NOT NULL,
+    PRIMARY KEY (path, tag)
+);
+CREATE INDEX IF NOT EXISTS idx_templates_name ON templates(name);
+CREATE INDEX IF NOT EXISTS idx_templates_owner ON templates(owner);
+CREATE INDEX IF NOT EXISTS idx_templates_type ON templates(type);
+CREATE INDEX IF NOT EXISTS idx_templates_cloud_provider ON templates(cloud_provider);
+CREATE INDEX IF NOT EXISTS idx_templates_position ON templates(position);
+CREATE INDEX IF NOT EXISTS idx_template_tags_tag ON template_tags(tag);
+"""
+
+
+class StoredTemplate:
+    """A template row read back from the store."""
+
+    __slots__ = ("mtime_ns", "size", "content_hash", "template", "partial")
+
+    def __init__(self, mtime_ns: int, size: int, content_hash: str, template: Dict[str, Any], partial: bool = False):
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.content_hash = content_hash
+        self.template = template
+        self.partial = partial
+
+
+class SQLiteTemplateStore:
+    """
+    SQLite store of parsed templates.
+
+    Each row holds the file's mtime, size and content hash, the metadata used for
+    filtering (name, title, description, owner, type, cloud_provider and tags in
+    a side table) and the serialized template, flagged as partial when only its
+    listing fields were loaded (LocalClient's lazy mode). The position column holds the
+    order of the templates currently listed by LocalClient, and is NULL for rows
+    that are indexed but not listed (e.g. scanned templates while a catalog file
+    is in use).
+
+    The database runs in WAL mode, so several uvicorn workers can share it, and
+    each thread uses its own connection.
+    """
+
+    def __init__(self, db_path: str):
+        """
+        Initialize the store, creating the database if needed.
+
+        Args:
+            db_path: Path of the SQLite database file
+        """
+        self.db_path = os.path.abspath(db_path)
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        self._local = threading.local()
+        with self._connection() as conn:
+            conn.executescript(SCHEMA)
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(templates)")}
+            if "partial" not in columns:
+                # Databases created before lazy loading only hold full templates
+                conn.execute("ALTER TABLE templates ADD COLUMN partial INTEGER NOT NULL DEFAULT 0")
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA foreign_keys=ON")
+            self._local.conn = conn
+        return conn
+
+    def get(self, path: str) -> Optional[StoredTemplate]:
+        """
+        Get the stored template for a file.
+
+        Args:
+            path: Template file path
+
+        Returns:
+            The stored template, or None if the file is not in the store
+        """
+        row = self._connection().execute(
+            "SELECT mtime_ns, size, content_hash, data, partial FROM templates WHERE path = ?",
+            (path,)
+        ).fetchone()
+        if row is None:
+            return None
+        return StoredTemplate(row[0], row[1], row[2], json.loads(row[3]), bool(row[4]))
+
+    def put(
+        self,
+        path: str,
+        mtime_ns: int,
+        size: int,
+        content_hash: str,
+        template: Dict[str, Any],
+        partial: bool = False
+    ) -> None:
+        """
+        Insert or replace the template parsed from a file.
+
+        Args:
+            path: Template file path
+            mtime_ns: File modification time in ns
+            size: File size in bytes
+            content_hash: Hash of the file content
+            template: Parsed template
+            partial: Whether the template holds only its listing fields
+        """
+        metadata = template.get("metadata") or {}
+        spec = template.get("spec") or {}
+        tags = metadata.get("tags") or []
+        if not isinstance(tags, list):
+            tags = []
+
+        with self._connection() as conn:
+            conn.execute("DELETE FROM template_tags WHERE path = ?", (path,))
+            conn.execute(
+                "INSERT OR REPLACE INTO templates "
+                "(path, mtime_ns, size, content_hash, name, title, description, owner, type, cloud_provider, "
+                "position, partial, data) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, "
+                "(SELECT position FROM templates WHERE path = ?), ?, ?)",
+                (
+                    path, mtime_ns, size, content_hash,
+                    metadata.get("name"), metadata.get("title"), metadata.get("description"),
+                    spec.get("owner"), spec.get("type"), metadata.get("cloud_provider"),
+                    path, int(partial), json.dumps(template, default=str)
+                )
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO template_tags (path, tag) VALUES (?, ?)",
+                [(path, str(tag)) for tag in tags]
+            )
+
+    def touch(self, path: str, mtime_ns: int, size: int) -> None:
+        """
+        Update the stat of a file whose content did not change.
+
+        Args:
+            path: Template file path
+            mtime_ns: File modification time in ns
+            size: File size in bytes
+        """
+        with self._connection() as conn:
+            conn.execute("UPDATE templates SET mtime_ns = ?, size = ? WHERE path = ?", (mtime_ns, size, path))
+
+    def sync_index(self, listed_paths: List[str], known_paths: Iterable[str]) -> None:
+        """
+        Record which templates are listed, in order, and drop rows of files that are gone.
+
+        Args:
+            listed_paths: Paths of the listed templates, in listing order
+            known_paths: Paths of all templates currently indexed
+        """
+        with self._connection() as conn:
+            conn.execute("CREATE TEMP TABLE IF NOT EXISTS known_paths (path TEXT PRIMARY KEY)")
+            conn.execute("DELETE FROM known_paths")
+            conn.executemany("INSERT OR IGNORE INTO known_paths (path) VALUES (?)", [(path,) for path in known_paths])
+            conn.execute("DELETE FROM templates WHERE path NOT IN (SELECT path FROM known_paths)")
+            conn.execute("UPDATE templates SET position = NULL WHERE position IS NOT NULL")
+            conn.executemany(
+                "UPDATE templates SET position = ? WHERE path = ?",
+                [(position, path) for position, path in enumerate(listed_paths)]
+            )
+
+    def query_templates(
+        self,
+        cloud_provider: Optional[str] = None,
+        template_type: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        owner: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Query the listed templates with the same semantics as LocalClient's facet filters.
+
+        Searches are not answered here: they are ranked by the in-memory search index.
+
+        Args:
+            cloud_provider: Filter by cloud provider
+            template_type: Filter by template type
+            tags: Filter by tags (all must match)
+            owner: Filter by owner
+
+        Returns:
+            Matching templates, in listing order
+        """
+        conditions = ["position IS NOT NULL"]
+        params: List[Any] = []
+
+        if cloud_provider:
+            conditions.append("cloud_provider = ?")
+            params.append(cloud_provider)
+        if template_type:
+            conditions.append("type = ?")
+            params.append(template_type)
+        if owner:
+            conditions.append("owner = ?")
+            params.append(owner)
+        if tags:
+            unique_tags = list(dict.fromkeys(tags))
+            placeholders = ", ".join("?" for _ in unique_tags)
+            conditions.append(
+                f"path IN (SELECT path FROM template_tags WHERE tag IN ({placeholders}) "
+                f"GROUP BY path HAVING COUNT(*) = ?)"
+            )
+            params.extend(unique_tags)
+            params.append(len(unique_tags))
+
+        rows = self._connection().execute(
+            f"SELECT data FROM templates WHERE {' AND '.join(conditions)} ORDER BY position",
+            params
+        ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def close(self) -> None:
+        """Close the calling thread's connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
@@ -22,6 +22,42 @@ class LocalClientConfig(BaseClientConfig):
     templates_dir: str = "./templates"
     catalog_file: str = "./catalog-info.yaml"
     
+    # Root directory of task outputs (output_{task_id} directories)
+    output_dir: str = "./output"
+    
+    # Minimum seconds between two mtime checks of the template index
+    index_revalidate_interval: float = 1.0
+    
+    # SQLite file persisting the parsed template index across restarts (disabled if unset)
+    index_db_path: Optional[str] = None
+    
+    # Processes used to parse template files when (re)building the index (1 = in-process, 0 = one per CPU)
+    parse_workers: int = 1
+    
+    # Lazy loading: index only the listing fields of templates and parse full documents on demand
+    lazy_load: bool = False
+    
+    # Memory bound of the parsed YAML document cache, which holds the full documents loaded on demand
+    yaml_cache_max_bytes: int = 64 * 1024 * 1024
+    
+    # Compiled Jinja templates kept in memory, and optional directory persisting their bytecode
+    template_cache_max_entries: int = 512
+    template_bytecode_cache_dir: Optional[str] = None
+    
+    # Threads copying and rendering skeleton files of an execution (1 = sequential, 0 = one per CPU)
+    render_workers: int = 1
+    
+    # Hard link non-template skeleton files into task outputs when reflinks are unsupported.
+    # Outputs then share those files with the skeleton, so they must not be modified in place.
+    skeleton_hardlinks: bool = False
+    
+    # Skeleton render plans kept in memory (revalidated every index_revalidate_interval)
+    render_plan_cache_size: int = 128
+    
+    # Packed index snapshot mapped at startup instead of scanning templates
+    # (built with python -m template_plugin.clients.local.snapshot)
+    snapshot_file: Optional[str] = None
+    
     class Config:
         env_prefix = "LOCAL_"
 
@@ -31,6 +67,36 @@ class BackstageClientConfig(BaseClientConfig):
     base_url: str = "http://localhost:7007/api"
     auth_token: Optional[str] = None
     
+    # HTTP connection pool configuration
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    http2: bool = False
+    
+    # Retry and circuit breaker configuration (MAX_RETRIES bounds the retries)
+    retry_backoff_base: float = 0.5
+    retry_backoff_max: float = 10.0
+    circuit_breaker_threshold: int = 5
+    circuit_breaker_reset_timeout: float = 30.0
+    
+    # Catalog response cache configuration (TTLs in seconds per client operation)
+    cache_enabled: bool = True
+    cache_ttl: Dict[str, float] = {
+        "list_templates": 60,
+        "get_template": 300,
+        "get_template_parameters": 300
+    }
+    cache_stale_ttl: float = 600
+    cache_negative_ttl: float = 10
+    cache_max_entries: int = 1024
+    
+    # Number of entities requested per catalog page
+    catalog_page_size: int = 500
+    
+    # Mirror mode: serve template reads from a background-synced copy of the catalog
+    mirror_enabled: bool = False
+    mirror_refresh_interval: float = 60.0
+    
     # S3 download configuration
     s3_bucket: Optional[str] = os.getenv("BACKSTAGE_S3_BUCKET")
     local_path_template: Optional[str] = "/Users/harshithkoppula/Downloads/templates/{template_name}_{task_id}.zip"
@@ -12,6 +12,7 @@ from template_plugin.errors.exceptions import (
     TemplateValidationError,
     ClientInitializationError,
     ConnectionError,
+    CircuitOpenError,
     FileAccessError,
     AuthenticationError,
     AuthorizationError,
@@ -26,6 +27,7 @@ __all__ = [
     'TemplateValidationError',
     'ClientInitializationError',
     'ConnectionError',
+    'CircuitOpenError',
     'FileAccessError',
     'AuthenticationError',
     'AuthorizationError',
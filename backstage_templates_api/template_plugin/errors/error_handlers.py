@@ -19,6 +19,7 @@ from template_plugin.errors.exceptions import (
     TemplateValidationError,
     ClientInitializationError,
     ConnectionError,
+    CircuitOpenError,
     FileAccessError,
     AuthenticationError,
     AuthorizationError
@@ -73,8 +74,8 @@ def _get_status_code(exc: TemplateError) -> int:
         return 401  # Unauthorized
     elif isinstance(exc, AuthorizationError):
         return 403  # Forbidden
-    elif isinstance(exc, ConnectionError):
-        return 502  # Bad Gateway
+    elif isinstance(exc, (CircuitOpenError, ConnectionError)):
+        return 503  # Service Unavailable
     elif isinstance(exc, FileAccessError):
         return 500  # Internal Server Error
     elif isinstance(exc, TemplateExecutionError):
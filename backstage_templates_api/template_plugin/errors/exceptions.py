@@ -43,6 +43,11 @@ class ConnectionError(TemplateError):
     pass
 
 
+class CircuitOpenError(ConnectionError):
+    """Exception raised when calls to a template source are short-circuited because it is failing."""
+    pass
+
+
 class FileAccessError(TemplateError):
     """Exception raised when there is an error accessing a file."""
     pass
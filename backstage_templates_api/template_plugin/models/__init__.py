@@ -10,6 +10,7 @@ from template_plugin.models.template_models import (
     TemplateLog,
     TemplateParameter
 )
+from template_plugin.models.template_record import TemplateRecord
 from template_plugin.models.config_models import (
     TemplatePluginConfig,
     BackstageConfig,
@@ -21,6 +22,7 @@ __all__ = [
     'TemplateTaskResponse',
     'TemplateLog',
     'TemplateParameter',
+    'TemplateRecord',
     'TemplatePluginConfig',
     'BackstageConfig',
     'LocalConfig'
@@ -0,0 +1,194 @@
+"""
+Template Record
+
+This module defines the compact in-memory representation of cached templates.
+"""
+
+import pickle
+import sys
+from typing import Any, Dict, Optional, Tuple
+
+# Presence bits of the fields held in slots, so that absent keys stay absent in to_dict()
+_API_VERSION = 1 << 0
+_KIND = 1 << 1
+_METADATA = 1 << 2
+_SPEC = 1 << 3
+_NAME = 1 << 4
+_TITLE = 1 << 5
+_DESCRIPTION = 1 << 6
+_TAGS = 1 << 7
+_CLOUD_PROVIDER = 1 << 8
+_OWNER = 1 << 9
+_TYPE = 1 << 10
+_PARAMETERS = 1 << 11
+
+_METADATA_FIELDS = (
+    ("name", "name", _NAME),
+    ("title", "title", _TITLE),
+    ("description", "description", _DESCRIPTION),
+    ("tags", "tags", _TAGS),
+    ("cloud_provider", "cloud_provider", _CLOUD_PROVIDER)
+)
+_SPEC_FIELDS = (
+    ("owner", "owner", _OWNER),
+    ("type", "type", _TYPE)
+)
+
+# Slots holding low-cardinality strings, interned again when a record is unpickled
+_INTERNED_SLOTS = frozenset(("api_version", "kind", "cloud_provider", "owner", "type"))
+
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if type(value) is str else value
+
+
+def _dump(value: Any) -> bytes:
+    return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+class TemplateRecord:
+    """
+    Compact, immutable representation of a template document.
+
+    The fields used to filter, sort and search templates (name, title,
+    description, tags, cloud provider, owner and type) are kept in slots, with
+    tags, owners, types and other low-cardinality strings interned so that
+    thousands of records share one copy of each value. spec.parameters, usually
+    the bulk of a template, and every other field are kept as pickled blobs
+    that are only decoded when a caller asks for them, and never retained
+    decoded.
+    """
+
+    __slots__ = (
+        "api_version", "kind", "name", "title", "description", "tags",
+        "cloud_provider", "owner", "type", "_present", "_parameters", "_extra"
+    )
+
+    def __init__(self, data: Dict[str, Any], tag_pool: Optional[Dict[Tuple, Tuple]] = None):
+        """
+        Build a record from a template document.
+
+        Args:
+            data: Template document (e.g. a parsed template.yaml or a mapped catalog entity)
+            tag_pool: Dictionary used to share identical tag tuples between records
+
+        Raises:
+            TypeError: If the document is not a mapping
+        """
+        if not isinstance(data, dict):
+            raise TypeError(f"Template document must be a mapping, got {type(data).__name__}")
+        present = 0
+        extra_top = dict(data)
+        extra_metadata: Optional[Dict[str, Any]] = None
+        extra_spec: Optional[Dict[str, Any]] = None
+
+        self.api_version = self.kind = None
+        if "apiVersion" in extra_top:
+            self.api_version = _intern(extra_top.pop("apiVersion"))
+            present |= _API_VERSION
+        if "kind" in extra_top:
+            self.kind = _intern(extra_top.pop("kind"))
+            present |= _KIND
+
+        self.name = self.title = self.description = self.tags = self.cloud_provider = None
+        if isinstance(extra_top.get("metadata"), dict):
+            extra_metadata = dict(extra_top.pop("metadata"))
+            present |= _METADATA
+            for key, attribute, bit in _METADATA_FIELDS:
+                if key in extra_metadata:
+                    setattr(self, attribute, extra_metadata.pop(key))
+                    present |= bit
+
+        self.owner = self.type = None
+        self._parameters: Optional[bytes] = None
+        if isinstance(extra_top.get("spec"), dict):
+            extra_spec = dict(extra_top.pop("spec"))
+            present |= _SPEC
+            for key, attribute, bit in _SPEC_FIELDS:
+                if key in extra_spec:
+                    setattr(self, attribute, _intern(extra_spec.pop(key)))
+                    present |= bit
+            if "parameters" in extra_spec:
+                self._parameters = _dump(extra_spec.pop("parameters"))
+                present |= _PARAMETERS
+
+        self.cloud_provider = _intern(self.cloud_provider)
+        if isinstance(self.tags, list):
+            # Lists are stored as tuples of interned strings and restored as lists
+            tags = tuple(_intern(tag) for tag in self.tags)
+            self.tags = tag_pool.setdefault(tags, tags) if tag_pool is not None else tags
+
+        self._present = present
+        self._extra: Optional[bytes] = None
+        if extra_top or extra_metadata or extra_spec:
+            self._extra = _dump((extra_top, extra_metadata or None, extra_spec or None))
+
+    @property
+    def parameters(self) -> Any:
+        """Decode spec.parameters (a new object on every access), or None if absent."""
+        if self._parameters is None:
+            return None
+        return pickle.loads(self._parameters)
+
+    @property
+    def has_parameters(self) -> bool:
+        """Check whether the template defines spec.parameters."""
+        return bool(self._present & _PARAMETERS)
+
+    def to_dict(self, full: bool = True) -> Dict[str, Any]:
+        """
+        Materialize the template document.
+
+        Args:
+            full: Decode the blobs (spec.parameters and every field not held in
+                slots); with False only the slot fields are returned, which is
+                enough to filter, sort and search
+
+        Returns:
+            Template document (a new dict on every call)
+        """
+        present = self._present
+        extra_top, extra_metadata, extra_spec = None, None, None
+        if full and self._extra is not None:
+            extra_top, extra_metadata, extra_spec = pickle.loads(self._extra)
+
+        data: Dict[str, Any] = {}
+        if present & _API_VERSION:
+            data["apiVersion"] = self.api_version
+        if present & _KIND:
+            data["kind"] = self.kind
+
+        if present & _METADATA:
+            metadata: Dict[str, Any] = {}
+            for key, attribute, bit in _METADATA_FIELDS:
+                if present & bit:
+                    metadata[key] = getattr(self, attribute)
+            if isinstance(self.tags, tuple):
+                metadata["tags"] = list(self.tags)
+            if extra_metadata:
+                metadata.update(extra_metadata)
+            data["metadata"] = metadata
+
+        if present & _SPEC:
+            spec: Dict[str, Any] = {}
+            for key, attribute, bit in _SPEC_FIELDS:
+                if present & bit:
+                    spec[key] = getattr(self, attribute)
+            if full and present & _PARAMETERS:
+                spec["parameters"] = self.parameters
+            if extra_spec:
+                spec.update(extra_spec)
+            data["spec"] = spec
+
+        if extra_top:
+            data.update(extra_top)
+        return data
+
+    def __getstate__(self) -> Tuple:
+        return tuple(getattr(self, slot) for slot in self.__slots__)
+
+    def __setstate__(self, state: Tuple) -> None:
+        for slot, value in zip(self.__slots__, state):
+            setattr(self, slot, _intern(value) if slot in _INTERNED_SLOTS else value)
+        if isinstance(self.tags, tuple):
+            self.tags = tuple(_intern(tag) for tag in self.tags)
@@ -6,7 +6,7 @@ selecting the appropriate client implementation based on configuration.
 """
 
 import logging
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, Iterator, List, Optional, Any, Union
 import boto3
 import os
 import time
@@ -121,10 +121,14 @@ class TemplatePlugin:
         tags: Optional[List[str]] = None,
         owner: Optional[str] = None,
         search: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        cursor: Optional[str] = None,
+        sort: Optional[str] = None,
         client_name: Optional[str] = None
     ) -> Dict[str, Any]:
         """
-        List templates with optional filtering.
+        List templates with optional filtering, sorting and pagination.
         
         Args:
             cloud_provider: Filter by cloud provider
@@ -132,10 +136,14 @@ class TemplatePlugin:
             tags: Filter by tags
             owner: Filter by owner
             search: Search in name and description
+            limit: Maximum number of templates to return
+            offset: Number of templates to skip (ignored if a cursor is given)
+            cursor: Cursor returned as next_cursor by a previous call
+            sort: Sort field ("name", "title", "type" or "owner"), prefixed with "-" for descending order
             client_name: Name of the client to use, or None for default
             
         Returns:
-            List of templates
+            Dictionary with template items, total count and the cursor of the next page
         """
         client = self.get_client(client_name)
         return client.list_templates(
@@ -143,7 +151,11 @@ class TemplatePlugin:
             template_type=template_type,
             tags=tags,
             owner=owner,
-            search=search
+            search=search,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            sort=sort
         )
     
     def get_template(
@@ -164,6 +176,24 @@ class TemplatePlugin:
         client = self.get_client(client_name)
         return client.get_template(template_name)
     
+    def get_templates(
+        self,
+        template_names: List[str],
+        client_name: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Get several templates by name in one call.
+        
+        Args:
+            template_names: Names of the templates to retrieve
+            client_name: Name of the client to use, or None for default
+            
+        Returns:
+            Dictionary with template items, total count and names not found
+        """
+        client = self.get_client(client_name)
+        return client.get_templates(template_names)
+    
     def get_template_parameters(
         self,
         template_name: str,
@@ -241,6 +271,32 @@ class TemplatePlugin:
             timeout=timeout
         )
     
+    def render_template_archive(
+        self,
+        template_name: str,
+        parameters: Dict[str, Any],
+        archive_format: str = "zip",
+        client_name: Optional[str] = None
+    ) -> Iterator[bytes]:
+        """
+        Render a template straight into a streamed archive.
+        
+        Args:
+            template_name: Name of the template
+            parameters: Template parameters
+            archive_format: Archive format (zip, tar or tar.gz)
+            client_name: Name of the client to use, or None for default
+            
+        Returns:
+            Iterator over the archive bytes, rendering the template as it is consumed
+        """
+        client = self.get_client(client_name)
+        task = TemplateTask(
+            template_name=template_name,
+            parameters=parameters
+        )
+        return client.render_archive(task, archive_format)
+    
     def get_task_status(
         self,
         task_id: str,
@@ -257,4 +313,222 @@ class TemplatePlugin:
             Task status
         """
         client = self.get_client(client_name)
-        return client.get_task_status(task_id)
\ No newline at end of file
+        return client.get_task_status(task_id)
+    
+    async def alist_templates(
+        self,
+        cloud_provider: Optional[str] = None,
+        template_type: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        owner: Optional[str] = None,
+        search: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        cursor: Optional[str] = None,
+        sort: Optional[str] = None,
+        client_name: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Async variant of list_templates.
+        
+        Args:
+            cloud_provider: Filter by cloud provider
+            template_type: Filter by template type
+            tags: Filter by tags
+            owner: Filter by owner
+            search: Search in name and description
+            limit: Maximum number of templates to return
+            offset: Number of templates to skip (ignored if a cursor is given)
+            cursor: Cursor returned as next_cursor by a previous call
+            sort: Sort field ("name", "title", "type" or "owner"), prefixed with "-" for descending order
+            client_name: Name of the client to use, or None for default
+            
+        Returns:
+            Dictionary with template items, total count and the cursor of the next page
+        """
+        client = self.get_client(client_name)
+        return await client.alist_templates(
+            cloud_provider=cloud_provider,
+            template_type=template_type,
+            tags=tags,
+            owner=owner,
+            search=search,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            sort=sort
+        )
+    
+    async def aget_template(
+        self,
+        template_name: str,
+        client_name: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Async variant of get_template.
+        
+        Args:
+            template_name: Name of the template
+            client_name: Name of the client to use, or None for default
+            
+        Returns:
+            Template details
+        """
+        client = self.get_client(client_name)
+        return await client.aget_template(template_name)
+    
+    async def aget_templates(
+        self,
+        template_names: List[str],
+        client_name: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Async variant of get_templates.
+        
+        Args:
+            template_names: Names of the templates to retrieve
+            client_name: Name of the client to use, or None for default
+            
+        Returns:
+            Dictionary with template items, total count and names not found
+        """
+        client = self.get_client(client_name)
+        return await client.aget_templates(template_names)
+    
+    async def aget_template_parameters(
+        self,
+        template_name: str,
+        client_name: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Async variant of get_template_parameters.
+        
+        Args:
+            template_name: Name of the template
+            client_name: Name of the client to use, or None for default
+            
+        Returns:
+            Template parameter schema
+        """
+        client = self.get_client(client_name)
+        return await client.aget_template_parameters(template_name)
+    
+    async def aexecute_template(
+        self,
+        template_name: str,
+        parameters: Dict[str, Any],
+        dry_run: bool = False,
+        client_name: Optional[str] = None,
+        s3_bucket: Optional[str] = None,
+        s3_key: Optional[str] = None,
+        local_path: Optional[str] = None,
+        aws_access_key: Optional[str] = None,
+        aws_secret_key: Optional[str] = None,
+        aws_region: Optional[str] = None,
+        poll_interval: Optional[int] = None,
+        timeout: Optional[int] = None
+    ) -> TemplateTaskResponse:
+        """
+        Async variant of execute_template.
+        
+        Args:
+            template_name: Name of the template
+            parameters: Template parameters
+            dry_run: Whether to perform a dry run
+            client_name: Name of the client to use, or None for default
+            s3_bucket: S3 bucket containing the result (optional, overrides client config)
+            s3_key: Key/path of the zip file in S3 (optional, auto-determined if not provided)
+            local_path: Path where the file should be downloaded locally (optional)
+            aws_access_key: AWS access key ID (optional, overrides client config)
+            aws_secret_key: AWS secret access key (optional, overrides client config)
+            aws_region: AWS region (optional, overrides client config)
+            poll_interval: How often to check task status (seconds)
+            timeout: Maximum time to wait for completion (seconds)
+            
+        Returns:
+            Task response with download information if S3 download was performed
+        """
+        client = self.get_client(client_name)
+        task = TemplateTask(
+            template_name=template_name,
+            parameters=parameters,
+            dry_run=dry_run
+        )
+        
+        return await client.aexecute_template(
+            task=task,
+            s3_bucket=s3_bucket,
+            s3_key=s3_key,
+            local_path=local_path,
+            aws_access_key=aws_access_key,
+            aws_secret_key=aws_secret_key,
+            aws_region=aws_region,
+            poll_interval=poll_interval,
+            timeout=timeout
+        )
+    
+    async def arender_template_archive(
+        self,
+        template_name: str,
+        parameters: Dict[str, Any],
+        archive_format: str = "zip",
+        client_name: Optional[str] = None
+    ) -> Iterator[bytes]:
+        """
+        Async variant of render_template_archive.
+        
+        Args:
+            template_name: Name of the template
+            parameters: Template parameters
+            archive_format: Archive format (zip, tar or tar.gz)
+            client_name: Name of the client to use, or None for default
+            
+        Returns:
+            Iterator over the archive bytes, to be consumed off the event loop
+        """
+        client = self.get_client(client_name)
+        task = TemplateTask(
+            template_name=template_name,
+            parameters=parameters
+        )
+        return await client.arender_archive(task, archive_format)
+    
+    async def aget_task_status(
+        self,
+        task_id: str,
+        client_name: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Async variant of get_task_status.
+        
+        Args:
+            task_id: ID of the task
+            client_name: Name of the client to use, or None for default
+            
+        Returns:
+            Task status
+        """
+        client = self.get_client(client_name)
+        return await client.aget_task_status(task_id)
+    
+    def close(self) -> None:
+        """
+        Close all template clients and release their resources.
+        
+        This should be called once when the application shuts down.
+        """
+        for name, client in self.clients.items():
+            try:
+                client.close()
+            except Exception as e:
+                logger.error(f"Error closing template client '{name}': {str(e)}")
+    
+    async def aclose(self) -> None:
+        """
+        Async variant of close, also closing the clients' async connection pools.
+        """
+        for name, client in self.clients.items():
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.error(f"Error closing template client '{name}': {str(e)}")
\ No newline at end of file
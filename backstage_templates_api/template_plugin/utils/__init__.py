@@ -6,15 +6,44 @@ This module exports utility functions used throughout the template plugin.
 
 from template_plugin.utils.template_utils import (
     process_template_files,
+    compile_render_plan,
+    RenderPlan,
     validate_template_parameters,
-    render_template_string
+    render_template_string,
+    get_template,
+    configure_template_cache,
+    clear_template_cache
 )
 from template_plugin.utils.file_utils import (
     find_file,
     read_yaml_file,
+    read_yaml_partial,
     write_yaml_file,
+    configure_yaml_cache,
+    clear_yaml_cache,
     list_directories,
-    copy_directory
+    copy_file,
+    copy_directory,
+    walk_template_dirs
+)
+from template_plugin.utils.retry_utils import (
+    RetryPolicy,
+    CircuitBreaker,
+    parse_retry_after
+)
+from template_plugin.utils.concurrency_utils import (
+    SingleFlight,
+    AsyncSingleFlight
+)
+from template_plugin.utils.pagination_utils import (
+    parse_sort,
+    encode_cursor,
+    decode_cursor,
+    paginate_items
+)
+from template_plugin.utils.archive_utils import (
+    ARCHIVE_FORMATS,
+    stream_archive
 )
 from template_plugin.utils.auth_utils import (
     generate_token,
@@ -24,13 +53,34 @@ from template_plugin.utils.auth_utils import (
 
 __all__ = [
     'process_template_files',
+    'compile_render_plan',
+    'RenderPlan',
     'validate_template_parameters',
     'render_template_string',
+    'get_template',
+    'configure_template_cache',
+    'clear_template_cache',
     'find_file',
     'read_yaml_file',
+    'read_yaml_partial',
     'write_yaml_file',
+    'configure_yaml_cache',
+    'clear_yaml_cache',
     'list_directories',
+    'copy_file',
     'copy_directory',
+    'walk_template_dirs',
+    'RetryPolicy',
+    'CircuitBreaker',
+    'parse_retry_after',
+    'SingleFlight',
+    'AsyncSingleFlight',
+    'parse_sort',
+    'encode_cursor',
+    'decode_cursor',
+    'paginate_items',
+    'ARCHIVE_FORMATS',
+    'stream_archive',
     'generate_token',
     'validate_token',
     'get_auth_headers'
@@ -0,0 +1,227 @@
+"""
+Archive Utilities
+
+This module provides streaming zip and tar writers, which turn rendered
+template files into archive chunks as they are produced, without an
+intermediate directory or a seekable output file.
+"""
+
+import logging
+import os
+import re
+import stat
+import tarfile
+import time
+import zipfile
+import zlib
+from typing import Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import quote
+
+from template_plugin.errors.exceptions import TemplateValidationError
+
+logger = logging.getLogger("archive-utils")
+
+# Archive formats and their media types
+ARCHIVE_FORMATS = {
+    "zip": "application/zip",
+    "tar": "application/x-tar",
+    "tar.gz": "application/gzip"
+}
+
+# Size of the chunks read from copied files and yielded to the caller
+ARCHIVE_CHUNK_SIZE = 64 * 1024
+
+# Characters replaced in the plain filename parameter of Content-Disposition: anything
+# outside printable ASCII, and the quote, backslash and separators that would end it
+_UNSAFE_FILENAME_CHARS = re.compile(r'[^\x20-\x7e]|["\\;,/]')
+
+# A member of an archive: (name, rendered content, source file). Exactly one of
+# content and source is set; source files are streamed in chunks.
+ArchiveMember = Tuple[str, Optional[bytes], Optional[str]]
+
+
+class _ChunkBuffer:
+    """Write-only, unseekable file object collecting written bytes until drained."""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self.size = 0
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        self.size += len(data)
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        self.size = 0
+        return data
+
+
+def _read_chunks(source: str) -> Iterator[bytes]:
+    with open(source, 'rb') as f:
+        while True:
+            chunk = f.read(ARCHIVE_CHUNK_SIZE)
+            if not chunk:
+                return
+            yield chunk
+
+
+def _stream_zip(directories: List[str], members: Iterable[ArchiveMember]) -> Iterator[bytes]:
+    buffer = _ChunkBuffer()
+    # Without tell() and seek() on the buffer, zipfile writes sizes in data descriptors
+    with zipfile.ZipFile(buffer, mode="w", compression=zipfile.ZIP_DEFLATED) as archive:
+        date_time = time.localtime(time.time())[:6]
+        for directory in directories:
+            info = zipfile.ZipInfo(directory.replace(os.sep, "/") + "/", date_time=date_time)
+            info.external_attr = (stat.S_IFDIR | 0o755) << 16 | 0x10
+            archive.writestr(info, b"")
+        if buffer.size:
+            yield buffer.drain()
+
+        for name, content, source in members:
+            arcname = name.replace(os.sep, "/")
+            if content is not None:
+                info = zipfile.ZipInfo(arcname, date_time=date_time)
+                info.external_attr = (stat.S_IFREG | 0o644) << 16
+                archive.writestr(info, content, compress_type=zipfile.ZIP_DEFLATED)
+            else:
+                info = zipfile.ZipInfo.from_file(source, arcname)
+                info.compress_type = zipfile.ZIP_DEFLATED
+                with archive.open(info, mode="w") as dest:
+                    for chunk in _read_chunks(source):
+                        dest.write(chunk)
+                        if buffer.size >= ARCHIVE_CHUNK_SIZE:
+                            yield buffer.drain()
+            if buffer.size:
+                yield buffer.drain()
+    # Central directory
+    if buffer.size:
+        yield buffer.drain()
+
+
+def _tar_padding(size: int) -> bytes:
+    remainder = size % tarfile.BLOCKSIZE
+    return tarfile.NUL * (tarfile.BLOCKSIZE - remainder) if remainder else b""
+
+
+def _tar_header(info: tarfile.TarInfo) -> bytes:
+    return info.tobuf(tarfile.PAX_FORMAT, tarfile.ENCODING, "surrogateescape")
+
+
+def _stream_tar(directories: List[str], members: Iterable[ArchiveMember]) -> Iterator[bytes]:
+    # Written from TarInfo headers instead of through TarFile, which would hold
+    # each member in memory until it is complete
+    mtime = int(time.time())
+    offset = 0
+    for directory in directories:
+        info = tarfile.TarInfo(directory.replace(os.sep, "/"))
+        info.type = tarfile.DIRTYPE
+        info.mode = 0o755
+        info.mtime = mtime
+        header = _tar_header(info)
+        offset += len(header)
+        yield header
+
+    for name, content, source in members:
+        info = tarfile.TarInfo(name.replace(os.sep, "/"))
+        if content is not None:
+            info.size = len(content)
+            info.mode = 0o644
+            info.mtime = mtime
+            data = _tar_header(info) + content + _tar_padding(len(content))
+            offset += len(data)
+            yield data
+            continue
+
+        st = os.stat(source)
+        info.size = st.st_size
+        info.mode = stat.S_IMODE(st.st_mode)
+        info.mtime = int(st.st_mtime)
+        header = _tar_header(info)
+        offset += len(header)
+        yield header
+        # The header announced st_size bytes, so a file changed while streaming is cut to that
+        remaining = info.size
+        for chunk in _read_chunks(source):
+            chunk = chunk[:remaining]
+            remaining -= len(chunk)
+            yield chunk
+            if not remaining:
+                break
+        if remaining:
+            raise OSError(f"File shrank while archiving: {source}")
+        padding = _tar_padding(info.size)
+        offset += info.size + len(padding)
+        yield padding
+
+    # End-of-archive marker, padded to a full record like TarFile.close()
+    offset += 2 * tarfile.BLOCKSIZE
+    remainder = offset % tarfile.RECORDSIZE
+    yield tarfile.NUL * (2 * tarfile.BLOCKSIZE + (tarfile.RECORDSIZE - remainder if remainder else 0))
+
+
+def _gzip(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    compressor = zlib.compressobj(wbits=31)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def stream_archive(
+    directories: List[str],
+    members: Iterable[ArchiveMember],
+    archive_format: str = "zip"
+) -> Iterator[bytes]:
+    """
+    Stream an archive of rendered files.
+
+    Members are consumed lazily, so each file is rendered, archived and handed
+    to the caller before the next one is rendered.
+
+    Args:
+        directories: Directories to add, parents first (including empty ones)
+        members: Files to add as (name, rendered content, source file) tuples
+        archive_format: Archive format, one of ARCHIVE_FORMATS
+
+    Returns:
+        Iterator over the archive bytes
+
+    Raises:
+        TemplateValidationError: If the archive format is not supported
+    """
+    if archive_format not in ARCHIVE_FORMATS:
+        raise TemplateValidationError(
+            f"Unsupported archive format: {archive_format}. "
+            f"Supported formats: {', '.join(ARCHIVE_FORMATS)}"
+        )
+    if archive_format == "zip":
+        return _stream_zip(directories, members)
+    chunks = _stream_tar(directories, members)
+    if archive_format == "tar.gz":
+        return _gzip(chunks)
+    return chunks
+
+
+def content_disposition(filename: str) -> str:
+    """
+    Build an attachment Content-Disposition header value for a download.
+
+    The filename is given twice, as RFC 6266 recommends: percent-encoded UTF-8
+    in filename*, and with unsafe characters replaced in filename for clients
+    that do not support the extended parameter.
+
+    Args:
+        filename: Name of the downloaded file
+
+    Returns:
+        Header value
+    """
+    fallback = _UNSAFE_FILENAME_CHARS.sub("_", filename)
+    return f"attachment; filename=\"{fallback}\"; filename*=UTF-8''{quote(filename, safe='')}"
@@ -0,0 +1,113 @@
+"""
+Concurrency Utilities
+
+This module provides single-flight helpers that coalesce concurrent identical
+calls into one execution whose result (or exception) is shared by all callers.
+"""
+
+import asyncio
+import logging
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+logger = logging.getLogger("concurrency-utils")
+
+
+class _Call:
+    """An in-flight call shared by the threads waiting for it."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Thread-based single-flight group.
+
+    While a call for a key is running, other threads calling do() with the same
+    key wait for it and receive the same result instead of starting their own.
+    """
+
+    def __init__(self):
+        """Initialize the single-flight group."""
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """
+        Run func once for all concurrent callers using the same key.
+
+        Args:
+            key: Key identifying identical calls
+            func: Function to run
+
+        Returns:
+            The function's result
+
+        Raises:
+            Exception: Whatever the shared call raised
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+
+        if not leader:
+            logger.debug(f"Joining in-flight call: {key}")
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+class AsyncSingleFlight:
+    """
+    asyncio-based single-flight group.
+
+    The shared call runs as a task, and each caller awaits it through
+    asyncio.shield, so a cancelled caller does not cancel the call for the others.
+    """
+
+    def __init__(self):
+        """Initialize the single-flight group."""
+        self._tasks: Dict[Hashable, "asyncio.Task[Any]"] = {}
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Await func once for all concurrent callers using the same key.
+
+        Args:
+            key: Key identifying identical calls
+            func: Coroutine function to run
+
+        Returns:
+            The coroutine's result
+
+        Raises:
+            Exception: Whatever the shared call raised
+        """
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._tasks[key] = task
+            task.add_done_callback(lambda _: self._tasks.pop(key, None))
+        else:
+            logger.debug(f"Joining in-flight call: {key}")
+        return await asyncio.shield(task)
@@ -5,15 +5,66 @@ This module provides utility functions for working with files and directories.
 """
 
 import os
+import errno
+import functools
 import logging
+import pickle
+import re
 import shutil
+import threading
 import yaml
-from typing import List, Dict, Any, Optional
+from collections import OrderedDict
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Set, Tuple
 
 from template_plugin.errors.exceptions import FileAccessError
 
 logger = logging.getLogger("file-utils")
 
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# Use the libyaml-based loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YAMLSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YAMLSafeLoader
+
+# Parsed YAML documents keyed by (path, mtime_ns, size). Documents are stored
+# pickled, so every hit returns a fresh copy callers can modify, and the cache
+# size is bounded by the total size of the pickles.
+YAML_CACHE_MAX_BYTES = 64 * 1024 * 1024
+_yaml_cache: "OrderedDict[Tuple[str, int, int], bytes]" = OrderedDict()
+_yaml_cache_bytes = 0
+_yaml_cache_lock = threading.Lock()
+
+# Linux ioctl cloning a whole file into another (reflink), on filesystems that
+# share extents between files (Btrfs, XFS, bcachefs, overlayfs on top of those)
+FICLONE = 0x40049409
+
+# errno values meaning a copy strategy is unsupported between two filesystems
+_UNSUPPORTED_COPY_ERRNOS = frozenset(
+    code for code in (
+        getattr(errno, name, None)
+        for name in ("EXDEV", "ENOSYS", "EOPNOTSUPP", "ENOTSUP", "ENOTTY")
+    ) if code is not None
+)
+
+# errno values meaning a copy strategy cannot copy one particular file (e.g. EPERM
+# from protected_hardlinks, EMLINK on a file with too many links)
+_FILE_COPY_ERRNOS = frozenset((errno.EPERM, errno.EINVAL, errno.EMLINK))
+
+# (strategy, source device, destination device) combinations that failed as unsupported
+_unsupported_copies: Set[Tuple[str, int, int]] = set()
+
+# Plain block mapping key at the start of a dedented line, e.g. "metadata:" or "owner: team-a"
+_YAML_KEY = re.compile(r"([A-Za-z_][\w.-]*)[ \t]*:(?=[ \t]|\r?\n|$)")
+
+# Directories that never contain templates: template skeletons, task outputs and hidden directories
+PRUNED_DIR_NAMES = frozenset({"skeleton"})
+PRUNED_DIR_PREFIXES = ("output_", ".")
+
 def find_file(directory: str, filename: str) -> Optional[str]:
     """
     Find a file in a directory and its subdirectories.
@@ -40,10 +91,111 @@ def find_file(directory: str, filename: str) -> Optional[str]:
         logger.error(f"Error finding file: {str(e)}")
         return None
 
+def walk_template_dirs(
+    directory: str,
+    marker: str = "template.yaml",
+    exclude: Optional[Iterable[str]] = None
+) -> Iterator[Tuple[str, int, bool]]:
+    """
+    Walk a templates tree, skipping the subtrees that cannot contain templates.
+    
+    Uses os.scandir, so no extra stat call is made per entry. Skeleton, task
+    output and hidden directories are pruned, and directories containing the
+    marker file are not descended into, since templates do not nest. Symlinked
+    directories are not followed, as with os.walk.
+    
+    Args:
+        directory: Root directory of the templates tree
+        marker: Name of the file that marks a template directory
+        exclude: Absolute paths of additional directories to prune
+        
+    Yields:
+        Tuples of (directory path, directory mtime in ns, whether it contains the marker),
+        in sorted depth-first order
+    """
+    excluded = {os.path.abspath(path) for path in exclude or ()}
+    stack = [directory]
+    
+    while stack:
+        dirpath = stack.pop()
+        try:
+            mtime_ns = os.stat(dirpath).st_mtime_ns
+            with os.scandir(dirpath) as it:
+                entries = list(it)
+        except OSError as e:
+            logger.warning(f"Cannot scan directory {dirpath}: {str(e)}")
+            continue
+        
+        has_marker = False
+        subdirs = []
+        for entry in entries:
+            try:
+                if entry.name == marker and entry.is_file():
+                    has_marker = True
+                elif (entry.is_dir(follow_symlinks=False)
+                      and entry.name not in PRUNED_DIR_NAMES
+                      and not entry.name.startswith(PRUNED_DIR_PREFIXES)
+                      and not (excluded and os.path.abspath(entry.path) in excluded)):
+                    subdirs.append(entry.path)
+            except OSError:
+                continue
+        
+        yield dirpath, mtime_ns, has_marker
+        
+        if not has_marker:
+            stack.extend(sorted(subdirs, reverse=True))
+
+def configure_yaml_cache(max_bytes: int) -> None:
+    """
+    Set the memory bound of the parsed YAML cache.
+    
+    Args:
+        max_bytes: Maximum total size of the cached documents (0 disables the cache)
+    """
+    global YAML_CACHE_MAX_BYTES
+    YAML_CACHE_MAX_BYTES = max_bytes
+    _evict_yaml_cache()
+
+def clear_yaml_cache() -> None:
+    """
+    Drop all cached YAML documents.
+    """
+    global _yaml_cache_bytes
+    with _yaml_cache_lock:
+        _yaml_cache.clear()
+        _yaml_cache_bytes = 0
+
+def _evict_yaml_cache() -> None:
+    global _yaml_cache_bytes
+    with _yaml_cache_lock:
+        while _yaml_cache and _yaml_cache_bytes > YAML_CACHE_MAX_BYTES:
+            _, evicted = _yaml_cache.popitem(last=False)
+            _yaml_cache_bytes -= len(evicted)
+
+def _cache_yaml_document(key: Tuple[str, int, int], content: Any) -> None:
+    global _yaml_cache_bytes
+    try:
+        data = pickle.dumps(content, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception as e:
+        logger.debug(f"Not caching YAML file {key[0]}: {str(e)}")
+        return
+    if len(data) > YAML_CACHE_MAX_BYTES:
+        return
+    with _yaml_cache_lock:
+        previous = _yaml_cache.pop(key, None)
+        if previous is not None:
+            _yaml_cache_bytes -= len(previous)
+        _yaml_cache[key] = data
+        _yaml_cache_bytes += len(data)
+    _evict_yaml_cache()
+
 def read_yaml_file(filepath: str) -> Dict[str, Any]:
     """
     Read and parse a YAML file.
     
+    Parsed documents are cached by path, mtime and size, so unchanged files are
+    not parsed again. Each call returns a separate copy of the document.
+    
     Args:
         filepath: Path to the YAML file
         
@@ -56,12 +208,24 @@ def read_yaml_file(filepath: str) -> Dict[str, Any]:
     try:
         logger.debug(f"Reading YAML file: {filepath}")
         
+        st = os.stat(filepath)
+        key = (os.path.abspath(filepath), st.st_mtime_ns, st.st_size)
+        with _yaml_cache_lock:
+            cached = _yaml_cache.get(key)
+            if cached is not None:
+                _yaml_cache.move_to_end(key)
+        if cached is not None:
+            return pickle.loads(cached)
+        
         with open(filepath, 'r') as f:
-            content = yaml.safe_load(f)
+            content = yaml.load(f, Loader=YAMLSafeLoader)
             
         if content is None:
             # Empty file
-            return {}
+            content = {}
+        
+        if YAML_CACHE_MAX_BYTES > 0:
+            _cache_yaml_document(key, content)
             
         return content
     except yaml.YAMLError as e:
@@ -71,6 +235,147 @@ def read_yaml_file(filepath: str) -> Dict[str, Any]:
         logger.error(f"Error reading file {filepath}: {str(e)}")
         raise FileAccessError(f"Failed to read file '{filepath}': {str(e)}")
 
+class _PartialReadError(Exception):
+    """Raised when a document cannot be read partially and must be parsed in full."""
+
+def _split_yaml_mapping(lines: List[str], indent: int) -> List[Tuple[str, List[str]]]:
+    """
+    Split the lines of a block mapping into (key, lines) entries.
+    
+    Raises:
+        _PartialReadError: If a line at the mapping's indentation is not a plain key
+    """
+    entries: List[Tuple[str, List[str]]] = []
+    for line in lines:
+        content = line.lstrip(" ")
+        if not content.strip() or content.startswith("#"):
+            if entries:
+                entries[-1][1].append(line)
+            continue
+        depth = len(line) - len(content)
+        # Deeper lines, and "- " items of a sequence indented like its key, belong to the current entry
+        if entries and (depth > indent or (depth == indent and (content.startswith("- ") or content.rstrip() == "-"))):
+            entries[-1][1].append(line)
+            continue
+        match = _YAML_KEY.match(content) if depth == indent else None
+        if match is None:
+            raise _PartialReadError(line)
+        entries.append((match.group(1), [line]))
+    return entries
+
+def _select_yaml_keys(content: Any, keys: Dict[str, Optional[Iterable[str]]]) -> Any:
+    """Keep the given top-level keys (and child keys) of a parsed document."""
+    if not isinstance(content, dict):
+        return content
+    selected = {}
+    for key, children in keys.items():
+        if key in content:
+            value = content[key]
+            if children is not None and isinstance(value, dict):
+                value = {child: value[child] for child in children if child in value}
+            selected[key] = value
+    return selected
+
+def _read_yaml_entry(lines: List[str], key: str, children: Optional[Iterable[str]]) -> Any:
+    """Parse the value of a top-level entry, or only the given child keys of it."""
+    if children is None:
+        return yaml.load("".join(lines), Loader=YAMLSafeLoader)[key]
+    
+    header = lines[0].lstrip(" ")
+    inline = header[_YAML_KEY.match(header).end():].strip()
+    if inline and not inline.startswith("#"):
+        # Flow, tagged or anchored value on the key line: parse the whole entry
+        value = yaml.load("".join(lines), Loader=YAMLSafeLoader)[key]
+    else:
+        body = lines[1:]
+        indents = [
+            len(line) - len(line.lstrip(" ")) for line in body
+            if line.strip() and not line.lstrip(" ").startswith("#")
+        ]
+        if not indents:
+            return None
+        children = set(children)
+        wanted = [
+            line for child, child_lines in _split_yaml_mapping(body, indents[0])
+            if child in children for line in child_lines
+        ]
+        # The fragment keeps its indentation, which is valid for a root mapping
+        value = yaml.load("".join(wanted), Loader=YAMLSafeLoader) or {}
+    return _select_yaml_keys({key: value}, {key: children})[key]
+
+def _read_yaml_keys(text: str, keys: Dict[str, Optional[Iterable[str]]]) -> Optional[Dict[str, Any]]:
+    """
+    Parse only the selected entries of a block-style YAML mapping.
+    
+    Returns:
+        Selected content, or None if the document must be parsed in full
+    """
+    lines = text.splitlines(keepends=True)
+    start = len(lines)
+    for index, line in enumerate(lines):
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#") or line.startswith("%"):
+            continue
+        if line.startswith("---"):
+            rest = line[3:].strip()
+            if rest and not rest.startswith("#"):
+                return None
+            continue
+        start = index
+        break
+    
+    try:
+        selected = {}
+        for key, entry_lines in _split_yaml_mapping(lines[start:], 0):
+            if key in keys:
+                selected[key] = _read_yaml_entry(entry_lines, key, keys[key])
+        return selected
+    except (_PartialReadError, yaml.YAMLError, KeyError, TypeError):
+        # e.g. flow-style or multi-document files, aliases to skipped anchors, non-string keys
+        return None
+
+def read_yaml_partial(filepath: str, keys: Dict[str, Optional[Iterable[str]]]) -> Any:
+    """
+    Read selected top-level keys of a YAML mapping without parsing the rest.
+    
+    The file is split into top-level entries on its block structure, and only
+    the selected entries are parsed, so large unselected sections (e.g. a
+    template's parameter schemas and steps) are never tokenized. Documents the
+    split cannot handle safely are parsed in full. Results are not cached.
+    
+    Args:
+        filepath: Path to the YAML file
+        keys: Top-level keys to read, each mapped to None for its whole value or
+            to the child keys to keep from a mapping value
+        
+    Returns:
+        The selected content (the whole content if the document is not a mapping)
+        
+    Raises:
+        FileAccessError: If there is an error reading or parsing the file
+    """
+    try:
+        logger.debug(f"Partially reading YAML file: {filepath}")
+        
+        with open(filepath, 'r') as f:
+            text = f.read()
+        
+        selected = _read_yaml_keys(text, keys)
+        if selected is not None:
+            return selected
+        
+        logger.debug(f"Parsing YAML file {filepath} in full")
+        content = yaml.load(text, Loader=YAMLSafeLoader)
+        if content is None:
+            content = {}
+        return _select_yaml_keys(content, keys)
+    except yaml.YAMLError as e:
+        logger.error(f"YAML parsing error in {filepath}: {str(e)}")
+        raise FileAccessError(f"Failed to parse YAML file '{filepath}': {str(e)}")
+    except Exception as e:
+        logger.error(f"Error reading file {filepath}: {str(e)}")
+        raise FileAccessError(f"Failed to read file '{filepath}': {str(e)}")
+
 def write_yaml_file(filepath: str, data: Dict[str, Any]) -> None:
     """
     Write data to a YAML file.
@@ -124,13 +429,104 @@ def list_directories(directory: str) -> List[str]:
         logger.error(f"Error listing directory {directory}: {str(e)}")
         raise FileAccessError(f"Failed to list directory '{directory}': {str(e)}")
 
-def copy_directory(source: str, destination: str) -> None:
+def _copy_unsupported(strategy: str, devices: Tuple[int, int], error: OSError) -> bool:
+    # Remember strategies the filesystems don't support, so they are not retried for
+    # every file; per-file failures only skip the strategy for the failing file
+    if error.errno in _FILE_COPY_ERRNOS:
+        logger.debug(f"Copy strategy {strategy} failed for one file, falling back: {str(error)}")
+        return True
+    if error.errno not in _UNSUPPORTED_COPY_ERRNOS:
+        return False
+    key = (strategy,) + devices
+    if key not in _unsupported_copies:
+        logger.debug(f"Copy strategy {strategy} unsupported between devices {devices}: {str(error)}")
+        _unsupported_copies.add(key)
+    return True
+
+def _copy_reflink(fsrc, fdst) -> None:
+    fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+
+def _copy_range(fsrc, fdst) -> None:
+    while os.copy_file_range(fsrc.fileno(), fdst.fileno(), 1 << 30) > 0:
+        pass
+
+def _copy_sendfile(fsrc, fdst) -> None:
+    offset = 0
+    while True:
+        sent = os.sendfile(fdst.fileno(), fsrc.fileno(), offset, 1 << 30)
+        if sent == 0:
+            break
+        offset += sent
+
+def copy_file(source: str, destination: str, hardlink: bool = False) -> str:
+    """
+    Copy a file with the cheapest strategy the filesystems support.
+    
+    Strategies are tried in order: a reflink (FICLONE), which shares the file
+    extents copy-on-write; a hard link, if allowed; an in-kernel copy with
+    copy_file_range or sendfile; and shutil.copy2 as the last resort. Except
+    for hard links, the copy gets the source metadata as with shutil.copy2.
+    
+    Args:
+        source: Source file
+        destination: Destination file (replaced if it exists)
+        hardlink: Allow hard linking the destination to the source. The files
+            then share their content, so writing to one changes the other.
+        
+    Returns:
+        Name of the strategy used: reflink, hardlink, copy_file_range, sendfile or copy2
+        
+    Raises:
+        OSError: If the file cannot be copied
+    """
+    with open(source, 'rb') as fsrc:
+        src_dev = os.fstat(fsrc.fileno()).st_dev
+        dst_dev = os.stat(os.path.dirname(os.path.abspath(destination))).st_dev
+        devices = (src_dev, dst_dev)
+        
+        strategies = []
+        if fcntl is not None:
+            strategies.append(("reflink", _copy_reflink))
+        if hardlink and src_dev == dst_dev:
+            strategies.append(("hardlink", None))
+        if hasattr(os, "copy_file_range"):
+            strategies.append(("copy_file_range", _copy_range))
+        if hasattr(os, "sendfile"):
+            strategies.append(("sendfile", _copy_sendfile))
+        
+        for strategy, copy in strategies:
+            if (strategy,) + devices in _unsupported_copies:
+                continue
+            try:
+                if copy is None:
+                    if os.path.lexists(destination):
+                        os.unlink(destination)
+                    os.link(source, destination)
+                    return strategy
+                fsrc.seek(0)
+                with open(destination, 'wb') as fdst:
+                    copy(fsrc, fdst)
+            except OSError as e:
+                if not _copy_unsupported(strategy, devices, e):
+                    raise
+                continue
+            shutil.copystat(source, destination)
+            return strategy
+    
+    shutil.copy2(source, destination)
+    return "copy2"
+
+def copy_directory(source: str, destination: str, hardlink: bool = False) -> None:
     """
     Copy a directory and its contents to a destination.
     
+    Files are copied with copy_file, so reflinks and in-kernel copies are used
+    where the filesystems support them.
+    
     Args:
         source: Source directory
         destination: Destination directory
+        hardlink: Allow hard linking copied files to their source
         
     Raises:
         FileAccessError: If there is an error copying the directory
@@ -145,7 +541,12 @@ def copy_directory(source: str, destination: str) -> None:
         os.makedirs(os.path.dirname(os.path.abspath(destination)), exist_ok=True)
         
         # Copy directory
-        shutil.copytree(source, destination, dirs_exist_ok=True)
+        shutil.copytree(
+            source,
+            destination,
+            copy_function=functools.partial(copy_file, hardlink=hardlink),
+            dirs_exist_ok=True
+        )
         
     except FileAccessError:
         raise
@@ -0,0 +1,154 @@
+"""
+Pagination Utilities
+
+This module provides helpers for paginating and sorting template listings:
+sort specification parsing, sort keys and opaque page cursors.
+"""
+
+import base64
+import binascii
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from template_plugin.errors.exceptions import TemplateValidationError
+
+# Sortable fields and where they live in a template
+SORT_FIELDS = {
+    "name": ("metadata", "name"),
+    "title": ("metadata", "title"),
+    "type": ("spec", "type"),
+    "owner": ("spec", "owner")
+}
+
+
+def parse_sort(sort: Optional[str]) -> Tuple[Optional[str], bool]:
+    """
+    Parse a sort specification such as "name" or "-owner".
+
+    Args:
+        sort: Sort specification, a field name optionally prefixed with "-" for descending order
+
+    Returns:
+        Tuple of (field, descending), with a None field for the default order
+
+    Raises:
+        TemplateValidationError: If the field cannot be sorted on
+    """
+    if not sort:
+        return None, False
+    descending = sort.startswith("-")
+    field = sort.lstrip("-+")
+    if field not in SORT_FIELDS:
+        raise TemplateValidationError(
+            f"Invalid sort field '{field}', expected one of: {', '.join(SORT_FIELDS)}"
+        )
+    return field, descending
+
+
+def sort_key(template: Dict[str, Any], field: str) -> Tuple[str, str]:
+    """
+    Get the sort key of a template, with the template name as tie-breaker.
+
+    Args:
+        template: Template data
+        field: Field to sort on (one of SORT_FIELDS)
+
+    Returns:
+        Sort key
+    """
+    section, attribute = SORT_FIELDS[field]
+    value = (template.get(section) or {}).get(attribute)
+    name = (template.get("metadata") or {}).get("name")
+    return (str(value).lower() if value is not None else "", str(name or ""))
+
+
+def encode_cursor(data: Dict[str, Any]) -> str:
+    """
+    Encode cursor data into an opaque, URL-safe cursor string.
+
+    Args:
+        data: JSON-serializable cursor data
+
+    Returns:
+        Cursor string
+    """
+    raw = json.dumps(data, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Cursor string
+
+    Returns:
+        Cursor data
+
+    Raises:
+        TemplateValidationError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        data = json.loads(raw.decode("utf-8"))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise TemplateValidationError("Invalid pagination cursor")
+    if not isinstance(data, dict):
+        raise TemplateValidationError("Invalid pagination cursor")
+    return data
+
+
+def paginate_items(
+    items: List[Dict[str, Any]],
+    limit: Optional[int] = None,
+    offset: Optional[int] = None,
+    cursor: Optional[str] = None,
+    sort: Optional[str] = None,
+    origin: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Sort and paginate an in-memory list of templates with offset-based cursors.
+
+    Used where results are already materialized (e.g. ranked search results);
+    listings backed by an index use keyset cursors instead. Clients that also
+    hand out cursors of another kind tag these with an origin, so that a
+    cursor is only accepted by the path that produced it.
+
+    Args:
+        items: Templates, in their default order
+        limit: Maximum number of templates to return
+        offset: Number of templates to skip (ignored if a cursor is given)
+        cursor: Cursor returned as next_cursor by a previous call
+        sort: Sort specification (see parse_sort)
+        origin: Origin tag stored in and required from cursors
+
+    Returns:
+        Dictionary with the page items, the total count and the next cursor
+
+    Raises:
+        TemplateValidationError: If the cursor is malformed or does not match the request
+    """
+    field, descending = parse_sort(sort)
+    if field is not None:
+        items = sorted(items, key=lambda template: sort_key(template, field), reverse=descending)
+
+    start = offset or 0
+    if cursor:
+        data = decode_cursor(cursor)
+        if data.get("origin") != origin or data.get("sort") != sort or not isinstance(data.get("offset"), int):
+            raise TemplateValidationError("Pagination cursor does not match the request")
+        start = data["offset"]
+
+    end = len(items) if limit is None else start + limit
+    next_cursor = None
+    if end < len(items):
+        data = {"sort": sort, "offset": end}
+        if origin is not None:
+            data["origin"] = origin
+        next_cursor = encode_cursor(data)
+    return {
+        "items": items[start:end],
+        "total_count": len(items),
+        "next_cursor": next_cursor
+    }
@@ -0,0 +1,197 @@
+"""
+Retry Utilities
+
+This module provides a retry policy with jittered exponential backoff and a
+circuit breaker for calls to remote services.
+"""
+
+import logging
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+logger = logging.getLogger("retry-utils")
+
+# HTTP status codes that signal a transient failure worth retrying
+RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+# HTTP methods that can be repeated without side effects
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header value.
+
+    Args:
+        value: Header value, either a number of seconds or an HTTP date
+
+    Returns:
+        Delay in seconds, or None if the header is missing or invalid
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        logger.debug(f"Ignoring invalid Retry-After header: {value}")
+        return None
+
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryPolicy:
+    """
+    Decides whether a failed call may be retried and how long to wait before it.
+
+    Only idempotent requests are retried, unless the connection could not be
+    established at all (in which case the request never reached the server).
+    Delays use "full jitter" exponential backoff, so that many workers retrying
+    at the same time do not hit the service in lockstep.
+    """
+
+    def __init__(self, max_retries: int = 3, backoff_base: float = 0.5, backoff_max: float = 10.0):
+        """
+        Initialize the retry policy.
+
+        Args:
+            max_retries: Maximum number of retries after the first attempt
+            backoff_base: Base delay in seconds for the first retry
+            backoff_max: Maximum delay in seconds between two attempts
+        """
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+    def should_retry(self, method: str, attempt: int, idempotent: Optional[bool] = None, connect_error: bool = False) -> bool:
+        """
+        Check whether another attempt may be made.
+
+        Args:
+            method: HTTP method of the request
+            attempt: Number of retries already made
+            idempotent: Override for the method-based idempotency check
+            connect_error: Whether the failure happened while connecting
+
+        Returns:
+            True if the request should be retried
+        """
+        if attempt >= self.max_retries:
+            return False
+        if connect_error:
+            return True
+        if idempotent is None:
+            idempotent = method.upper() in IDEMPOTENT_METHODS
+        return idempotent
+
+    def get_delay(self, attempt: int, retry_after: Optional[float] = None) -> Optional[float]:
+        """
+        Get the delay before the next attempt.
+
+        Args:
+            attempt: Number of retries already made
+            retry_after: Delay requested by the server through Retry-After, if any
+
+        Returns:
+            Delay in seconds, or None if the server asked to wait longer than backoff_max
+        """
+        if retry_after is not None:
+            if retry_after > self.backoff_max:
+                return None
+            return retry_after
+
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+
+class CircuitBreaker:
+    """
+    Thread-safe circuit breaker for a single remote endpoint.
+
+    After failure_threshold consecutive failures the circuit opens and calls fail
+    fast. Once reset_timeout has elapsed, a single trial call is let through
+    (half-open); its outcome closes or re-opens the circuit.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """
+        Initialize the circuit breaker.
+
+        Args:
+            name: Name of the protected endpoint (for logging)
+            failure_threshold: Consecutive failures before the circuit opens
+            reset_timeout: Seconds to wait before allowing a trial call
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """Get the current state of the circuit."""
+        with self._lock:
+            return self._state
+
+    def allow_request(self) -> bool:
+        """
+        Check whether a call may be made.
+
+        Returns:
+            True if the call may proceed, False if it should fail fast
+        """
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+
+            if self._state == self.OPEN:
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    return False
+                logger.info(f"Circuit '{self.name}' half-open, allowing a trial request")
+                self._state = self.HALF_OPEN
+                self._trial_in_flight = False
+
+            # Half-open: only one trial request at a time
+            if self._trial_in_flight:
+                return False
+            self._trial_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        """Record a successful call, closing the circuit."""
+        with self._lock:
+            if self._state != self.CLOSED:
+                logger.info(f"Circuit '{self.name}' closed")
+            self._state = self.CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Record a failed call, opening the circuit if the threshold is reached."""
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    logger.warning(f"Circuit '{self.name}' opened after {self._failures} consecutive failures")
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
@@ -5,39 +5,127 @@ This module provides utility functions for working with templates.
 """
 
 import os
+import hashlib
 import logging
-import shutil
-from typing import Dict, Any, List
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 import jinja2
 
 from template_plugin.errors.exceptions import TemplateProcessingError, TemplateValidationError
+from template_plugin.utils.file_utils import copy_file
 
 logger = logging.getLogger("template-utils")
 
-def render_template_string(template_string: str, values: Dict[str, Any]) -> str:
+# Extensions of skeleton files rendered as templates, stripped from the target file name
+TEMPLATE_EXTENSIONS = ('.j2', '.jinja', '.jinja2', '.tmpl')
+
+# Number of file errors quoted in the error of a concurrent render
+RENDER_ERRORS_SHOWN = 5
+
+# Compiled templates keyed by a hash of their source, shared by all renders.
+# Skeleton files and templated file names repeat across tasks, so a cached
+# template is only compiled once per process.
+TEMPLATE_CACHE_MAX_ENTRIES = 512
+_template_cache: "OrderedDict[bytes, jinja2.Template]" = OrderedDict()
+_template_cache_lock = threading.Lock()
+_environment: Optional[jinja2.Environment] = None
+_bytecode_cache_dir: Optional[str] = None
+
+def _create_environment() -> jinja2.Environment:
+    # Safe defaults: autoescaping, and undefined values raise instead of rendering empty
+    bytecode_cache = None
+    if _bytecode_cache_dir:
+        os.makedirs(_bytecode_cache_dir, exist_ok=True)
+        bytecode_cache = jinja2.FileSystemBytecodeCache(_bytecode_cache_dir)
+    return jinja2.Environment(
+        loader=jinja2.BaseLoader(),
+        autoescape=True,
+        undefined=jinja2.StrictUndefined,
+        bytecode_cache=bytecode_cache
+    )
+
+def _get_environment() -> jinja2.Environment:
+    global _environment
+    with _template_cache_lock:
+        if _environment is None:
+            _environment = _create_environment()
+        return _environment
+
+def configure_template_cache(max_entries: int, bytecode_cache_dir: Optional[str] = None) -> None:
     """
-    Render a template string with the provided values.
+    Configure the compiled template cache.
     
     Args:
-        template_string: Template string to render
-        values: Values to use for rendering
+        max_entries: Maximum number of compiled templates kept in memory (0 disables the cache)
+        bytecode_cache_dir: Directory persisting compiled template bytecode across
+            restarts and workers (disabled if unset)
+    """
+    global TEMPLATE_CACHE_MAX_ENTRIES, _bytecode_cache_dir, _environment
+    with _template_cache_lock:
+        TEMPLATE_CACHE_MAX_ENTRIES = max_entries
+        if bytecode_cache_dir != _bytecode_cache_dir:
+            _bytecode_cache_dir = bytecode_cache_dir
+            _environment = None
+            _template_cache.clear()
+        while len(_template_cache) > TEMPLATE_CACHE_MAX_ENTRIES:
+            _template_cache.popitem(last=False)
+
+def clear_template_cache() -> None:
+    """
+    Drop all compiled templates.
+    """
+    with _template_cache_lock:
+        _template_cache.clear()
+
+def _compile_template(env: jinja2.Environment, key: bytes, template_string: str) -> jinja2.Template:
+    bytecode_cache = env.bytecode_cache
+    if bytecode_cache is None:
+        return env.from_string(template_string)
+    
+    # Same steps as jinja2.BaseLoader.load, which from_string skips
+    bucket = bytecode_cache.get_bucket(env, key.hex(), None, template_string)
+    code = bucket.code
+    if code is None:
+        code = env.compile(template_string)
+        bucket.code = code
+        bytecode_cache.set_bucket(bucket)
+    return env.template_class.from_code(env, code, env.make_globals(None))
+
+def get_template(template_string: str) -> jinja2.Template:
+    """
+    Get the compiled template of a template string.
+    
+    Args:
+        template_string: Template source
         
     Returns:
-        Rendered string
+        Compiled template, shared with other callers rendering the same source
         
     Raises:
-        TemplateProcessingError: If there is an error processing the template
+        jinja2.exceptions.TemplateError: If the template cannot be compiled
     """
+    env = _get_environment()
+    key = hashlib.blake2b(template_string.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+    with _template_cache_lock:
+        template = _template_cache.get(key)
+        if template is not None and template.environment is env:
+            _template_cache.move_to_end(key)
+            return template
+    
+    # Compile outside the lock; concurrent misses of one source compile it twice at worst
+    template = _compile_template(env, key, template_string)
+    with _template_cache_lock:
+        if TEMPLATE_CACHE_MAX_ENTRIES > 0 and env is _environment:
+            _template_cache[key] = template
+            _template_cache.move_to_end(key)
+            while len(_template_cache) > TEMPLATE_CACHE_MAX_ENTRIES:
+                _template_cache.popitem(last=False)
+    return template
+
+def _render(template: jinja2.Template, values: Dict[str, Any]) -> str:
     try:
-        # Create a Jinja2 environment with safe defaults
-        env = jinja2.Environment(
-            loader=jinja2.BaseLoader(),
-            autoescape=True,
-            undefined=jinja2.StrictUndefined
-        )
-        
-        # Create and render the template
-        template = env.from_string(template_string)
         return template.render(**values)
     except jinja2.exceptions.TemplateError as e:
         logger.error(f"Template processing error: {str(e)}")
@@ -46,65 +134,308 @@ def render_template_string(template_string: str, values: Dict[str, Any]) -> str:
         logger.error(f"Unexpected error: {str(e)}")
         raise TemplateProcessingError(f"Unexpected error: {str(e)}")
 
-def process_template_files(source_dir: str, target_dir: str, values: Dict[str, Any]) -> None:
+def _compile(template_string: str) -> jinja2.Template:
+    try:
+        return get_template(template_string)
+    except jinja2.exceptions.TemplateError as e:
+        logger.error(f"Template processing error: {str(e)}")
+        raise TemplateProcessingError(f"Failed to render template: {str(e)}")
+    except Exception as e:
+        logger.error(f"Unexpected error: {str(e)}")
+        raise TemplateProcessingError(f"Unexpected error: {str(e)}")
+
+def render_template_string(template_string: str, values: Dict[str, Any]) -> str:
     """
-    Process template files from source directory to target directory.
+    Render a template string with the provided values.
     
     Args:
-        source_dir: Source directory containing template files
-        target_dir: Target directory to write processed files
-        values: Values to use for rendering templates
+        template_string: Template string to render
+        values: Values to use for rendering
+        
+    Returns:
+        Rendered string
         
     Raises:
-        TemplateProcessingError: If there is an error processing the templates
+        TemplateProcessingError: If there is an error processing the template
     """
-    try:
-        logger.info(f"Processing templates from {source_dir} to {target_dir}")
+    # Get the compiled template and render it
+    return _render(_compile(template_string), values)
+
+class RenderPlanFile:
+    """A skeleton file of a render plan."""
+    
+    __slots__ = ("source", "target_dir", "name", "name_template", "template")
+    
+    def __init__(
+        self,
+        source: str,
+        target_dir: str,
+        name: str,
+        name_template: Optional[jinja2.Template],
+        template: Optional[jinja2.Template]
+    ):
+        """
+        Initialize a plan file.
+        
+        Args:
+            source: Path of the file relative to the skeleton directory
+            target_dir: Directory of the target file relative to the target directory
+            name: File name, used as is when name_template is None
+            name_template: Compiled template of the file name, if it contains template variables
+            template: Compiled file content for template files, None for files copied verbatim
+        """
+        self.source = source
+        self.target_dir = target_dir
+        self.name = name
+        self.name_template = name_template
+        self.template = template
+
+class RenderPlan:
+    """
+    Precompiled rendering of a skeleton directory.
+    
+    The plan is an ordered manifest of the directories to create and the files
+    to copy or render, with file names and contents already compiled, so that
+    executing it does not walk, classify or compile the skeleton again. The
+    plan records the mtimes of the skeleton directories and files it was
+    compiled from, to tell whether it is still current.
+    """
+    
+    def __init__(
+        self,
+        source_dir: str,
+        directories: List[str],
+        files: List[RenderPlanFile],
+        dir_mtimes: Dict[str, int],
+        file_stats: Dict[str, Tuple[int, int]]
+    ):
+        """
+        Initialize a render plan.
+        
+        Args:
+            source_dir: Skeleton directory
+            directories: Directories to create, relative to the target directory, parents first
+            files: Files to copy or render, in walk order
+            dir_mtimes: st_mtime_ns of the skeleton directories
+            file_stats: (st_mtime_ns, st_size) of the skeleton files
+        """
+        self.source_dir = source_dir
+        self.directories = directories
+        self.files = files
+        self.dir_mtimes = dir_mtimes
+        self.file_stats = file_stats
+    
+    def is_current(self) -> bool:
+        """
+        Check whether the skeleton is unchanged since the plan was compiled.
         
-        # Ensure target directory exists
+        Returns:
+            True if no skeleton directory or file was added, removed or modified
+        """
+        try:
+            for dirpath, mtime_ns in self.dir_mtimes.items():
+                if os.stat(dirpath).st_mtime_ns != mtime_ns:
+                    return False
+            for path, file_stat in self.file_stats.items():
+                st = os.stat(path)
+                if (st.st_mtime_ns, st.st_size) != file_stat:
+                    return False
+        except OSError:
+            return False
+        return True
+    
+    def execute(
+        self,
+        target_dir: str,
+        values: Dict[str, Any],
+        executor: Optional[Executor] = None,
+        hardlink: bool = False
+    ) -> None:
+        """
+        Render the skeleton into a target directory.
+        
+        Directories are always created first. Files are then copied and
+        rendered one after another, or concurrently on the executor if given,
+        in which case every file is attempted and all failures are reported
+        together.
+        
+        Args:
+            target_dir: Target directory to write processed files
+            values: Values to use for rendering templates
+            executor: Thread pool to process files on
+            hardlink: Hard link files copied verbatim to the skeleton when reflinks are unsupported
+            
+        Raises:
+            TemplateProcessingError: If there is an error processing the templates
+        """
         os.makedirs(target_dir, exist_ok=True)
+        for directory in self.directories:
+            os.makedirs(os.path.join(target_dir, directory), exist_ok=True)
         
-        # Process all files and directories
-        for root, dirs, files in os.walk(source_dir):
-            # Create relative path for target
-            rel_path = os.path.relpath(root, source_dir)
-            target_path = os.path.join(target_dir, rel_path) if rel_path != '.' else target_dir
+        if executor is None or len(self.files) < 2:
+            for plan_file in self.files:
+                self._process_file(plan_file, target_dir, values, hardlink)
+            return
+        
+        futures = [
+            executor.submit(self._process_file, plan_file, target_dir, values, hardlink)
+            for plan_file in self.files
+        ]
+        errors = []
+        for plan_file, future in zip(self.files, futures):
+            error = future.exception()
+            if error is not None:
+                errors.append(f"{plan_file.source}: {str(error)}")
+        if errors:
+            shown = "; ".join(errors[:RENDER_ERRORS_SHOWN])
+            if len(errors) > RENDER_ERRORS_SHOWN:
+                shown += f"; and {len(errors) - RENDER_ERRORS_SHOWN} more"
+            raise TemplateProcessingError(
+                f"Failed to process {len(errors)} of {len(self.files)} template files: {shown}"
+            )
+    
+    def iter_members(self, values: Dict[str, Any]) -> Iterator[Tuple[str, Optional[bytes], Optional[str]]]:
+        """
+        Render the skeleton file by file, without writing it anywhere.
+        
+        Args:
+            values: Values to use for rendering templates
             
-            # Create target directory if it doesn't exist
-            os.makedirs(target_path, exist_ok=True)
+        Returns:
+            Iterator over (target path relative to the target directory, rendered
+            UTF-8 content, source file) tuples; files copied verbatim have no
+            content and template files no source
+            
+        Raises:
+            TemplateProcessingError: If there is an error rendering a template
+        """
+        for plan_file in self.files:
+            target_file = self._target_file(plan_file, values)
+            if plan_file.template is not None:
+                yield target_file, _render(plan_file.template, values).encode('utf-8'), None
+            else:
+                yield target_file, None, os.path.join(self.source_dir, plan_file.source)
+    
+    def _target_file(self, plan_file: RenderPlanFile, values: Dict[str, Any]) -> str:
+        # Determine target file name (may contain template variables)
+        target_file_name = plan_file.name
+        if plan_file.name_template is not None:
+            target_file_name = _render(plan_file.name_template, values)
+        target_file = os.path.join(plan_file.target_dir, target_file_name)
+        
+        # Strip template extension if present
+        if plan_file.template is not None:
+            for ext in TEMPLATE_EXTENSIONS:
+                if target_file.endswith(ext):
+                    target_file = target_file[:-len(ext)]
+                    break
+        return target_file
+    
+    def _process_file(
+        self,
+        plan_file: RenderPlanFile,
+        target_dir: str,
+        values: Dict[str, Any],
+        hardlink: bool
+    ) -> None:
+        target_file = os.path.join(target_dir, self._target_file(plan_file, values))
+        
+        if plan_file.template is not None:
+            # Template file - render it
+            rendered_content = _render(plan_file.template, values)
+            
+            # Write rendered content
+            with open(target_file, 'w') as f:
+                f.write(rendered_content)
+        else:
+            # Regular file - copy it (reflinked or copied in-kernel where supported)
+            copy_file(os.path.join(self.source_dir, plan_file.source), target_file, hardlink=hardlink)
+
+def compile_render_plan(source_dir: str) -> RenderPlan:
+    """
+    Compile the render plan of a skeleton directory.
+    
+    Args:
+        source_dir: Source directory containing template files
+        
+    Returns:
+        Render plan
+        
+    Raises:
+        TemplateProcessingError: If the skeleton cannot be read or a template cannot be compiled
+    """
+    try:
+        directories: List[str] = []
+        files: List[RenderPlanFile] = []
+        dir_mtimes: Dict[str, int] = {}
+        file_stats: Dict[str, Tuple[int, int]] = {}
+        
+        for root, dirs, filenames in os.walk(source_dir):
+            dir_mtimes[root] = os.stat(root).st_mtime_ns
+            rel_path = os.path.relpath(root, source_dir)
+            target_rel = rel_path if rel_path != '.' else ''
+            if target_rel:
+                directories.append(target_rel)
             
-            # Process files
-            for file in files:
+            for file in filenames:
                 source_file = os.path.join(root, file)
+                st = os.stat(source_file)
+                file_stats[source_file] = (st.st_mtime_ns, st.st_size)
                 
-                # Determine target file name (may contain template variables)
-                target_file_name = file
+                name_template = None
                 if '{' in file and '}' in file:
-                    target_file_name = render_template_string(file, values)
-                
-                target_file = os.path.join(target_path, target_file_name)
+                    name_template = _compile(file)
                 
-                # Process file contents
-                if file.endswith(('.j2', '.jinja', '.jinja2', '.tmpl')):
-                    # Template file - render it
+                template = None
+                if file.endswith(TEMPLATE_EXTENSIONS):
                     with open(source_file, 'r') as f:
-                        template_content = f.read()
-                    
-                    rendered_content = render_template_string(template_content, values)
-                    
-                    # Strip template extension if present
-                    for ext in ['.j2', '.jinja', '.jinja2', '.tmpl']:
-                        if target_file.endswith(ext):
-                            target_file = target_file[:-len(ext)]
-                            break
-                    
-                    # Write rendered content
-                    with open(target_file, 'w') as f:
-                        f.write(rendered_content)
-                else:
-                    # Regular file - copy it
-                    shutil.copy2(source_file, target_file)
-                    
+                        template = _compile(f.read())
+                
+                files.append(RenderPlanFile(
+                    source=os.path.join(target_rel, file),
+                    target_dir=target_rel,
+                    name=file,
+                    name_template=name_template,
+                    template=template
+                ))
+        
+        return RenderPlan(source_dir, directories, files, dir_mtimes, file_stats)
+        
+    except TemplateProcessingError:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to compile render plan: {str(e)}")
+        raise TemplateProcessingError(f"Failed to process templates: {str(e)}")
+
+def process_template_files(
+    source_dir: str,
+    target_dir: str,
+    values: Dict[str, Any],
+    plan: Optional[RenderPlan] = None,
+    executor: Optional[Executor] = None,
+    hardlink: bool = False
+) -> None:
+    """
+    Process template files from source directory to target directory.
+    
+    Args:
+        source_dir: Source directory containing template files
+        target_dir: Target directory to write processed files
+        values: Values to use for rendering templates
+        plan: Precompiled render plan of source_dir (compiled on the fly if not provided)
+        executor: Thread pool to copy and render files on concurrently (sequential if not provided)
+        hardlink: Allow hard linking non-template files to the skeleton instead of copying them
+        
+    Raises:
+        TemplateProcessingError: If there is an error processing the templates
+    """
+    try:
+        logger.info(f"Processing templates from {source_dir} to {target_dir}")
+        
+        if plan is None:
+            plan = compile_render_plan(source_dir)
+        plan.execute(target_dir, values, executor, hardlink)
+        
         logger.info(f"Template processing complete")
         
     except TemplateProcessingError:
@@ -0,0 +1,172 @@
+"""
+Shared fixtures for the template plugin tests.
+"""
+
+import base64
+import hashlib
+import json
+import os
+import sys
+from typing import Any, Dict, List
+from urllib.parse import parse_qs, urlsplit
+
+import httpx
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from template_plugin.clients.backstage import BackstageClient
+from template_plugin.config.config import BackstageClientConfig
+
+
+def make_entity(name: str, tags: List[str], owner: str = "team-a", template_type: str = "service") -> Dict[str, Any]:
+    return {
+        "apiVersion": "scaffolder.backstage.io/v1beta3",
+        "kind": "Template",
+        "metadata": {"name": name, "namespace": "default", "description": f"{name} template", "tags": tags},
+        "spec": {"title": name.title(), "owner": owner, "type": template_type, "parameters": []}
+    }
+
+
+class FakeCatalog:
+    """
+    In-memory Backstage catalog answering /catalog/entities/by-query and
+    /catalog/entities/by-refs.
+
+    Filters follow Backstage: conditions on different keys in one filter are
+    ANDed, repeated keys in one filter and separate filter parameters are ORed.
+    Entities carry an etag derived from their content, so editing an entity
+    changes its etag.
+    """
+
+    def __init__(self, entities: List[Dict[str, Any]]):
+        self.entities = entities
+        self.requests: List[Dict[str, List[str]]] = []
+        self.ref_requests: List[List[str]] = []
+
+    @staticmethod
+    def _with_etag(entity: Dict[str, Any]) -> Dict[str, Any]:
+        etag = hashlib.sha1(json.dumps(entity, sort_keys=True).encode()).hexdigest()
+        return dict(entity, metadata=dict(entity["metadata"], etag=etag))
+
+    def _by_refs(self, request: httpx.Request) -> httpx.Response:
+        refs = json.loads(request.content)["entityRefs"]
+        self.ref_requests.append(refs)
+        entities = {
+            f"template:{entity['metadata']['namespace']}/{entity['metadata']['name']}": entity
+            for entity in self.entities
+        }
+        items = [self._with_etag(entities[ref]) if ref in entities else None for ref in refs]
+        return httpx.Response(200, json={"items": items})
+
+    @staticmethod
+    def _value(entity: Dict[str, Any], key: str) -> List[str]:
+        value: Any = entity
+        for part in key.split("."):
+            value = value.get(part) if isinstance(value, dict) else None
+        if value is None:
+            return []
+        return [str(v) for v in value] if isinstance(value, list) else [str(value)]
+
+    def _matches(self, entity: Dict[str, Any], filters: List[str]) -> bool:
+        if not filters:
+            return True
+        for expression in filters:
+            conditions: Dict[str, List[str]] = {}
+            for condition in expression.split(","):
+                key, _, value = condition.partition("=")
+                conditions.setdefault(key, []).append(value)
+            if all(set(values) & set(self._value(entity, key)) for key, values in conditions.items()):
+                return True
+        return False
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        if request.method == "POST" and request.url.path.endswith("/catalog/entities/by-refs"):
+            return self._by_refs(request)
+        query = parse_qs(urlsplit(str(request.url)).query)
+        self.requests.append(query)
+        if not request.url.path.endswith("/catalog/entities/by-query"):
+            return httpx.Response(404, json={"error": "not found"})
+
+        if "cursor" in query:
+            state = json.loads(base64.b64decode(query["cursor"][0]))
+        else:
+            state = {"filter": query.get("filter", []), "order": query.get("orderField", [None])[0], "offset": int(query.get("offset", ["0"])[0])}
+        items = [entity for entity in self.entities if self._matches(entity, state["filter"])]
+        if state["order"]:
+            field, _, direction = state["order"].partition(",")
+            items.sort(key=lambda entity: self._value(entity, field) or [""], reverse=direction == "desc")
+        limit = int(query.get("limit", ["100"])[0])
+        start = state["offset"]
+        page = [self._with_etag(entity) for entity in items[start:start + limit]]
+        page_info = {}
+        if start + limit < len(items):
+            page_info["nextCursor"] = base64.b64encode(json.dumps(dict(state, offset=start + limit)).encode()).decode()
+        return httpx.Response(200, json={"items": page, "totalItems": len(items), "pageInfo": page_info})
+
+
+@pytest.fixture
+def catalog() -> FakeCatalog:
+    return FakeCatalog([
+        make_entity("app-aws", ["aws", "terraform"]),
+        make_entity("app-gcp", ["gcp", "terraform"]),
+        make_entity("db-aws", ["aws", "database"], owner="team-b"),
+        make_entity("db-aws-tf", ["aws", "database", "terraform"], owner="team-b"),
+        make_entity("docs", ["docs"], template_type="website")
+    ])
+
+
+@pytest.fixture
+def backstage_client(catalog: FakeCatalog):
+    client = BackstageClient(BackstageClientConfig(base_url="http://backstage.test/api", cache_enabled=False))
+    client._client = httpx.Client(base_url=client.base_url, transport=httpx.MockTransport(catalog.handle))
+    yield client
+    client.close()
+
+
+TEMPLATE_YAML = """apiVersion: scaffolder.backstage.io/v1beta3
+kind: Template
+metadata:
+  name: {name}
+  title: {title}
+  description: {name} template
+  tags: [{tags}]
+spec:
+  owner: {owner}
+  type: service
+  parameters:
+    - title: Settings
+      required: [name]
+      properties:
+        name:
+          type: string
+"""
+
+
+def write_template(templates_dir: str, name: str, tags: List[str], owner: str = "team-a", title: str = "") -> str:
+    template_dir = os.path.join(templates_dir, name)
+    os.makedirs(os.path.join(template_dir, "skeleton"), exist_ok=True)
+    path = os.path.join(template_dir, "template.yaml")
+    with open(path, "w") as f:
+        f.write(TEMPLATE_YAML.format(name=name, title=title or name.title(), tags=", ".join(tags), owner=owner))
+    return path
+
+
+@pytest.fixture
+def templates_dir(tmp_path) -> str:
+    root = str(tmp_path / "templates")
+    for i in range(12):
+        write_template(root, f"tpl-{i:02d}", ["aws" if i % 2 else "gcp", "terraform"], owner=f"team-{i % 3}")
+    return root
+
+
+@pytest.fixture
+def local_config(tmp_path, templates_dir):
+    from template_plugin.config.config import LocalClientConfig
+
+    return LocalClientConfig(
+        templates_dir=templates_dir,
+        catalog_file=str(tmp_path / "catalog-info.yaml"),
+        output_dir=str(tmp_path / "output"),
+        index_revalidate_interval=0
+    )
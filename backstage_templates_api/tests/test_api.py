@@ -0,0 +1,95 @@
+"""
+Tests for the API routes.
+"""
+
+import os
+import tempfile
+
+import pytest
+from fastapi.testclient import TestClient
+
+os.environ.setdefault("LOCAL_TEMPLATES_DIR", tempfile.mkdtemp(prefix="templates-"))
+
+import main
+from model import MAX_BATCH_NAMES
+from template_plugin.errors.exceptions import CircuitOpenError, ConnectionError
+
+
+class _UnavailablePlugin:
+    """Plugin whose template source is failing."""
+
+    def __init__(self, error: Exception):
+        self.error = error
+
+    async def alist_templates(self, **kwargs):
+        raise self.error
+
+    async def aget_template(self, **kwargs):
+        raise self.error
+
+    async def aget_template_parameters(self, **kwargs):
+        raise self.error
+
+
+@pytest.fixture
+def api():
+    client = TestClient(main.app)
+    yield client
+    main.app.dependency_overrides.clear()
+
+
+@pytest.mark.parametrize("error", [CircuitOpenError("circuit open"), ConnectionError("connection refused")])
+@pytest.mark.parametrize("path", ["/templates", "/templates/app", "/templates/app/parameters"])
+def test_unavailable_source_returns_503(api, error, path):
+    main.app.dependency_overrides[main.get_template_plugin] = lambda: _UnavailablePlugin(error)
+
+    response = api.get(path)
+
+    assert response.status_code == 503
+
+
+class _ArchivePlugin:
+    """Plugin rendering every template into a fixed archive."""
+
+    async def arender_template_archive(self, **kwargs):
+        return iter([b"archive"])
+
+
+def test_archive_filename_is_escaped(api):
+    main.app.dependency_overrides[main.get_template_plugin] = lambda: _ArchivePlugin()
+
+    response = api.post(
+        "/templates/a%22b%3Bc%0D%0Aé/archive", params={"format": "tar.gz"}, json={"template_name": "x", "parameters": {}}
+    )
+
+    assert response.status_code == 200
+    assert response.content == b"archive"
+    assert response.headers["content-disposition"] == (
+        "attachment; filename=\"a_b_c___.tar.gz\"; filename*=UTF-8''a%22b%3Bc%0D%0A%C3%A9.tar.gz"
+    )
+
+
+class _BatchPlugin:
+    """Plugin returning every requested template as missing."""
+
+    async def aget_templates(self, template_names, **kwargs):
+        return {"items": [], "total_count": 0, "not_found": list(template_names)}
+
+
+@pytest.mark.parametrize("count", [0, MAX_BATCH_NAMES + 1])
+def test_batch_rejects_out_of_bounds_names(api, count):
+    main.app.dependency_overrides[main.get_template_plugin] = lambda: _BatchPlugin()
+
+    response = api.post("/templates/batch", json={"names": [f"t{i}" for i in range(count)]})
+
+    assert response.status_code == 422
+
+
+def test_batch_accepts_up_to_the_limit(api):
+    main.app.dependency_overrides[main.get_template_plugin] = lambda: _BatchPlugin()
+    names = [f"t{i}" for i in range(MAX_BATCH_NAMES)]
+
+    response = api.post("/templates/batch", json={"names": names})
+
+    assert response.status_code == 200
+    assert response.json()["not_found"] == names
@@ -0,0 +1,69 @@
+"""
+Tests for the streaming archive writers.
+"""
+
+import io
+import os
+import tarfile
+import zipfile
+
+import pytest
+
+from template_plugin.errors.exceptions import TemplateValidationError
+from template_plugin.utils.archive_utils import ARCHIVE_CHUNK_SIZE, content_disposition, stream_archive
+
+
+@pytest.fixture
+def members(tmp_path):
+    # Larger than a chunk, so the copied file is streamed in several pieces
+    binary = os.urandom(ARCHIVE_CHUNK_SIZE * 2 + 123)
+    source = tmp_path / "logo.bin"
+    source.write_bytes(binary)
+    os.chmod(source, 0o755)
+    return [
+        ("README.md", b"# my-app\n", None),
+        (os.path.join("src", "logo.bin"), None, str(source))
+    ], binary
+
+
+def test_zip_archive_is_valid(members):
+    entries, binary = members
+    data = b"".join(stream_archive(["src", "empty"], iter(entries), "zip"))
+
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        assert archive.testzip() is None
+        assert archive.namelist() == ["src/", "empty/", "README.md", "src/logo.bin"]
+        assert archive.read("README.md") == b"# my-app\n"
+        assert archive.read("src/logo.bin") == binary
+        assert archive.getinfo("empty/").is_dir()
+
+
+@pytest.mark.parametrize("archive_format,mode", [("tar", "r:"), ("tar.gz", "r:gz")])
+def test_tar_archive_is_valid(members, archive_format, mode):
+    entries, binary = members
+    data = b"".join(stream_archive(["src", "empty"], iter(entries), archive_format))
+
+    assert archive_format == "tar.gz" or len(data) % tarfile.RECORDSIZE == 0
+    with tarfile.open(fileobj=io.BytesIO(data), mode=mode) as archive:
+        assert archive.getnames() == ["src", "empty", "README.md", "src/logo.bin"]
+        assert archive.getmember("empty").isdir()
+        assert archive.extractfile("README.md").read() == b"# my-app\n"
+        logo = archive.getmember("src/logo.bin")
+        assert logo.mode == 0o755
+        assert archive.extractfile(logo).read() == binary
+
+
+def test_unsupported_archive_format():
+    with pytest.raises(TemplateValidationError):
+        stream_archive([], iter([]), "rar")
+
+
+def test_content_disposition_escapes_the_filename():
+    assert content_disposition("app.zip") == "attachment; filename=\"app.zip\"; filename*=UTF-8''app.zip"
+
+    value = content_disposition('a"b;c\r\nd/é.zip')
+    assert "\r" not in value and "\n" not in value
+    assert value == (
+        "attachment; filename=\"a_b_c__d__.zip\"; "
+        "filename*=UTF-8''a%22b%3Bc%0D%0Ad%2F%C3%A9.zip"
+    )
@@ -0,0 +1,139 @@
+"""
+Tests for the Backstage response cache.
+"""
+
+import time
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+
+from conftest import make_entity
+
+from template_plugin.clients.backstage import BackstageClient
+from template_plugin.clients.backstage import cache as cache_module
+from template_plugin.clients.backstage import client as client_module
+from template_plugin.config.config import BackstageClientConfig
+from template_plugin.errors.exceptions import TemplateNotFoundError
+
+ENTITY_PATH = "/api/catalog/entities/by-name/template/default/app"
+SCHEMA_PATH = "/api/scaffolder/v2/templates/default/template/app"
+
+
+class FakeBackstage:
+    """Serves versioned entities with ETags, answering If-None-Match with 304."""
+
+    def __init__(self):
+        self.bodies: Dict[str, Any] = {}
+        self.versions: Dict[str, int] = {}
+        self.requests: List[httpx.Request] = []
+
+    def set(self, path: str, body: Any) -> None:
+        self.bodies[path] = body
+        self.versions[path] = self.versions.get(path, 0) + 1
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        path = request.url.path
+        if path not in self.bodies:
+            return httpx.Response(404, json={"error": "not found"})
+        etag = f'"v{self.versions[path]}"'
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers={"ETag": etag})
+        return httpx.Response(200, json=self.bodies[path], headers={"ETag": etag})
+
+    def count(self, path: str) -> int:
+        return sum(1 for request in self.requests if request.url.path == path)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [time.monotonic()]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(client_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def backstage():
+    fake = FakeBackstage()
+    fake.set(ENTITY_PATH, make_entity("app", ["aws"]))
+    return fake
+
+
+def _client(backstage: FakeBackstage, **config) -> BackstageClient:
+    settings = dict(
+        base_url="http://backstage.test/api",
+        cache_ttl={"get_template": 10, "get_template_parameters": 10},
+        cache_stale_ttl=0,
+        cache_negative_ttl=5
+    )
+    settings.update(config)
+    client = BackstageClient(BackstageClientConfig(**settings))
+    client._client = httpx.Client(base_url=client.base_url, transport=httpx.MockTransport(backstage.handle))
+    return client
+
+
+def test_fresh_entries_are_served_from_the_cache(backstage, clock):
+    client = _client(backstage)
+
+    client.get_template("app")
+    clock[0] += 9
+    client.get_template("app")
+
+    assert backstage.count(ENTITY_PATH) == 1
+
+
+def test_expired_entries_are_revalidated_with_their_etag(backstage, clock):
+    client = _client(backstage)
+    client.get_template("app")
+
+    clock[0] += 11
+    assert client.get_template("app")["metadata"]["name"] == "app"
+    assert backstage.requests[-1].headers["If-None-Match"] == '"v1"'
+    # The 304 made the entry fresh again
+    client.get_template("app")
+    assert backstage.count(ENTITY_PATH) == 2
+
+    backstage.set(ENTITY_PATH, make_entity("app", ["gcp"]))
+    clock[0] += 11
+    assert client.get_template("app")["metadata"]["tags"] == ["gcp"]
+
+
+def test_stale_entries_are_served_while_refreshed(backstage, clock):
+    client = _client(backstage, cache_stale_ttl=60)
+    client.get_template("app")
+    backstage.set(ENTITY_PATH, make_entity("app", ["gcp"]))
+
+    clock[0] += 11
+    assert client.get_template("app")["metadata"]["tags"] == ["aws"]
+    client._refresh_executor.shutdown(wait=True)
+
+    assert client.get_template("app")["metadata"]["tags"] == ["gcp"]
+    assert backstage.count(ENTITY_PATH) == 2
+
+
+def test_not_found_is_cached_until_negative_ttl(backstage, clock):
+    client = _client(backstage)
+
+    for _ in range(2):
+        with pytest.raises(TemplateNotFoundError):
+            client.get_template("missing")
+    assert len(backstage.requests) == 1
+
+    backstage.set(ENTITY_PATH.replace("/app", "/missing"), make_entity("missing", []))
+    clock[0] += 5
+    assert client.get_template("missing")["metadata"]["name"] == "missing"
+    assert len(backstage.requests) == 2
+
+
+def test_cached_values_are_copied(backstage, clock):
+    backstage.set(SCHEMA_PATH, {"title": "App", "steps": [{"id": "fetch"}]})
+    client = _client(backstage)
+
+    schema = client.get_template_parameters("app")
+    schema["steps"].append({"id": "injected"})
+    schema["title"] = "changed"
+
+    assert client.get_template_parameters("app") == {"title": "App", "steps": [{"id": "fetch"}]}
+    assert backstage.count(SCHEMA_PATH) == 1
@@ -0,0 +1,303 @@
+"""
+Tests for the Backstage template client.
+"""
+
+import asyncio
+from typing import List, Optional
+
+import httpx
+import pytest
+
+from template_plugin.clients.backstage import BackstageClient
+from template_plugin.clients.backstage import client as client_module
+from template_plugin.config.config import BackstageClientConfig
+from template_plugin.errors.exceptions import CircuitOpenError, ConnectionError, TemplateValidationError
+from template_plugin.utils.retry_utils import CircuitBreaker
+from template_plugin.utils.pagination_utils import encode_cursor
+
+
+def _names(result) -> List[str]:
+    return sorted(template["metadata"]["name"] for template in result["items"])
+
+
+def test_list_templates_requires_all_tags(backstage_client):
+    result = backstage_client.list_templates(tags=["aws", "terraform"])
+
+    assert _names(result) == ["app-aws", "db-aws-tf"]
+    assert result["total_count"] == 2
+
+
+def test_list_templates_requires_cloud_provider_and_tags(backstage_client):
+    result = backstage_client.list_templates(cloud_provider="aws", tags=["database"])
+
+    assert _names(result) == ["db-aws", "db-aws-tf"]
+    assert result["total_count"] == 2
+
+
+def test_list_templates_sends_a_single_tag_condition(backstage_client, catalog):
+    backstage_client.list_templates(cloud_provider="aws", tags=["database", "terraform"], owner="team-b")
+
+    filters = catalog.requests[0]["filter"]
+    assert len(filters) == 1
+    assert filters[0].count("metadata.tags=") == 1
+    assert "spec.owner=team-b" in filters[0]
+
+
+def _all_pages(client, **kwargs) -> List[List[str]]:
+    pages = []
+    cursor: Optional[str] = None
+    while True:
+        result = client.list_templates(cursor=cursor, **kwargs)
+        pages.append([template["metadata"]["name"] for template in result["items"]])
+        cursor = result["next_cursor"]
+        if cursor is None:
+            return pages
+
+
+def test_catalog_cursor_round_trip(backstage_client):
+    pages = _all_pages(backstage_client, limit=2, sort="-name")
+
+    assert pages == [["docs", "db-aws-tf"], ["db-aws", "app-gcp"], ["app-aws"]]
+    assert backstage_client.list_templates(limit=2, sort="-name")["total_count"] == 5
+
+
+def test_catalog_pages_are_filled_after_local_filters(backstage_client):
+    # Only one tag is pushed down, so the catalog returns every aws template
+    pages = _all_pages(backstage_client, limit=1, tags=["aws", "terraform"])
+
+    assert pages == [["app-aws"], ["db-aws-tf"]]
+    assert backstage_client.list_templates(limit=1, tags=["aws", "terraform"])["total_count"] is None
+    # Counted once a page holds every match
+    assert backstage_client.list_templates(limit=5, tags=["aws", "terraform"])["total_count"] == 2
+
+
+def test_async_catalog_pages_match_sync(backstage_client, catalog):
+    async def collect() -> List[List[str]]:
+        backstage_client._async_client = httpx.AsyncClient(
+            base_url=backstage_client.base_url, transport=httpx.MockTransport(catalog.handle)
+        )
+        pages = []
+        cursor = None
+        try:
+            everything = await backstage_client.alist_templates(offset=1, sort="name")
+            pages.append([template["metadata"]["name"] for template in everything["items"]])
+            while True:
+                result = await backstage_client.alist_templates(limit=1, tags=["aws", "terraform"], cursor=cursor)
+                pages.append([template["metadata"]["name"] for template in result["items"]])
+                cursor = result["next_cursor"]
+                if cursor is None:
+                    return pages
+        finally:
+            await backstage_client.aclose()
+
+    assert asyncio.run(collect()) == [["app-gcp", "db-aws", "db-aws-tf", "docs"], ["app-aws"], ["db-aws-tf"]]
+
+
+def test_listing_without_limit_returns_everything(backstage_client, catalog):
+    backstage_client.config.catalog_page_size = 2
+
+    result = backstage_client.list_templates()
+    assert [template["metadata"]["name"] for template in result["items"]] == [
+        "app-aws", "app-gcp", "db-aws", "db-aws-tf", "docs"
+    ]
+    assert result["total_count"] == 5
+    assert result["next_cursor"] is None
+    # Streamed from catalog pages of catalog_page_size
+    assert len(catalog.requests) == 3
+
+    result = backstage_client.list_templates(offset=1, sort="-name")
+    assert [template["metadata"]["name"] for template in result["items"]] == ["db-aws-tf", "db-aws", "app-gcp", "app-aws"]
+    assert result["total_count"] == 5
+
+    result = backstage_client.list_templates(offset=3, tags=["aws"])
+    assert [template["metadata"]["name"] for template in result["items"]] == []
+    assert result["total_count"] == 3
+
+
+def test_zero_limit_is_not_a_missing_limit(backstage_client):
+    result = backstage_client.list_templates(limit=0)
+
+    assert result["items"] == []
+    assert result["next_cursor"] is not None
+
+
+def test_cursors_are_served_by_the_path_that_produced_them(backstage_client):
+    listing_cursor = encode_cursor({"origin": "listing", "sort": None, "offset": 3})
+    result = backstage_client.list_templates(limit=1, cursor=listing_cursor)
+    assert [template["metadata"]["name"] for template in result["items"]] == ["db-aws-tf"]
+    assert result["next_cursor"] is not None
+
+    catalog_cursor = backstage_client.list_templates(limit=2, sort="name")["next_cursor"]
+    with pytest.raises(TemplateValidationError):
+        backstage_client.list_templates(limit=2, sort="-name", cursor=catalog_cursor)
+    with pytest.raises(TemplateValidationError):
+        backstage_client.list_templates(limit=2, cursor=encode_cursor({"sort": None, "offset": 2}))
+
+
+def _unreachable_client(**config):
+    def refuse(request):
+        raise httpx.ConnectError("connection refused", request=request)
+
+    client = BackstageClient(BackstageClientConfig(
+        base_url="http://backstage.test/api", cache_enabled=False, MAX_RETRIES=0, **config
+    ))
+    client._client = httpx.Client(base_url=client.base_url, transport=httpx.MockTransport(refuse))
+    return client
+
+
+def test_connection_errors_are_not_rewrapped():
+    client = _unreachable_client(circuit_breaker_threshold=1)
+    try:
+        with pytest.raises(ConnectionError):
+            client.list_templates()
+        # Breakers are per endpoint, so the same listing now fails fast
+        with pytest.raises(CircuitOpenError):
+            client.list_templates()
+        with pytest.raises(ConnectionError):
+            client.get_template("app-aws")
+        with pytest.raises(CircuitOpenError):
+            client.get_template("app-aws")
+    finally:
+        client.close()
+
+
+def _scripted_client(replies, **config):
+    """Client whose transport answers with replies in order: responses, or exceptions raised."""
+    requests = []
+
+    def handle(request):
+        requests.append(request)
+        reply = replies.pop(0)
+        if isinstance(reply, type) and issubclass(reply, Exception):
+            raise reply("scripted failure", request=request)
+        return reply
+
+    settings = dict(base_url="http://backstage.test/api", cache_enabled=False, MAX_RETRIES=2)
+    settings.update(config)
+    client = BackstageClient(BackstageClientConfig(**settings))
+    client._client = httpx.Client(base_url=client.base_url, transport=httpx.MockTransport(handle))
+    return client, requests
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    delays = []
+    monkeypatch.setattr(client_module.time, "sleep", delays.append)
+    return delays
+
+
+def test_transient_failures_are_retried(sleeps):
+    client, requests = _scripted_client([
+        httpx.ConnectError, httpx.Response(503), httpx.Response(200, json={"ok": True})
+    ], retry_backoff_base=0.1)
+
+    response = client._send("GET", "/catalog/entities")
+
+    assert response.status_code == 200
+    assert len(requests) == 3
+    assert len(sleeps) == 2 and all(0 <= delay <= 0.2 for delay in sleeps)
+
+
+def test_retries_stop_at_max_retries(sleeps):
+    client, requests = _scripted_client([httpx.Response(502)] * 3, MAX_RETRIES=2)
+
+    assert client._send("GET", "/catalog/entities").status_code == 502
+    assert len(requests) == 3
+
+
+def test_retry_after_is_honored(sleeps):
+    client, requests = _scripted_client([
+        httpx.Response(429, headers={"Retry-After": "2"}), httpx.Response(200, json={})
+    ], retry_backoff_max=5.0)
+
+    assert client._send("GET", "/catalog/entities").status_code == 200
+    assert sleeps == [2.0]
+
+
+def test_retry_after_beyond_backoff_max_is_not_waited_for(sleeps):
+    client, requests = _scripted_client([
+        httpx.Response(503, headers={"Retry-After": "60"}), httpx.Response(200, json={})
+    ], retry_backoff_max=5.0)
+
+    assert client._send("GET", "/catalog/entities").status_code == 503
+    assert len(requests) == 1
+    assert sleeps == []
+
+
+def test_non_idempotent_requests_are_not_retried(sleeps):
+    client, requests = _scripted_client([httpx.Response(503), httpx.Response(201, json={})])
+    assert client._send("POST", "/scaffolder/v2/tasks", json_data={}).status_code == 503
+    assert len(requests) == 1
+
+    client, requests = _scripted_client([httpx.ReadTimeout])
+    with pytest.raises(ConnectionError):
+        client._send("POST", "/scaffolder/v2/tasks", json_data={})
+    assert len(requests) == 1
+
+    # A request that failed to connect never reached Backstage
+    client, requests = _scripted_client([httpx.ConnectError, httpx.Response(201, json={})])
+    assert client._send("POST", "/scaffolder/v2/tasks", json_data={}).status_code == 201
+    assert len(requests) == 2
+
+
+@pytest.mark.parametrize("status_code", [429, 500, 503])
+def test_throttling_and_server_errors_open_the_circuit(sleeps, status_code):
+    client, requests = _scripted_client(
+        [httpx.Response(status_code)] * 2, MAX_RETRIES=0, circuit_breaker_threshold=2
+    )
+
+    client._send("GET", "/catalog/entities")
+    client._send("GET", "/catalog/entities")
+    with pytest.raises(CircuitOpenError):
+        client._send("GET", "/catalog/entities")
+    assert len(requests) == 2
+    assert client._get_circuit_breaker("GET", "/catalog/entities").state == CircuitBreaker.OPEN
+
+
+def test_client_errors_do_not_open_the_circuit(sleeps):
+    client, requests = _scripted_client(
+        [httpx.Response(500), httpx.Response(404), httpx.Response(500), httpx.Response(200, json={})],
+        MAX_RETRIES=0, circuit_breaker_threshold=2
+    )
+
+    statuses = [client._send("GET", "/catalog/entities").status_code for _ in range(4)]
+
+    assert statuses == [500, 404, 500, 200]
+    assert client._get_circuit_breaker("GET", "/catalog/entities").state == CircuitBreaker.CLOSED
+
+
+def test_half_open_circuit_closes_after_a_successful_trial(sleeps):
+    client, requests = _scripted_client(
+        [httpx.Response(503), httpx.Response(200, json={})],
+        MAX_RETRIES=0, circuit_breaker_threshold=1, circuit_breaker_reset_timeout=0.0
+    )
+
+    assert client._send("GET", "/catalog/entities").status_code == 503
+    breaker = client._get_circuit_breaker("GET", "/catalog/entities")
+    assert breaker.state == CircuitBreaker.OPEN
+
+    assert client._send("GET", "/catalog/entities").status_code == 200
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_async_requests_are_retried(monkeypatch):
+    delays = []
+
+    async def sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(client_module.asyncio, "sleep", sleep)
+    replies = [httpx.Response(504), httpx.Response(200, json={"ok": True})]
+
+    async def send():
+        client = BackstageClient(BackstageClientConfig(base_url="http://backstage.test/api", cache_enabled=False))
+        client._async_client = httpx.AsyncClient(
+            base_url=client.base_url, transport=httpx.MockTransport(lambda request: replies.pop(0))
+        )
+        try:
+            return await client._asend("GET", "/catalog/entities")
+        finally:
+            await client.aclose()
+
+    assert asyncio.run(send()).status_code == 200
+    assert len(delays) == 1
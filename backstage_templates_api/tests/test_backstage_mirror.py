@@ -0,0 +1,110 @@
+"""
+Tests for the Backstage catalog mirror.
+"""
+
+from typing import List, Optional
+
+import pytest
+
+from conftest import make_entity
+from template_plugin.clients.backstage.mirror import SYNC_FIELDS, CatalogMirror
+from template_plugin.utils.pagination_utils import decode_cursor
+
+
+@pytest.fixture
+def mirror(backstage_client):
+    mirror = CatalogMirror(backstage_client)
+    backstage_client._mirror = mirror
+    return mirror
+
+
+def _ref(name: str) -> str:
+    return f"template:default/{name}"
+
+
+def test_first_sync_fetches_every_template(mirror, catalog):
+    assert not mirror.ready
+
+    mirror.sync()
+
+    assert mirror.ready
+    assert len(mirror) == 5
+    assert catalog.ref_requests == [[_ref(name) for name in ("app-aws", "app-gcp", "db-aws", "db-aws-tf", "docs")]]
+    # Changes are detected from a listing of names and etags only
+    assert catalog.requests[0]["fields"] == [",".join(SYNC_FIELDS)]
+    assert mirror.get_template("default", "db-aws")["metadata"]["tags"] == ["aws", "database"]
+
+
+def test_unchanged_catalog_fetches_nothing(mirror, catalog):
+    mirror.sync()
+    entries = dict(mirror._entries)
+
+    mirror.sync()
+
+    assert len(catalog.ref_requests) == 1
+    assert all(mirror._entries[key] is entry for key, entry in entries.items())
+
+
+def test_delta_sync_fetches_only_changed_templates(mirror, catalog):
+    mirror.sync()
+    entries = dict(mirror._entries)
+    catalog.entities[2]["metadata"]["tags"] = ["aws", "postgres"]
+    catalog.entities.append(make_entity("queue-aws", ["aws", "queue"]))
+
+    mirror.sync()
+
+    assert catalog.ref_requests[-1] == [_ref("db-aws"), _ref("queue-aws")]
+    assert len(mirror) == 6
+    assert mirror.get_template("default", "db-aws")["metadata"]["tags"] == ["aws", "postgres"]
+    assert mirror.get_template("default", "queue-aws") is not None
+    # Unchanged templates keep their entries
+    for name in ("app-aws", "app-gcp", "db-aws-tf", "docs"):
+        assert mirror._entries[("default", name)] is entries[("default", name)]
+
+
+def test_deleted_templates_are_dropped(mirror, catalog):
+    mirror.sync()
+    del catalog.entities[0]
+
+    mirror.sync()
+
+    assert len(catalog.ref_requests) == 1
+    assert len(mirror) == 4
+    assert mirror.get_template("default", "app-aws") is None
+
+
+def test_refs_are_fetched_in_page_sized_chunks(mirror, catalog, backstage_client):
+    backstage_client.config.catalog_page_size = 2
+
+    mirror.sync()
+
+    assert [len(refs) for refs in catalog.ref_requests] == [2, 2, 1]
+    assert len(mirror) == 5
+
+
+def _pages(client, **kwargs) -> List[List[str]]:
+    """List every page, checking that each cursor comes from the in-memory listing."""
+    pages = []
+    cursor: Optional[str] = None
+    while True:
+        result = client.list_templates(cursor=cursor, **kwargs)
+        pages.append([template["metadata"]["name"] for template in result["items"]])
+        cursor = result["next_cursor"]
+        if cursor is None:
+            return pages
+        assert decode_cursor(cursor)["origin"] == "listing"
+
+
+def test_list_templates_switches_to_the_mirror_once_ready(mirror, catalog, backstage_client):
+    cursor = backstage_client.list_templates(limit=2, sort="-name")["next_cursor"]
+    assert decode_cursor(cursor)["origin"] == "catalog"
+
+    mirror.sync()
+    listed = len(catalog.requests)
+    result = backstage_client.list_templates(limit=2, sort="-name")
+
+    assert result["total_count"] == 5
+    assert _pages(backstage_client, limit=2, sort="-name") == [["docs", "db-aws-tf"], ["db-aws", "app-gcp"], ["app-aws"]]
+    assert _pages(backstage_client, limit=1, tags=["aws", "terraform"]) == [["app-aws"], ["db-aws-tf"]]
+    # Every page was served from the mirror
+    assert len(catalog.requests) == listed
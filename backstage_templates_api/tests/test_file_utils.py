@@ -0,0 +1,121 @@
+"""
+Tests for the file copy strategies.
+"""
+
+import errno
+import os
+
+import pytest
+
+from template_plugin.utils import file_utils
+from template_plugin.utils.file_utils import copy_file
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "source.txt"
+    path.write_bytes(b"content\n" * 1000)
+    os.chmod(path, 0o640)
+    os.utime(path, ns=(1_000_000_000, 2_000_000_000))
+    return str(path)
+
+
+@pytest.fixture
+def attempts(monkeypatch):
+    """Replace every strategy by a recorder failing with the errors queued per strategy."""
+    calls = []
+    failures = {"reflink": [], "hardlink": [], "copy_file_range": [], "sendfile": []}
+
+    def strategy(name, copy):
+        def run(*args):
+            calls.append(name)
+            if failures[name]:
+                code = failures[name].pop(0)
+                raise OSError(code, os.strerror(code))
+            return copy(*args)
+        return run
+
+    def copy_content(fsrc, fdst):
+        fdst.write(fsrc.read())
+
+    monkeypatch.setattr(file_utils, "_unsupported_copies", set())
+    monkeypatch.setattr(file_utils, "fcntl", object())
+    monkeypatch.setattr(file_utils, "_copy_reflink", strategy("reflink", copy_content))
+    monkeypatch.setattr(file_utils, "_copy_range", strategy("copy_file_range", copy_content))
+    monkeypatch.setattr(file_utils, "_copy_sendfile", strategy("sendfile", copy_content))
+    # The strategies are only offered where the platform has the system calls
+    for name in ("copy_file_range", "sendfile"):
+        if not hasattr(os, name):
+            monkeypatch.setattr(os, name, None, raising=False)
+    monkeypatch.setattr(file_utils.os, "link", strategy("hardlink", os.link))
+    return calls, failures
+
+
+def _assert_copied(source, destination):
+    with open(source, "rb") as f, open(destination, "rb") as g:
+        assert f.read() == g.read()
+    assert os.stat(destination).st_mode == os.stat(source).st_mode
+    assert os.stat(destination).st_mtime_ns == os.stat(source).st_mtime_ns
+
+
+def test_strategies_fall_back_in_order(source, tmp_path, attempts):
+    calls, failures = attempts
+    failures["reflink"].append(errno.EOPNOTSUPP)
+    failures["hardlink"].append(errno.EPERM)
+    failures["copy_file_range"].append(errno.EXDEV)
+    destination = str(tmp_path / "copy.txt")
+
+    assert copy_file(source, destination, hardlink=True) == "sendfile"
+    assert calls == ["reflink", "hardlink", "copy_file_range", "sendfile"]
+    _assert_copied(source, destination)
+
+
+def test_only_unsupported_filesystems_are_remembered(source, tmp_path, attempts):
+    calls, failures = attempts
+    failures["reflink"].append(errno.EOPNOTSUPP)
+    failures["copy_file_range"].append(errno.EINVAL)
+    copy_file(source, str(tmp_path / "first.txt"))
+
+    del calls[:]
+    # reflink stays disabled for these devices, copy_file_range is tried again
+    assert copy_file(source, str(tmp_path / "second.txt")) == "copy_file_range"
+    assert calls == ["copy_file_range"]
+
+
+def test_hardlink_is_retried_after_a_per_file_eperm(source, tmp_path, attempts):
+    calls, failures = attempts
+    failures["reflink"].append(errno.ENOTTY)
+    failures["hardlink"].append(errno.EPERM)
+
+    assert copy_file(source, str(tmp_path / "first.txt"), hardlink=True) == "copy_file_range"
+    destination = str(tmp_path / "second.txt")
+    assert copy_file(source, destination, hardlink=True) == "hardlink"
+    assert os.path.samefile(source, destination)
+
+
+def test_other_errors_are_raised(source, tmp_path, attempts):
+    calls, failures = attempts
+    failures["reflink"].append(errno.ENOSPC)
+
+    with pytest.raises(OSError) as raised:
+        copy_file(source, str(tmp_path / "copy.txt"))
+    assert raised.value.errno == errno.ENOSPC
+
+
+def test_copy2_is_the_last_resort(source, tmp_path, attempts):
+    calls, failures = attempts
+    failures["reflink"].append(errno.EOPNOTSUPP)
+    failures["copy_file_range"].append(errno.ENOSYS)
+    failures["sendfile"].append(errno.EINVAL)
+    destination = str(tmp_path / "copy.txt")
+
+    assert copy_file(source, destination) == "copy2"
+    assert calls == ["reflink", "copy_file_range", "sendfile"]
+    _assert_copied(source, destination)
+
+
+def test_copies_with_the_platform_strategies(source, tmp_path):
+    destination = str(tmp_path / "copy.txt")
+
+    assert copy_file(source, destination) in ("reflink", "copy_file_range", "sendfile", "copy2")
+    _assert_copied(source, destination)
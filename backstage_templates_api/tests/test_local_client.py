@@ -0,0 +1,81 @@
+"""
+Tests for the local template client.
+"""
+
+import io
+import os
+import zipfile
+from typing import List
+
+from conftest import write_template
+
+from template_plugin.clients.local import LocalClient
+from template_plugin.models.template_models import TemplateTask
+
+
+def _names(result) -> List[str]:
+    return [template["metadata"]["name"] for template in result["items"]]
+
+
+def test_snapshot_listing_with_store(tmp_path, templates_dir, local_config):
+    snapshot = str(tmp_path / "templates.snapshot")
+    builder = LocalClient(local_config)
+    expected = _names(builder.list_templates())
+    builder.write_snapshot(snapshot)
+    builder.close()
+
+    client = LocalClient(local_config.copy(update={
+        "snapshot_file": snapshot,
+        "index_db_path": str(tmp_path / "index.db")
+    }))
+    try:
+        # Served from the snapshot, with a store that was never synced
+        assert _names(client.list_templates()) == expected
+        assert _names(client.list_templates(tags=["aws"])) == [n for n in expected if int(n[-2:]) % 2]
+
+        # A change rebuilds the index, reusing unchanged templates from the snapshot
+        write_template(templates_dir, "tpl-00", ["gcp", "terraform"], title="Changed")
+        os.utime(os.path.join(templates_dir, "tpl-00", "template.yaml"), ns=(1, 1))
+        result = client.list_templates()
+        assert _names(result) == expected
+        assert result["items"][0]["metadata"]["title"] == "Changed"
+        assert result["total_count"] == len(expected)
+    finally:
+        client.close()
+
+
+def test_parse_pool_is_reused_until_close(templates_dir, local_config):
+    client = LocalClient(local_config.copy(update={"parse_workers": 2}))
+    try:
+        assert len(client.list_templates()["items"]) == 12
+        executor = client._index._parse_executor
+        assert executor is not None
+
+        write_template(templates_dir, "tpl-12", ["aws"])
+        write_template(templates_dir, "tpl-13", ["gcp"])
+        assert len(client.list_templates()["items"]) == 14
+        assert client._index._parse_executor is executor
+    finally:
+        client.close()
+    assert client._index._parse_executor is None
+
+
+def test_render_archive(templates_dir, local_config):
+    skeleton = os.path.join(templates_dir, "tpl-00", "skeleton")
+    os.makedirs(os.path.join(skeleton, "docs"))
+    with open(os.path.join(skeleton, "README.md.j2"), "w") as f:
+        f.write("# {{ name }}\n")
+    with open(os.path.join(skeleton, "docs", "index.md"), "w") as f:
+        f.write("Docs\n")
+
+    client = LocalClient(local_config)
+    try:
+        task = TemplateTask(template_name="tpl-00", parameters={"name": "my-app"})
+        data = b"".join(client.render_archive(task, "zip"))
+    finally:
+        client.close()
+
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        assert archive.testzip() is None
+        assert archive.read("README.md") == b"# my-app"
+        assert archive.read("docs/index.md") == b"Docs\n"
@@ -0,0 +1,105 @@
+"""
+Tests for the retry policy and circuit breaker.
+"""
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from template_plugin.utils import retry_utils
+from template_plugin.utils.retry_utils import CircuitBreaker, RetryPolicy, parse_retry_after
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(retry_utils.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_parse_retry_after():
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("-1") == 0.0
+    assert parse_retry_after("soon") is None
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+    assert 25 < parse_retry_after(format_datetime(retry_at, usegmt=True)) <= 30
+
+
+def test_only_idempotent_requests_are_retried():
+    policy = RetryPolicy(max_retries=2)
+
+    assert policy.should_retry("GET", 0)
+    assert policy.should_retry("get", 1)
+    assert not policy.should_retry("GET", 2)
+    assert not policy.should_retry("POST", 0)
+    assert policy.should_retry("POST", 0, idempotent=True)
+    assert not policy.should_retry("GET", 0, idempotent=False)
+    # The request never reached the server
+    assert policy.should_retry("POST", 0, connect_error=True)
+    assert not policy.should_retry("POST", 2, connect_error=True)
+
+
+def test_backoff_is_jittered_and_capped():
+    policy = RetryPolicy(backoff_base=1.0, backoff_max=5.0)
+
+    for attempt in range(6):
+        delay = policy.get_delay(attempt)
+        assert 0 <= delay <= min(5.0, 2 ** attempt)
+
+
+def test_retry_after_is_honored_up_to_backoff_max():
+    policy = RetryPolicy(backoff_max=5.0)
+
+    assert policy.get_delay(0, retry_after=4.0) == 4.0
+    assert policy.get_delay(3, retry_after=5.0) == 5.0
+    assert policy.get_delay(0, retry_after=5.1) is None
+
+
+def test_circuit_opens_after_consecutive_failures(clock):
+    breaker = CircuitBreaker("GET /catalog", failure_threshold=3, reset_timeout=10.0)
+
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow_request()
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow_request()
+    clock[0] += 9.9
+    assert not breaker.allow_request()
+
+
+def test_half_open_allows_a_single_trial(clock):
+    breaker = CircuitBreaker("GET /catalog", failure_threshold=1, reset_timeout=10.0)
+    breaker.record_failure()
+
+    clock[0] += 10.0
+    assert breaker.allow_request()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert not breaker.allow_request()
+
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow_request()
+
+
+def test_failed_trial_reopens_the_circuit(clock):
+    breaker = CircuitBreaker("GET /catalog", failure_threshold=3, reset_timeout=10.0)
+    for _ in range(3):
+        breaker.record_failure()
+
+    clock[0] += 10.0
+    assert breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow_request()
+
+    # The reset timeout restarts from the failed trial
+    clock[0] += 10.0
+    assert breaker.allow_request()
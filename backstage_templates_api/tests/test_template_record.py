@@ -0,0 +1,69 @@
+"""
+Tests for the compact template record.
+"""
+
+import pickle
+
+import pytest
+
+from template_plugin.clients.local.models import LocalTemplate
+from template_plugin.models.template_record import TemplateRecord
+
+DOCUMENTS = [
+    # Complete document, with fields outside the slots at every level
+    {
+        "apiVersion": "scaffolder.backstage.io/v1beta3",
+        "kind": "Template",
+        "metadata": {
+            "name": "app", "title": "App", "description": "An app", "tags": ["aws", "terraform"],
+            "cloud_provider": "aws", "annotations": {"backstage.io/techdocs-ref": "dir:."}
+        },
+        "spec": {
+            "owner": "team-a", "type": "service",
+            "parameters": [{"title": "Settings", "properties": {"name": {"type": "string"}}}],
+            "steps": [{"id": "fetch", "action": "fetch:template"}]
+        },
+        "status": {"ok": True}
+    },
+    # Missing fields
+    {},
+    {"metadata": {}},
+    {"metadata": {"name": "bare"}, "spec": {}},
+    {"kind": "Template", "spec": {"parameters": None}},
+    # Present fields set to None
+    {"apiVersion": None, "metadata": {"name": None, "tags": None, "title": None}, "spec": {"owner": None}},
+    # Odd-typed fields
+    {"metadata": ["not", "a", "mapping"], "spec": "not a mapping"},
+    {"metadata": {"name": 42, "tags": "aws", "title": ["A", "B"], "description": {"text": "x"}}},
+    {"metadata": {"tags": [1, None, "aws"]}, "spec": {"owner": {"group": "a"}, "type": 3, "parameters": {"a": 1}}},
+    {"metadata": {"tags": []}, "spec": {"parameters": []}}
+]
+
+
+@pytest.mark.parametrize("document", DOCUMENTS)
+def test_to_dict_round_trips(document):
+    record = TemplateRecord(document)
+
+    assert record.to_dict() == document
+    assert pickle.loads(pickle.dumps(record)).to_dict() == document
+
+
+def test_summary_omits_blob_fields():
+    summary = TemplateRecord(DOCUMENTS[0]).to_dict(full=False)
+
+    assert "parameters" not in summary["spec"]
+    assert "annotations" not in summary["metadata"]
+    assert summary["metadata"]["tags"] == ["aws", "terraform"]
+
+
+def test_rejects_non_mapping_documents():
+    with pytest.raises(TypeError):
+        TemplateRecord(["not", "a", "mapping"])
+
+
+def test_local_template_materializes_the_document_once():
+    template = LocalTemplate("/templates/app/template.yaml", DOCUMENTS[0])
+
+    assert template.yaml_data == DOCUMENTS[0]
+    assert template.yaml_data is template.yaml_data
+    assert LocalTemplate.from_record(template.path, template.record).yaml_data == DOCUMENTS[0]